@@ -0,0 +1,214 @@
+"""Cache of channels converted from slow source formats.
+
+Parsing MATLAB files with ``scipy.io.loadmat`` dominates ingest time for
+the .mat adapters. This cache stores the channels an adapter extracted
+from a source file as plain .npy arrays, plus the parsed file metadata,
+so later runs memory-map the arrays instead of parsing the file again.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .base_adapter import FaultType, SensorChannel, SeverityLevel
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry layout changes so old entries are rebuilt
+ARRAY_CACHE_VERSION = 1
+
+# Enums that may appear in parsed file metadata
+_ENUM_TYPES = {cls.__name__: cls for cls in (FaultType, SeverityLevel)}
+
+
+def _encode_info(value: Any) -> Any:
+    """Make parsed file metadata JSON-serializable (enums are tagged)."""
+    if isinstance(value, Enum):
+        return {"__enum__": type(value).__name__, "value": value.value}
+    if isinstance(value, dict):
+        return {key: _encode_info(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_info(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _decode_info(value: Any) -> Any:
+    """Inverse of ``_encode_info``."""
+    if isinstance(value, dict):
+        if "__enum__" in value:
+            return _ENUM_TYPES[value["__enum__"]](value["value"])
+        return {key: _decode_info(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode_info(item) for item in value]
+    return value
+
+
+class ConvertedArrayCache:
+    """Per-adapter store of extracted channels keyed by source file.
+
+    Each source file gets an entry directory with one .npy file per
+    channel and an ``index.json`` recording the source path, size and
+    modification time. An entry is used only while all three (and the
+    channel dtype) still match; otherwise the file is parsed again and
+    the entry is rewritten. Arrays are opened with ``mmap_mode="r"``, so
+    loading an entry reads no sample data until it is used. Entries are
+    uncompressed, so the cache grows to roughly the size of the parsed
+    channels; adapters only use it when asked to (``use_array_cache``).
+
+    Example:
+        cache = ConvertedArrayCache(adapter.cache_dir / "converted" / "cwru_bearing")
+        cached = cache.load(file_path, np.float64)
+        if cached is None:
+            channels, info = parse(file_path)
+            cache.save(file_path, channels, info)
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory holding the entries of one adapter
+        """
+        self.cache_dir = Path(cache_dir)
+        self._writable = True
+
+    def _entry_dir(self, file_path: Path) -> Path:
+        """Entry directory of a source file (stem plus a hash of its full path)."""
+        digest = hashlib.blake2b(
+            str(file_path.resolve()).encode(), digest_size=8
+        ).hexdigest()
+        return self.cache_dir / f"{file_path.stem}-{digest}"
+
+    def load(
+        self,
+        file_path: Path,
+        dtype: np.dtype,
+    ) -> Optional[Tuple[List[SensorChannel], Dict[str, Any]]]:
+        """Load the cached channels of a source file.
+
+        Args:
+            file_path: Source file
+            dtype: Expected channel sample dtype
+
+        Returns:
+            Tuple of (channels backed by memory-mapped arrays, file metadata),
+            or None if there is no valid entry
+        """
+        entry_dir = self._entry_dir(file_path)
+        index_path = entry_dir / "index.json"
+        if not index_path.exists():
+            return None
+
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+            st = file_path.stat()
+            if (
+                index.get("version") != ARRAY_CACHE_VERSION
+                or index.get("source_path") != str(file_path.resolve())
+                or index.get("size") != st.st_size
+                or index.get("mtime_ns") != st.st_mtime_ns
+                or index.get("dtype") != np.dtype(dtype).str
+            ):
+                return None
+
+            channels = []
+            for spec in index["channels"]:
+                # Plain ndarray view of the mapping (pickles like any array)
+                data = np.asarray(np.load(entry_dir / spec["file"], mmap_mode="r"))
+                channels.append(SensorChannel(
+                    channel_id=spec["channel_id"],
+                    channel_type=spec["channel_type"],
+                    unit=spec["unit"],
+                    data=data,
+                    sampling_rate_hz=spec["sampling_rate_hz"],
+                ))
+            return channels, _decode_info(index["info"])
+
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable array cache entry {entry_dir}: {e}")
+            return None
+
+    def save(
+        self,
+        file_path: Path,
+        channels: List[SensorChannel],
+        info: Dict[str, Any],
+    ) -> None:
+        """Store the channels and parsed metadata of a source file.
+
+        Failures (e.g. a read-only data directory) are logged once and
+        disable further writes; parsing still succeeds without the cache.
+
+        Args:
+            file_path: Source file
+            channels: Channels extracted from the file (all of one dtype)
+            info: Parsed file metadata
+        """
+        if not self._writable or not channels:
+            return
+
+        entry_dir = self._entry_dir(file_path)
+        try:
+            st = file_path.stat()
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_dir = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix=".tmp-"))
+            try:
+                specs = []
+                for i, ch in enumerate(channels):
+                    name = f"ch{i}.npy"
+                    np.save(tmp_dir / name, np.ascontiguousarray(ch.data))
+                    specs.append({
+                        "file": name,
+                        "channel_id": ch.channel_id,
+                        "channel_type": ch.channel_type,
+                        "unit": ch.unit,
+                        "sampling_rate_hz": float(ch.sampling_rate_hz),
+                    })
+
+                index = {
+                    "version": ARRAY_CACHE_VERSION,
+                    "source_path": str(file_path.resolve()),
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "dtype": np.asarray(channels[0].data).dtype.str,
+                    "channels": specs,
+                    "info": _encode_info(info),
+                }
+                with open(tmp_dir / "index.json", "w") as f:
+                    json.dump(index, f)
+
+                # Swap in the new entry; a stale one is removed first
+                if entry_dir.exists():
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                try:
+                    os.replace(tmp_dir, entry_dir)
+                except OSError:
+                    if not entry_dir.exists():
+                        raise
+                    # Another process rebuilt the same entry first; keep it
+                    shutil.rmtree(tmp_dir, ignore_errors=True)
+            except BaseException:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise
+
+        except OSError as e:
+            logger.warning(f"Array cache disabled, cannot write to {self.cache_dir}: {e}")
+            self._writable = False
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Cannot cache converted arrays of {file_path}: {e}")
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
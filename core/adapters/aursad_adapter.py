@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
@@ -60,6 +60,116 @@ AURSAD_CHANNELS = [
     "screwdriver_angle",
 ]
 
+# Channels extracted from the pandas HDFStore file (subset for efficiency)
+AURSAD_EXTRACT_CHANNELS = [
+    "actual_q_0", "actual_q_1", "actual_q_2",
+    "actual_q_3", "actual_q_4", "actual_q_5",
+    "actual_qd_0", "actual_qd_1", "actual_qd_2",
+    "actual_qd_3", "actual_qd_4", "actual_qd_5",
+    "actual_current_0", "actual_current_1", "actual_current_2",
+    "actual_current_3", "actual_current_4", "actual_current_5",
+    "actual_TCP_pose_0", "actual_TCP_pose_1", "actual_TCP_pose_2",
+    "actual_TCP_force_0", "actual_TCP_force_1", "actual_TCP_force_2",
+]
+
+
+def _group_rows(
+    keys: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Group row positions by key with a single stable sort.
+
+    Rows of the i-th unique key are ``order[starts[i]:starts[i] + counts[i]]``,
+    in ascending row order.
+
+    Args:
+        keys: Per-row group key (e.g. sample_nr)
+
+    Returns:
+        Tuple of (order, unique_keys, starts, counts)
+    """
+    order = np.argsort(keys, kind="stable")
+    unique_keys, starts, counts = np.unique(
+        keys[order], return_index=True, return_counts=True
+    )
+    return order, unique_keys, starts, counts
+
+
+def _as_slice(row_indices: np.ndarray) -> slice | np.ndarray:
+    """Return a slice if the row positions form one ascending run."""
+    if len(row_indices) and row_indices[-1] - row_indices[0] + 1 == len(row_indices):
+        return slice(int(row_indices[0]), int(row_indices[-1]) + 1)
+    return row_indices
+
+
+class _BlockColumnReader:
+    """Reads selected columns of a 2-D HDF5 dataset by row range.
+
+    Rows are fetched through an h5py hyperslab selection of the requested
+    columns only, one span aligned to the dataset's chunk rows at a time.
+    Consecutive samples usually fall into the span already in memory, so
+    each chunk is read once and memory stays at roughly one span.
+    """
+
+    # Span length for datasets stored without chunking
+    UNCHUNKED_SPAN_BYTES = 4 * 1024 * 1024
+
+    def __init__(self, dataset: Any, col_indices: List[int], preload: bool = False):
+        """Initialize reader.
+
+        Args:
+            dataset: h5py Dataset of shape (rows, columns)
+            col_indices: Columns to read, in output order
+            preload: Read all rows of the columns immediately
+        """
+        self.dataset = dataset
+        self.num_rows = dataset.shape[0]
+
+        # h5py needs increasing column indices; reorder after reading
+        self._sorted_cols = sorted(set(col_indices))
+        positions = {col: i for i, col in enumerate(self._sorted_cols)}
+        self._output_order = np.array([positions[col] for col in col_indices])
+
+        if dataset.chunks:
+            self.span_rows = dataset.chunks[0]
+        else:
+            row_bytes = dataset.dtype.itemsize * max(1, dataset.shape[1])
+            self.span_rows = max(1, self.UNCHUNKED_SPAN_BYTES // row_bytes)
+
+        self._start = 0
+        self._stop = 0
+        self._buffer: Optional[np.ndarray] = None
+        if preload:
+            self._load(0, self.num_rows)
+
+    def _load(self, start: int, stop: int) -> None:
+        """Read rows [start, stop) of the selected columns."""
+        values = self.dataset[start:stop, self._sorted_cols]
+        self._buffer = values[:, self._output_order]
+        self._start = start
+        self._stop = stop
+
+    def read_rows(self, row_indices: np.ndarray) -> np.ndarray:
+        """Read the selected columns of the given ascending row positions.
+
+        Args:
+            row_indices: Ascending row positions
+
+        Returns:
+            Array of shape (len(row_indices), len(col_indices))
+        """
+        first = int(row_indices[0])
+        last = int(row_indices[-1]) + 1
+
+        if self._buffer is None or first < self._start or last > self._stop:
+            span_start = first // self.span_rows * self.span_rows
+            span_stop = min(self.num_rows, -(-last // self.span_rows) * self.span_rows)
+            self._load(span_start, span_stop)
+
+        rows = _as_slice(row_indices)
+        if isinstance(rows, slice):
+            return self._buffer[rows.start - self._start:rows.stop - self._start]
+        return self._buffer[row_indices - self._start]
+
 
 @register_adapter("aursad", aliases=["ur3e_screwdriver", "aursad_ur3e"])
 class AURSADAdapter(BaseDatasetAdapter):
@@ -117,6 +227,7 @@ class AURSADAdapter(BaseDatasetAdapter):
         data_dir: str | Path,
         cache_dir: Optional[str | Path] = None,
         include_supplementary: bool = False,
+        lazy_reads: bool = True,
     ):
         """Initialize AURSAD adapter.
 
@@ -124,9 +235,13 @@ class AURSADAdapter(BaseDatasetAdapter):
             data_dir: Directory containing AURSAD.h5 file
             cache_dir: Optional cache directory
             include_supplementary: Include loosening/picking samples
+            lazy_reads: Read HDFStore value blocks per sample, one
+                chunk-aligned row span of the needed columns at a time,
+                instead of loading every block before the first episode
         """
         super().__init__(data_dir, cache_dir)
         self.include_supplementary = include_supplementary
+        self.lazy_reads = lazy_reads
         self._h5_file = None
         self._data_cache = None
 
@@ -264,6 +379,9 @@ class AURSADAdapter(BaseDatasetAdapter):
         """Parse pandas HDFStore format AURSAD data.
 
         Groups time series data by sample_nr and creates one episode per sample.
+        With ``lazy_reads`` the value blocks are read per sample through
+        ``_BlockColumnReader``, so peak memory scales with one sample (one
+        chunk-aligned span) and the first episode is yielded immediately.
 
         Args:
             data: Dictionary with metadata from _load_pandas_hdfstore
@@ -280,47 +398,38 @@ class AURSADAdapter(BaseDatasetAdapter):
         labels = data["labels"]
         sample_nrs = data["sample_nrs"]
         block_mapping = data["block_mapping"]
-        columns = data["columns"]
 
         if sample_nrs is None:
             logger.warning("No sample_nr column found, cannot segment episodes")
             return
 
-        # Find unique samples
-        unique_samples = np.unique(sample_nrs)
+        # One sort gives every sample a contiguous run of row positions
+        order, unique_samples, starts, counts = _group_rows(sample_nrs)
         logger.info(f"Found {len(unique_samples)} unique samples in AURSAD data")
 
-        # Define channels to extract (subset of available columns for efficiency)
-        channels_to_extract = [
-            "actual_q_0", "actual_q_1", "actual_q_2",
-            "actual_q_3", "actual_q_4", "actual_q_5",
-            "actual_qd_0", "actual_qd_1", "actual_qd_2",
-            "actual_qd_3", "actual_qd_4", "actual_qd_5",
-            "actual_current_0", "actual_current_1", "actual_current_2",
-            "actual_current_3", "actual_current_4", "actual_current_5",
-            "actual_TCP_pose_0", "actual_TCP_pose_1", "actual_TCP_pose_2",
-            "actual_TCP_force_0", "actual_TCP_force_1", "actual_TCP_force_2",
-        ]
+        # Requested channels grouped by value block, in extraction order
+        block_columns: Dict[str, List[Tuple[str, int]]] = {}
+        for col in AURSAD_EXTRACT_CHANNELS:
+            if col in block_mapping:
+                block_key, col_idx = block_mapping[col]
+                block_columns.setdefault(block_key, []).append((col, col_idx))
 
         # Open file for reading block values
         with h5py.File(str(file_path), "r") as f:
             group = f["complete_data"]
 
-            # Cache block data
-            block_cache = {}
-            for col in channels_to_extract:
-                if col in block_mapping:
-                    block_key, _ = block_mapping[col]
-                    if block_key not in block_cache:
-                        block_cache[block_key] = group[block_key][:]
+            # Readers of the needed columns; eager mode loads them up front
+            readers = {
+                block_key: _BlockColumnReader(
+                    group[block_key],
+                    [col_idx for _, col_idx in cols],
+                    preload=not self.lazy_reads,
+                )
+                for block_key, cols in block_columns.items()
+            }
 
-            for sample_nr in unique_samples:
-                # Get row indices for this sample
-                mask = sample_nrs == sample_nr
-                row_indices = np.where(mask)[0]
-
-                if len(row_indices) == 0:
-                    continue
+            for sample_nr, start, count in zip(unique_samples, starts, counts):
+                row_indices = order[start:start + count]
 
                 # Get label for this sample (use mode/most common)
                 sample_labels = labels[row_indices]
@@ -330,63 +439,91 @@ class AURSADAdapter(BaseDatasetAdapter):
                 if not self.include_supplementary and label > 4:
                     continue
 
-                # Extract channel data
-                channels = []
-                for col in channels_to_extract:
-                    if col not in block_mapping:
-                        continue
-
-                    block_key, col_idx = block_mapping[col]
-                    if block_key not in block_cache:
-                        continue
-
-                    channel_data = block_cache[block_key][row_indices, col_idx]
-
-                    # Determine unit
-                    if "current" in col:
-                        unit = "A"
-                    elif "force" in col:
-                        unit = "N"
-                    elif "_q_" in col:
-                        unit = "rad"
-                    elif "qd_" in col:
-                        unit = "rad/s"
-                    elif "pose" in col:
-                        unit = "m"
-                    else:
-                        unit = ""
-
-                    channels.append(SensorChannel(
-                        channel_id=f"sample{int(sample_nr)}_{col}",
-                        channel_type=col,
-                        unit=unit,
-                        data=channel_data.astype(np.float64).tolist(),
-                        sampling_rate_hz=AURSAD_SAMPLING_RATE,
-                    ))
-
-                # Get fault info from label
-                label_info = AURSAD_LABELS.get(label, ("unknown", FaultType.UNKNOWN, SeverityLevel.MINOR))
-                fault_name, fault_type, severity = label_info
-
-                yield RawEpisode(
-                    raw_id=f"aursad_{int(sample_nr):05d}",
-                    source_dataset="aursad",
-                    source_file=file_path.name,
-                    channels=channels,
-                    fault_type=fault_type,
-                    fault_location="screwdriving_operation",
-                    severity=severity,
-                    raw_metadata={
-                        "label": label,
-                        "label_name": fault_name,
-                        "sample_nr": int(sample_nr),
-                        "num_timesteps": len(row_indices),
-                        "robot_model": "UR3e",
-                        "end_effector": "OnRobot Screwdriver",
-                        "sampling_rate_hz": AURSAD_SAMPLING_RATE,
-                    },
+                # The transposed copy makes each channel a contiguous row
+                block_arrays: Dict[str, np.ndarray] = {}
+                for block_key, cols in block_columns.items():
+                    values = readers[block_key].read_rows(row_indices)
+                    values = np.ascontiguousarray(values.T, dtype=self.channel_dtype)
+                    for (col, _), channel_data in zip(cols, values):
+                        block_arrays[col] = channel_data
+
+                # Channel order follows AURSAD_EXTRACT_CHANNELS, not block layout
+                channel_arrays = {
+                    col: block_arrays[col]
+                    for col in AURSAD_EXTRACT_CHANNELS if col in block_arrays
+                }
+
+                yield self._create_hdfstore_episode(
+                    sample_nr, label, channel_arrays, len(row_indices), file_path
                 )
 
+    def _create_hdfstore_episode(
+        self,
+        sample_nr: Any,
+        label: int,
+        channel_arrays: Dict[str, np.ndarray],
+        num_timesteps: int,
+        file_path: Path,
+    ) -> RawEpisode:
+        """Create a RawEpisode from the channel arrays of one HDFStore sample.
+
+        Args:
+            sample_nr: Sample number
+            label: Majority label of the sample's rows
+            channel_arrays: Channel name -> samples, in extraction order
+            num_timesteps: Number of rows of the sample
+            file_path: Path to HDF5 file
+
+        Returns:
+            RawEpisode object
+        """
+        channels = []
+        for col, channel_data in channel_arrays.items():
+            # Determine unit
+            if "current" in col:
+                unit = "A"
+            elif "force" in col:
+                unit = "N"
+            elif "_q_" in col:
+                unit = "rad"
+            elif "qd_" in col:
+                unit = "rad/s"
+            elif "pose" in col:
+                unit = "m"
+            else:
+                unit = ""
+
+            channels.append(SensorChannel(
+                channel_id=f"sample{int(sample_nr)}_{col}",
+                channel_type=col,
+                unit=unit,
+                data=channel_data,
+                sampling_rate_hz=AURSAD_SAMPLING_RATE,
+            ))
+
+        # Get fault info from label
+        label_info = AURSAD_LABELS.get(label, ("unknown", FaultType.UNKNOWN, SeverityLevel.MINOR))
+        fault_name, fault_type, severity = label_info
+
+        return RawEpisode(
+            raw_id=f"aursad_{int(sample_nr):05d}",
+            source_dataset="aursad",
+            source_file=file_path.name,
+            channels=channels,
+            fault_type=fault_type,
+            fault_location="screwdriving_operation",
+            severity=severity,
+            raw_metadata={
+                "label": label,
+                "label_name": fault_name,
+                "sample_nr": int(sample_nr),
+                "num_timesteps": num_timesteps,
+                "robot_model": "UR3e",
+                "end_effector": "OnRobot Screwdriver",
+                "sampling_rate_hz": AURSAD_SAMPLING_RATE,
+            },
+        )
+
     def _parse_structured_data(
         self,
         data: Dict[str, Any],
@@ -468,7 +605,7 @@ class AURSADAdapter(BaseDatasetAdapter):
             # Map features to channel names
             for feat_idx in range(min(num_features, len(AURSAD_CHANNELS))):
                 channel_name = AURSAD_CHANNELS[feat_idx]
-                channel_data = sample[:, feat_idx].astype(np.float64)
+                channel_data = self.to_channel_array(sample[:, feat_idx])
 
                 # Determine unit based on channel type
                 if "current" in channel_name:
@@ -490,7 +627,7 @@ class AURSADAdapter(BaseDatasetAdapter):
                     channel_id=f"sample{sample_idx}_{channel_name}",
                     channel_type=channel_name,
                     unit=unit,
-                    data=channel_data.tolist(),
+                    data=channel_data,
                     sampling_rate_hz=AURSAD_SAMPLING_RATE,
                 ))
 
@@ -530,7 +667,7 @@ class AURSADAdapter(BaseDatasetAdapter):
             if len(channel_data) == 0:
                 continue
 
-            data_flat = channel_data.flatten().astype(np.float64)
+            data_flat = self.to_channel_array(channel_data)
 
             # Determine unit
             if "current" in channel_name.lower():
@@ -546,7 +683,7 @@ class AURSADAdapter(BaseDatasetAdapter):
                 channel_id=f"sample{sample_idx}_{channel_name}",
                 channel_type=channel_name,
                 unit=unit,
-                data=data_flat.tolist(),
+                data=data_flat,
                 sampling_rate_hz=AURSAD_SAMPLING_RATE,
             ))
 
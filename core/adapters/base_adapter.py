@@ -6,12 +6,36 @@ datasets to the FactoryNet schema.
 from __future__ import annotations
 
 import hashlib
+import logging
+import os
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from core.hashing import format_digest, new_hasher, update_with_array
+
+logger = logging.getLogger(__name__)
+
+# Modes accepted by RawEpisode.compute_checksum
+CHECKSUM_MODES = ("sample", "full")
+
+# Sample dtypes adapters can produce for SensorChannel.data
+CHANNEL_DTYPES = ("float32", "float64")
 
 
 class FaultType(Enum):
@@ -37,17 +61,46 @@ class SeverityLevel(Enum):
     CRITICAL = "critical"
 
 
+def segment_windows(
+    data: np.ndarray,
+    segment_length: int,
+    step: int,
+) -> np.ndarray:
+    """Split a signal into fixed-length segments without copying.
+
+    Returns a read-only strided view of shape (num_segments, segment_length)
+    over ``data``, so overlapping segments share the parent buffer and cost
+    no memory beyond the source array.
+
+    Args:
+        data: 1-D signal
+        segment_length: Samples per segment
+        step: Samples between segment starts (segment_length for no overlap)
+
+    Returns:
+        Segment matrix (empty if the signal is shorter than one segment)
+    """
+    data = np.asarray(data)
+    if step < 1:
+        raise ValueError(f"Segment step must be positive, got {step}")
+    if len(data) < segment_length:
+        return np.empty((0, segment_length), dtype=data.dtype)
+    return np.lib.stride_tricks.sliding_window_view(data, segment_length)[::step]
+
+
 @dataclass
 class SensorChannel:
     """Represents a single sensor channel of time series data."""
     channel_id: str
     channel_type: str  # e.g., "vibration_x", "vibration_y", "temperature"
     unit: str  # e.g., "g", "mm/s", "°C"
-    data: Sequence[float]  # Time series values
+    data: np.ndarray  # 1-D float32/float64 samples (may be a view into a shared buffer)
     sampling_rate_hz: float
 
     def __post_init__(self):
         """Validate sensor channel data."""
+        if not isinstance(self.data, np.ndarray):
+            self.data = np.asarray(self.data, dtype=np.float64)
         if len(self.data) == 0:
             raise ValueError(f"Channel {self.channel_id} has no data")
         if self.sampling_rate_hz <= 0:
@@ -86,6 +139,9 @@ class RawEpisode:
     # Additional metadata from source
     raw_metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Source file path relative to the adapter data_dir (set by iter_episodes)
+    source_path: Optional[str] = None
+
     def __post_init__(self):
         """Compute derived fields."""
         if self.channels and self.duration_seconds == 0.0:
@@ -103,17 +159,49 @@ class RawEpisode:
         """Total number of samples across all channels."""
         return sum(len(ch.data) for ch in self.channels)
 
-    def compute_checksum(self) -> str:
-        """Compute MD5 checksum of episode data for deduplication."""
+    def compute_checksum(self, mode: str = "sample") -> str:
+        """Compute a checksum of episode data for change detection and deduplication.
+
+        Args:
+            mode: 'sample' hashes the dataset, raw ID and the first/last 100
+                values of each channel (MD5 over their string form), 'full'
+                returns ``content_digest``
+
+        Returns:
+            Hex digest
+        """
+        if mode == "full":
+            return self.content_digest()
+        if mode != "sample":
+            raise ValueError(
+                f"Unknown checksum mode: {mode}. Available: {', '.join(CHECKSUM_MODES)}"
+            )
+
         hasher = hashlib.md5()
         hasher.update(self.source_dataset.encode())
         hasher.update(self.raw_id.encode())
         for ch in self.channels:
             # Hash first/last 100 values for efficiency
-            data_sample = list(ch.data[:100]) + list(ch.data[-100:])
+            data_sample = ch.data[:100].tolist() + ch.data[-100:].tolist()
             hasher.update(str(data_sample).encode())
         return hasher.hexdigest()
 
+    def content_digest(self) -> str:
+        """Digest of the full sensor data, independent of IDs and file names.
+
+        Hashes the raw bytes of every sample of every channel together with
+        its channel type and sampling rate, so two episodes share a digest
+        exactly when they carry identical recordings.
+
+        Returns:
+            Hex digest prefixed with the hash algorithm (see core.hashing)
+        """
+        hasher = new_hasher()
+        for ch in self.channels:
+            hasher.update(f"{ch.channel_type}|{float(ch.sampling_rate_hz)!r}|".encode())
+            update_with_array(hasher, ch.data)
+        return format_digest(hasher)
+
 
 @dataclass
 class DatasetMetadata:
@@ -157,8 +245,16 @@ class BaseDatasetAdapter(ABC):
         for episode in adapter.iter_episodes():
             # Process episode
             pass
+
+    Channel samples are always NumPy arrays of ``channel_dtype``; adapters
+    build them with ``to_channel_array`` and never box samples as Python
+    floats. Use float32 to halve memory when the data is only stored, and
+    float64 (the default) when full precision is needed downstream.
     """
 
+    # Sample dtype of SensorChannel.data (see CHANNEL_DTYPES)
+    channel_dtype: np.dtype = np.dtype(np.float64)
+
     def __init__(
         self,
         data_dir: str | Path,
@@ -173,6 +269,33 @@ class BaseDatasetAdapter(ABC):
         self.data_dir = Path(data_dir)
         self.cache_dir = Path(cache_dir) if cache_dir else self.data_dir / ".cache"
 
+    def set_channel_dtype(self, dtype: str | np.dtype) -> None:
+        """Set the sample dtype of the channels this adapter produces.
+
+        Args:
+            dtype: 'float32' or 'float64'
+        """
+        dtype = np.dtype(dtype)
+        if dtype.name not in CHANNEL_DTYPES:
+            raise ValueError(
+                f"Unsupported channel dtype: {dtype}. Available: {', '.join(CHANNEL_DTYPES)}"
+            )
+        self.channel_dtype = dtype
+
+    def to_channel_array(self, values: Any) -> np.ndarray:
+        """Convert samples to a contiguous 1-D array of ``channel_dtype``.
+
+        Arrays that already have the right dtype and layout are returned
+        as-is (or as a view), so no copy is made.
+
+        Args:
+            values: Array-like samples
+
+        Returns:
+            1-D ndarray
+        """
+        return np.ascontiguousarray(values, dtype=self.channel_dtype).reshape(-1)
+
     @property
     @abstractmethod
     def metadata(self) -> DatasetMetadata:
@@ -206,12 +329,17 @@ class BaseDatasetAdapter(ABC):
         self,
         limit: Optional[int] = None,
         file_filter: Optional[callable] = None,
+        on_file_complete: Optional[Callable[[Path, int], None]] = None,
     ) -> Iterable[RawEpisode]:
         """Iterate over all episodes in the dataset.
 
         Args:
             limit: Maximum number of episodes to yield (for demo mode)
             file_filter: Optional function to filter files
+            on_file_complete: Optional callback invoked with (file_path,
+                num_episodes) once every episode of a file has been yielded.
+                Not called for files that fail to parse or are cut short
+                by ``limit``.
 
         Yields:
             RawEpisode objects
@@ -223,17 +351,183 @@ class BaseDatasetAdapter(ABC):
         count = 0
         for file_path in files:
             try:
+                file_count = 0
+                source_path = self.relative_source_path(file_path)
                 for episode in self.parse_file(file_path):
+                    if episode.source_path is None:
+                        episode.source_path = source_path
                     yield episode
                     count += 1
+                    file_count += 1
                     if limit and count >= limit:
                         return
+                if on_file_complete:
+                    on_file_complete(file_path, file_count)
             except Exception as e:
                 # Log error but continue with other files
-                import logging
-                logging.warning(f"Error parsing {file_path}: {e}")
+                logger.warning(f"Error parsing {file_path}: {e}")
                 continue
 
+    def parallel_iter_episodes(
+        self,
+        num_workers: int = 0,
+        ordered: bool = True,
+        limit: Optional[int] = None,
+        file_filter: Optional[Callable[[Path], bool]] = None,
+        on_file_complete: Optional[Callable[[Path, int], None]] = None,
+        use_threads: bool = False,
+        prefetch_files: Optional[int] = None,
+    ) -> Iterator[RawEpisode]:
+        """Iterate over all episodes, parsing files in a worker pool.
+
+        Each file is parsed by ``parse_file`` in a worker; its episodes are
+        yielded in the calling process as the file finishes. At most
+        ``prefetch_files`` files are parsed or waiting at any time, which
+        bounds memory when the consumer is slower than the parsers.
+        ``limit``, ``file_filter``, ``on_file_complete`` and per-file error
+        handling behave as in ``iter_episodes``. A file whose worker dies or
+        whose episodes cannot be sent back is logged and skipped like a
+        parse error, without ``on_file_complete``.
+
+        Args:
+            num_workers: Number of workers (0 uses one per CPU core; 1
+                falls back to ``iter_episodes``)
+            ordered: Yield files in discovery order (deterministic output);
+                if False, files are yielded in completion order
+            limit: Maximum number of episodes to yield
+            file_filter: Optional function to filter files
+            on_file_complete: Optional callback invoked with (file_path,
+                num_episodes) once every episode of a file has been yielded
+            use_threads: Use a thread pool instead of a process pool (for
+                parsers that release the GIL, e.g. pyarrow or h5py reads)
+            prefetch_files: Maximum files in flight (default: 2 per worker)
+
+        Yields:
+            RawEpisode objects
+        """
+        if num_workers <= 0:
+            num_workers = os.cpu_count() or 1
+        if num_workers == 1:
+            yield from self.iter_episodes(
+                limit=limit,
+                file_filter=file_filter,
+                on_file_complete=on_file_complete,
+            )
+            return
+
+        files = self.discover_files()
+        if file_filter:
+            files = [f for f in files if file_filter(f)]
+        if not files:
+            return
+
+        max_in_flight = max(1, prefetch_files or 2 * num_workers)
+        executor_cls = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        pool_size = min(num_workers, len(files))
+        executor: Executor = executor_cls(max_workers=pool_size)
+
+        pending: Deque[Tuple[Path, Future]] = deque()
+        remaining = iter(files)
+        # Files in flight when a worker died are re-parsed one at a time, so
+        # a file that kills its worker again is the one reported as failed
+        retry: Deque[Path] = deque()
+        suspects: Set[Path] = set()
+
+        def recover(first: Optional[Path] = None) -> None:
+            """Replace a broken pool and re-queue the files it lost."""
+            nonlocal executor
+            # Unordered: keep files that finished before the pool broke
+            lost = [first] if first is not None else []
+            lost += [
+                path for path, f in pending
+                if ordered or not f.done() or f.exception() is not None
+            ]
+            kept = [(path, f) for path, f in pending if path not in lost]
+            pending.clear()
+            pending.extend(kept)
+            retry.extendleft(reversed(lost))
+            suspects.update(lost)
+            executor.shutdown(wait=False)
+            executor = executor_cls(max_workers=pool_size)
+
+        def fill() -> None:
+            while True:
+                serial = retry or any(path in suspects for path, _ in pending)
+                if len(pending) >= (1 if serial else max_in_flight):
+                    return
+                file_path = retry.popleft() if retry else next(remaining, None)
+                if file_path is None:
+                    return
+                try:
+                    future = executor.submit(_parse_file_in_worker, self, file_path)
+                except BrokenExecutor:
+                    # A worker died after its file's result was collected
+                    retry.appendleft(file_path)
+                    recover()
+                    continue
+                pending.append((file_path, future))
+
+        count = 0
+        try:
+            fill()
+            while pending:
+                if ordered:
+                    file_path, future = pending.popleft()
+                else:
+                    done, _ = wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                    index = next(i for i, (_, f) in enumerate(pending) if f in done)
+                    file_path, future = pending[index]
+                    del pending[index]
+
+                try:
+                    episodes, error = future.result()
+                except BrokenExecutor as e:
+                    if file_path not in suspects:
+                        recover(first=file_path)
+                        fill()
+                        continue
+                    episodes, error = [], e
+                    recover()
+                except Exception as e:
+                    # The file's episodes could not be sent back (e.g. not
+                    # picklable); it stays incomplete in the manifest
+                    episodes, error = [], e
+                suspects.discard(file_path)
+                fill()
+
+                source_path = self.relative_source_path(file_path)
+                for episode in episodes:
+                    if episode.source_path is None:
+                        episode.source_path = source_path
+                    yield episode
+                    count += 1
+                    if limit and count >= limit:
+                        return
+
+                if error is not None:
+                    # Log error but continue with other files
+                    logger.warning(f"Error parsing {file_path}: {error}")
+                elif on_file_complete:
+                    on_file_complete(file_path, len(episodes))
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def relative_source_path(self, file_path: Path) -> str:
+        """Get a stable identifier for a source file.
+
+        Args:
+            file_path: Path to a data file
+
+        Returns:
+            POSIX path relative to data_dir (or the full path if outside it)
+        """
+        try:
+            return file_path.relative_to(self.data_dir).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
     def get_download_urls(self) -> List[str]:
         """Return URLs for downloading the dataset.
 
@@ -258,3 +552,22 @@ class BaseDatasetAdapter(ABC):
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(data_dir={self.data_dir})"
+
+
+def _parse_file_in_worker(
+    adapter: BaseDatasetAdapter,
+    file_path: Path,
+) -> Tuple[List[RawEpisode], Optional[str]]:
+    """Pool entry point: parse one file completely.
+
+    Returns:
+        Tuple of (episodes parsed, error message if parsing raised); the
+        episodes yielded before an error are kept, as in ``iter_episodes``
+    """
+    episodes: List[RawEpisode] = []
+    try:
+        for episode in adapter.parse_file(file_path):
+            episodes.append(episode)
+    except Exception as e:
+        return episodes, str(e)
+    return episodes, None
@@ -14,6 +14,7 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
+from .array_cache import ConvertedArrayCache
 from .base_adapter import (
     BaseDatasetAdapter,
     DatasetMetadata,
@@ -21,6 +22,7 @@ from .base_adapter import (
     RawEpisode,
     SensorChannel,
     SeverityLevel,
+    segment_windows,
 )
 from .registry import register_adapter
 
@@ -201,6 +203,7 @@ class CWRUAdapter(BaseDatasetAdapter):
         cache_dir: Optional[str | Path] = None,
         segment_length: Optional[int] = None,
         segment_overlap: float = 0.0,
+        use_array_cache: bool = False,
     ):
         """Initialize CWRU adapter.
 
@@ -209,10 +212,18 @@ class CWRUAdapter(BaseDatasetAdapter):
             cache_dir: Optional cache directory
             segment_length: If set, segment signals into fixed-length episodes
             segment_overlap: Overlap ratio between segments (0.0-0.5)
+            use_array_cache: Keep converted channels under cache_dir and
+                memory-map them on later runs instead of calling loadmat.
+                Costs an uncompressed copy of every parsed channel on disk
+                (in data_dir/.cache unless cache_dir is set)
         """
         super().__init__(data_dir, cache_dir)
         self.segment_length = segment_length
         self.segment_overlap = segment_overlap
+        self.array_cache = (
+            ConvertedArrayCache(self.cache_dir / "converted" / self.METADATA.name)
+            if use_array_cache else None
+        )
 
     @property
     def metadata(self) -> DatasetMetadata:
@@ -238,6 +249,45 @@ class CWRUAdapter(BaseDatasetAdapter):
         Yields:
             RawEpisode objects
         """
+        converted = self._load_channels(file_path)
+        if converted is None:
+            return
+        channels, file_info = converted
+
+        if not channels:
+            logger.warning(f"No valid channels found in {file_path}")
+            return
+
+        # Create episode(s)
+        if self.segment_length:
+            # Segment into multiple episodes
+            yield from self._create_segmented_episodes(
+                channels, file_info, file_path
+            )
+        else:
+            # Single episode per file
+            yield self._create_episode(channels, file_info, file_path)
+
+    def _load_channels(
+        self,
+        file_path: Path,
+    ) -> Optional[Tuple[List[SensorChannel], Dict[str, Any]]]:
+        """Load the channels and filename metadata of a .mat file.
+
+        Uses the converted-array cache when it holds an up-to-date entry,
+        otherwise parses the file with ``loadmat`` and fills the cache.
+
+        Args:
+            file_path: Path to .mat file
+
+        Returns:
+            Tuple of (channels, file_info), or None if the file cannot be read
+        """
+        if self.array_cache is not None:
+            cached = self.array_cache.load(file_path, self.channel_dtype)
+            if cached is not None:
+                return cached
+
         try:
             from scipy.io import loadmat
         except ImportError:
@@ -248,7 +298,7 @@ class CWRUAdapter(BaseDatasetAdapter):
             mat_data = loadmat(str(file_path), squeeze_me=True)
         except Exception as e:
             logger.error(f"Failed to load {file_path}: {e}")
-            return
+            return None
 
         # Parse filename for metadata
         file_info = self._parse_filename(file_path)
@@ -256,19 +306,9 @@ class CWRUAdapter(BaseDatasetAdapter):
         # Extract vibration channels from .mat file
         channels = self._extract_channels(mat_data, file_info)
 
-        if not channels:
-            logger.warning(f"No valid channels found in {file_path}")
-            return
-
-        # Create episode(s)
-        if self.segment_length:
-            # Segment into multiple episodes
-            yield from self._create_segmented_episodes(
-                channels, file_info, file_path
-            )
-        else:
-            # Single episode per file
-            yield self._create_episode(channels, file_info, file_path)
+        if self.array_cache is not None:
+            self.array_cache.save(file_path, channels, file_info)
+        return channels, file_info
 
     def _parse_filename(self, file_path: Path) -> Dict[str, Any]:
         """Parse CWRU filename to extract metadata.
@@ -368,15 +408,15 @@ class CWRUAdapter(BaseDatasetAdapter):
 
             data = mat_data[key]
             if isinstance(data, np.ndarray):
-                # Flatten if needed
-                data = data.flatten().astype(np.float64)
+                # Flatten if needed (copies only when dtype or layout differ)
+                data = self.to_channel_array(data)
 
                 if len(data) > 100:  # Minimum viable length
                     channels.append(SensorChannel(
                         channel_id=f"{file_info.get('file_num', 0)}_{location}",
                         channel_type=channel_type,
                         unit="g",  # Acceleration in g
-                        data=data.tolist(),
+                        data=data,
                         sampling_rate_hz=sampling_rate,
                     ))
 
@@ -441,6 +481,12 @@ class CWRUAdapter(BaseDatasetAdapter):
     ) -> Iterable[RawEpisode]:
         """Create multiple episodes by segmenting the signal.
 
+        Segments are strided views into each channel's array, so
+        overlapping windows share the parent buffer instead of copying it.
+        Only windows that every channel covers are emitted; if a channel is
+        shorter than the first one, the trailing segments are dropped with
+        a warning.
+
         Args:
             channels: List of sensor channels
             file_info: Parsed file metadata
@@ -452,25 +498,35 @@ class CWRUAdapter(BaseDatasetAdapter):
         if not channels:
             return
 
-        # Use first channel for segmentation reference
-        ref_channel = channels[0]
-        signal_length = len(ref_channel.data)
-
-        step_size = int(self.segment_length * (1 - self.segment_overlap))
-        segment_idx = 0
+        step_size = max(1, int(self.segment_length * (1 - self.segment_overlap)))
+
+        # Segment all channels to the length of the first (reference) channel
+        signal_length = len(channels[0].data)
+        windows = [
+            segment_windows(ch.data[:signal_length], self.segment_length, step_size)
+            for ch in channels
+        ]
+        num_segments = min(len(w) for w in windows)
+        if num_segments < len(windows[0]):
+            # Only windows covered by every channel become episodes
+            logger.warning(
+                f"{file_path.name}: channels shorter than {channels[0].channel_type}, "
+                f"dropping the last {len(windows[0]) - num_segments} of "
+                f"{len(windows[0])} segments"
+            )
 
-        for start in range(0, signal_length - self.segment_length + 1, step_size):
+        for segment_idx in range(num_segments):
+            start = segment_idx * step_size
             end = start + self.segment_length
 
             # Create segmented channels
             seg_channels = []
-            for ch in channels:
-                seg_data = ch.data[start:end]
+            for ch, ch_windows in zip(channels, windows):
                 seg_channels.append(SensorChannel(
                     channel_id=f"{ch.channel_id}_seg{segment_idx}",
                     channel_type=ch.channel_type,
                     unit=ch.unit,
-                    data=seg_data,
+                    data=ch_windows[segment_idx],
                     sampling_rate_hz=ch.sampling_rate_hz,
                 ))
 
@@ -482,7 +538,6 @@ class CWRUAdapter(BaseDatasetAdapter):
             base_episode.raw_metadata["segment_end_sample"] = end
 
             yield base_episode
-            segment_idx += 1
 
     def verify_integrity(self) -> bool:
         """Verify dataset integrity."""
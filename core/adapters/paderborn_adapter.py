@@ -11,10 +11,11 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
+from .array_cache import ConvertedArrayCache
 from .base_adapter import (
     BaseDatasetAdapter,
     DatasetMetadata,
@@ -134,6 +135,7 @@ class PaderbornAdapter(BaseDatasetAdapter):
         data_dir: str | Path,
         cache_dir: Optional[str | Path] = None,
         segment_length: Optional[int] = None,
+        use_array_cache: bool = False,
     ):
         """Initialize Paderborn adapter.
 
@@ -141,9 +143,17 @@ class PaderbornAdapter(BaseDatasetAdapter):
             data_dir: Directory containing .mat files
             cache_dir: Optional cache directory
             segment_length: If set, segment signals into fixed-length episodes
+            use_array_cache: Keep converted channels under cache_dir and
+                memory-map them on later runs instead of calling loadmat.
+                Costs an uncompressed copy of every parsed channel on disk
+                (in data_dir/.cache unless cache_dir is set)
         """
         super().__init__(data_dir, cache_dir)
         self.segment_length = segment_length
+        self.array_cache = (
+            ConvertedArrayCache(self.cache_dir / "converted" / self.METADATA.name)
+            if use_array_cache else None
+        )
 
     @property
     def metadata(self) -> DatasetMetadata:
@@ -165,6 +175,38 @@ class PaderbornAdapter(BaseDatasetAdapter):
         Yields:
             RawEpisode objects
         """
+        converted = self._load_channels(file_path)
+        if converted is None:
+            return
+        channels, file_info = converted
+
+        if not channels:
+            logger.warning(f"No valid channels in {file_path}")
+            return
+
+        # Create episode
+        yield self._create_episode(channels, file_info, file_path)
+
+    def _load_channels(
+        self,
+        file_path: Path,
+    ) -> Optional[Tuple[List[SensorChannel], Dict[str, Any]]]:
+        """Load the channels and filename metadata of a .mat file.
+
+        Uses the converted-array cache when it holds an up-to-date entry,
+        otherwise parses the MATLAB struct and fills the cache.
+
+        Args:
+            file_path: Path to .mat file
+
+        Returns:
+            Tuple of (channels, file_info), or None if the file cannot be read
+        """
+        if self.array_cache is not None:
+            cached = self.array_cache.load(file_path, self.channel_dtype)
+            if cached is not None:
+                return cached
+
         try:
             from scipy.io import loadmat
         except ImportError:
@@ -175,7 +217,7 @@ class PaderbornAdapter(BaseDatasetAdapter):
             mat_data = loadmat(str(file_path), squeeze_me=False, struct_as_record=True)
         except Exception as e:
             logger.error(f"Failed to load {file_path}: {e}")
-            return
+            return None
 
         # Parse filename for metadata
         file_info = self._parse_filename(file_path)
@@ -183,12 +225,9 @@ class PaderbornAdapter(BaseDatasetAdapter):
         # Extract channels
         channels = self._extract_channels(mat_data, file_info)
 
-        if not channels:
-            logger.warning(f"No valid channels in {file_path}")
-            return
-
-        # Create episode
-        yield self._create_episode(channels, file_info, file_path)
+        if self.array_cache is not None:
+            self.array_cache.save(file_path, channels, file_info)
+        return channels, file_info
 
     def _parse_filename(self, file_path: Path) -> Dict[str, Any]:
         """Parse Paderborn filename for metadata.
@@ -324,7 +363,7 @@ class PaderbornAdapter(BaseDatasetAdapter):
                 if not isinstance(data_field, np.ndarray):
                     continue
 
-                data = data_field.flatten().astype(np.float64)
+                data = self.to_channel_array(data_field)
                 if len(data) < 100:
                     continue
 
@@ -340,7 +379,7 @@ class PaderbornAdapter(BaseDatasetAdapter):
                     channel_id=f"{file_info['bearing_code']}_{mat_name}",
                     channel_type=channel_type,
                     unit=unit,
-                    data=data.tolist(),
+                    data=data,
                     sampling_rate_hz=sample_rate,
                 ))
 
@@ -22,6 +22,7 @@ from .base_adapter import (
     SensorChannel,
     SeverityLevel,
 )
+from .csv_reader import read_numeric_csv
 from .registry import register_adapter
 
 logger = logging.getLogger(__name__)
@@ -160,9 +161,9 @@ class PHM2010Adapter(BaseDatasetAdapter):
         try:
             # Try different delimiters
             try:
-                data = np.loadtxt(str(file_path), delimiter=",")
+                data = read_numeric_csv(file_path, delimiter=",", dtype=self.channel_dtype)
             except ValueError:
-                data = np.loadtxt(str(file_path), delimiter="\t")
+                data = read_numeric_csv(file_path, delimiter="\t", dtype=self.channel_dtype)
         except Exception as e:
             logger.error(f"Failed to load {file_path}: {e}")
             return
@@ -289,12 +290,12 @@ class PHM2010Adapter(BaseDatasetAdapter):
 
         for channel_type, unit, col_idx in channel_defs:
             if col_idx < num_cols:
-                col_data = data[:, col_idx].astype(np.float64)
+                col_data = self.to_channel_array(data[:, col_idx])
                 channels.append(SensorChannel(
                     channel_id=f"cut{cut_num}_{channel_type}",
                     channel_type=channel_type,
                     unit=unit,
-                    data=col_data.tolist(),
+                    data=col_data,
                     sampling_rate_hz=PHM2010_SAMPLING_RATE,
                 ))
 
@@ -211,6 +211,10 @@ class PHM2021SCARAAdapter(BaseDatasetAdapter):
         if data is None or len(data) == 0:
             return
 
+        # One conversion, column-major so that every channel (and every
+        # segment of it) is a contiguous view into this buffer
+        data = np.asarray(data, dtype=self.channel_dtype, order="F")
+
         # Create episodes
         if self.segment_duration_s:
             yield from self._create_segmented_episodes(
@@ -292,7 +296,7 @@ class PHM2021SCARAAdapter(BaseDatasetAdapter):
             if col_idx == time_col_idx:
                 continue
 
-            col_data = data[:, col_idx].astype(np.float64)
+            col_data = self.to_channel_array(data[:, col_idx])
 
             # Skip if all NaN
             if np.all(np.isnan(col_data)):
@@ -308,7 +312,7 @@ class PHM2021SCARAAdapter(BaseDatasetAdapter):
                 channel_id=f"{exp_id}_{col_name}",
                 channel_type=col_name,
                 unit=unit,
-                data=col_data.tolist(),
+                data=col_data,
                 sampling_rate_hz=PHM2021_SAMPLING_RATE,
             ))
 
@@ -344,7 +348,10 @@ class PHM2021SCARAAdapter(BaseDatasetAdapter):
         file_path: Path,
         exp_id: str,
     ) -> Iterable[RawEpisode]:
-        """Create segmented episodes from long experiment."""
+        """Create segmented episodes from long experiment.
+
+        Segments are row slices of ``data``, i.e. views that share its buffer.
+        """
         samples_per_segment = int(self.segment_duration_s * PHM2021_SAMPLING_RATE)
         total_samples = len(data)
 
@@ -216,7 +216,7 @@ class UR3ePickPlaceAdapter(BaseDatasetAdapter):
         channels = []
 
         for col in numeric_cols:
-            data = df[col].values.astype(np.float64)
+            data = self.to_channel_array(df[col].values)
 
             # Determine unit based on column name
             col_lower = col.lower()
@@ -237,7 +237,7 @@ class UR3ePickPlaceAdapter(BaseDatasetAdapter):
                 channel_id=f"ep{episode_idx}_{col}",
                 channel_type=col,
                 unit=unit,
-                data=data.tolist(),
+                data=data,
                 sampling_rate_hz=UR3E_PP_SAMPLING_RATE,
             ))
 
@@ -290,7 +290,7 @@ class UR3ePickPlaceAdapter(BaseDatasetAdapter):
                     channel_id=f"ep{episode_idx}_channel{col_idx}",
                     channel_type=f"sensor_{col_idx}",
                     unit="",
-                    data=data[:, col_idx].astype(np.float64).tolist(),
+                    data=self.to_channel_array(data[:, col_idx]),
                     sampling_rate_hz=UR3E_PP_SAMPLING_RATE,
                 ))
 
@@ -346,7 +346,7 @@ class UR3ePickPlaceAdapter(BaseDatasetAdapter):
                     channel_id=f"sample{sample_idx}_ch{col_idx}",
                     channel_type=f"sensor_{col_idx}",
                     unit="",
-                    data=sample[:, col_idx].astype(np.float64).tolist(),
+                    data=self.to_channel_array(sample[:, col_idx]),
                     sampling_rate_hz=UR3E_PP_SAMPLING_RATE,
                 ))
 
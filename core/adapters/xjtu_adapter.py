@@ -23,6 +23,7 @@ from .base_adapter import (
     SensorChannel,
     SeverityLevel,
 )
+from .csv_reader import read_numeric_csv
 from .registry import register_adapter
 
 logger = logging.getLogger(__name__)
@@ -164,7 +165,7 @@ class XJTUAdapter(BaseDatasetAdapter):
         """
         try:
             # XJTU CSV format: horizontal_accel, vertical_accel
-            data = np.loadtxt(str(file_path), delimiter=",")
+            data = read_numeric_csv(file_path, delimiter=",", dtype=self.channel_dtype)
         except Exception as e:
             logger.error(f"Failed to load {file_path}: {e}")
             return
@@ -311,7 +312,7 @@ class XJTUAdapter(BaseDatasetAdapter):
                 channel_id=f"{bearing_id}_horizontal",
                 channel_type="vibration_horizontal",
                 unit="g",
-                data=data[:, 0].astype(np.float64).tolist(),
+                data=self.to_channel_array(data[:, 0]),
                 sampling_rate_hz=XJTU_SAMPLING_RATE,
             ))
 
@@ -321,7 +322,7 @@ class XJTUAdapter(BaseDatasetAdapter):
                 channel_id=f"{bearing_id}_vertical",
                 channel_type="vibration_vertical",
                 unit="g",
-                data=data[:, 1].astype(np.float64).tolist(),
+                data=self.to_channel_array(data[:, 1]),
                 sampling_rate_hz=XJTU_SAMPLING_RATE,
             ))
 
@@ -0,0 +1,281 @@
+"""SQLite catalog of saved FactoryNet episodes.
+
+Keeps one row of summary fields per saved episode so that listing,
+statistics and filtered queries do not need to walk episode directories
+or parse metadata files.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    dataset TEXT NOT NULL,
+    episode_id TEXT NOT NULL,
+    state_synset TEXT,
+    state_label TEXT,
+    severity REAL,
+    rpm REAL,
+    load_hp REAL,
+    num_samples INTEGER,
+    num_channels INTEGER,
+    byte_size INTEGER,
+    path TEXT,
+    PRIMARY KEY (dataset, episode_id)
+);
+CREATE INDEX IF NOT EXISTS idx_episodes_state ON episodes (dataset, state_synset);
+CREATE INDEX IF NOT EXISTS idx_episodes_rpm ON episodes (dataset, rpm);
+"""
+
+CATALOG_COLUMNS = (
+    "dataset",
+    "episode_id",
+    "state_synset",
+    "state_label",
+    "severity",
+    "rpm",
+    "load_hp",
+    "num_samples",
+    "num_channels",
+    "byte_size",
+    "path",
+)
+
+
+@dataclass
+class CatalogEntry:
+    """Catalog row describing one saved episode."""
+    dataset: str
+    episode_id: str
+    state_synset: Optional[str]
+    state_label: Optional[str]
+    severity: Optional[float]
+    rpm: Optional[float]
+    load_hp: Optional[float]
+    num_samples: int
+    num_channels: int
+    byte_size: int
+    path: str  # Relative to the storage base directory
+
+    @classmethod
+    def from_metadata(
+        cls,
+        metadata: Dict[str, Any],
+        byte_size: int,
+        path: str,
+    ) -> CatalogEntry:
+        """Build an entry from an episode's metadata.json dictionary.
+
+        Args:
+            metadata: Output of ``FactoryNetEpisode.to_metadata_dict``
+            byte_size: Size of the stored episode in bytes
+            path: Storage path relative to the base directory
+
+        Returns:
+            Catalog entry
+        """
+        state = metadata.get("state_annotation") or {}
+        return cls(
+            dataset=metadata["source_dataset"],
+            episode_id=metadata["episode_id"],
+            state_synset=state.get("state_synset"),
+            state_label=state.get("state_label"),
+            severity=state.get("severity"),
+            rpm=metadata.get("rpm"),
+            load_hp=metadata.get("load_hp"),
+            num_samples=int(metadata.get("num_timesteps") or 0),
+            num_channels=len(metadata.get("channel_names") or []),
+            byte_size=byte_size,
+            path=path,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {column: getattr(self, column) for column in CATALOG_COLUMNS}
+
+
+class EpisodeCatalog:
+    """Index of saved episodes backed by a SQLite database.
+
+    Each upsert is committed in its own short transaction, and the
+    database runs in WAL mode, so several pipeline worker processes can
+    update it concurrently while readers see every saved episode.
+
+    Example:
+        catalog = EpisodeCatalog("./factorynet_data/catalog.sqlite")
+        entries = catalog.query(
+            dataset="cwru_bearing",
+            state_synset="S.flt.mec.wea.bea.out",
+            rpm=1797,
+        )
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize catalog.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Connection for the current process (reopened after fork)."""
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=60.0)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(CATALOG_SCHEMA)
+            self._pid = os.getpid()
+        return self._conn
+
+    def upsert(self, entry: CatalogEntry) -> None:
+        """Insert or replace the row of an episode.
+
+        Args:
+            entry: Catalog entry to store
+        """
+        self.upsert_many([entry])
+
+    def upsert_many(self, entries: Iterable[CatalogEntry]) -> None:
+        """Insert or replace several rows in one transaction.
+
+        Args:
+            entries: Catalog entries to store
+        """
+        placeholders = ", ".join("?" for _ in CATALOG_COLUMNS)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO episodes ({', '.join(CATALOG_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                [tuple(getattr(entry, column) for column in CATALOG_COLUMNS)
+                 for entry in entries],
+            )
+
+    def close(self) -> None:
+        """Close the connection of the current process."""
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+    def clear(self, dataset: Optional[str] = None) -> None:
+        """Remove all rows, or all rows of one dataset."""
+        with self.conn:
+            if dataset:
+                self.conn.execute("DELETE FROM episodes WHERE dataset = ?", (dataset,))
+            else:
+                self.conn.execute("DELETE FROM episodes")
+
+    def count(self, dataset: Optional[str] = None) -> int:
+        """Number of cataloged episodes."""
+        if dataset:
+            row = self.conn.execute(
+                "SELECT COUNT(*) FROM episodes WHERE dataset = ?", (dataset,)
+            ).fetchone()
+        else:
+            row = self.conn.execute("SELECT COUNT(*) FROM episodes").fetchone()
+        return int(row[0])
+
+    def list_datasets(self) -> List[str]:
+        """Names of datasets with at least one cataloged episode."""
+        rows = self.conn.execute(
+            "SELECT DISTINCT dataset FROM episodes ORDER BY dataset"
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def list_paths(self, dataset: Optional[str] = None) -> List[str]:
+        """Storage paths of cataloged episodes, sorted."""
+        if dataset:
+            rows = self.conn.execute(
+                "SELECT path FROM episodes WHERE dataset = ? ORDER BY path", (dataset,)
+            ).fetchall()
+        else:
+            rows = self.conn.execute("SELECT path FROM episodes ORDER BY path").fetchall()
+        return [row[0] for row in rows]
+
+    def query(
+        self,
+        dataset: Optional[str] = None,
+        state_synset: Optional[str] = None,
+        rpm: Optional[float] = None,
+        load_hp: Optional[float] = None,
+        min_severity: Optional[float] = None,
+        max_severity: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[CatalogEntry]:
+        """Find episodes matching all given filters.
+
+        Args:
+            dataset: Dataset name
+            state_synset: State synset or synset prefix (e.g. "S.flt.mec.wea.bea")
+            rpm: Exact rotational speed
+            load_hp: Exact motor load
+            min_severity: Minimum severity (inclusive)
+            max_severity: Maximum severity (inclusive)
+            limit: Maximum number of rows to return
+
+        Returns:
+            Matching catalog entries, ordered by dataset and episode ID
+        """
+        clauses = []
+        params: List[Any] = []
+
+        if dataset is not None:
+            clauses.append("dataset = ?")
+            params.append(dataset)
+        if state_synset is not None:
+            clauses.append("(state_synset = ? OR state_synset LIKE ?)")
+            params.extend([state_synset, f"{state_synset}.%"])
+        if rpm is not None:
+            clauses.append("rpm = ?")
+            params.append(rpm)
+        if load_hp is not None:
+            clauses.append("load_hp = ?")
+            params.append(load_hp)
+        if min_severity is not None:
+            clauses.append("severity >= ?")
+            params.append(min_severity)
+        if max_severity is not None:
+            clauses.append("severity <= ?")
+            params.append(max_severity)
+
+        sql = f"SELECT {', '.join(CATALOG_COLUMNS)} FROM episodes"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY dataset, episode_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [CatalogEntry(*row) for row in self.conn.execute(sql, params)]
+
+    def dataset_stats(self, dataset: str) -> Dict[str, Any]:
+        """Aggregate episode count, size and label distribution of a dataset."""
+        num_episodes, total_size = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(byte_size), 0) FROM episodes WHERE dataset = ?",
+            (dataset,),
+        ).fetchone()
+
+        fault_counts: Dict[str, int] = {}
+        for label, count in self.conn.execute(
+            "SELECT COALESCE(state_label, 'unknown'), COUNT(*) FROM episodes "
+            "WHERE dataset = ? GROUP BY 1",
+            (dataset,),
+        ):
+            fault_counts[label] = count
+
+        return {
+            "num_episodes": int(num_episodes),
+            "total_size_bytes": int(total_size),
+            "fault_distribution": fault_counts,
+        }
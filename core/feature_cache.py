@@ -0,0 +1,244 @@
+"""On-disk cache of extracted vibration features.
+
+Entries are addressed by a digest of the channel samples, the rpm and the
+``VibrationFeatureExtractor`` settings, so a rerun over unchanged data with
+unchanged settings reuses the stored features instead of recomputing FFTs,
+and any change to the data or the extractor simply misses.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.feature_extraction import (
+    SCALAR_FEATURE_NAMES,
+    VibrationFeatureExtractor,
+    VibrationFeatures,
+)
+from core.hashing import array_digest
+
+logger = logging.getLogger(__name__)
+
+# Bump when feature definitions change so stale entries stop matching
+FEATURE_CACHE_VERSION = 1
+
+# After eviction the cache is trimmed to this fraction of its size limit
+_EVICTION_TARGET = 0.9
+
+
+def signal_digest(data: Any) -> str:
+    """Digest of the full contents of a signal.
+
+    Args:
+        data: Signal samples (array-like)
+
+    Returns:
+        Digest of the raw sample bytes, dtype and shape, prefixed with the
+        hash algorithm
+    """
+    return array_digest(data)
+
+
+class FeatureCache:
+    """Size-bounded, content-addressed store of ``VibrationFeatures``.
+
+    Each entry is a small .npz file named after its key. Reading an entry
+    refreshes its modification time, and when the total size exceeds
+    ``max_bytes`` the least recently used entries are deleted. Writes go
+    through a temporary file and an atomic rename, so pipeline worker
+    processes can share one cache directory.
+
+    Example:
+        cache = FeatureCache("./factorynet_data/feature_cache", max_bytes=2**30)
+        key = cache.make_key(signal_digest(signal), rpm, extractor)
+        features = cache.get(key)
+        if features is None:
+            features = extractor.extract(signal, rpm=rpm)
+            cache.put(key, features)
+    """
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int = 1024 * 1024 * 1024):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_bytes: Total size above which old entries are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._total_bytes: Optional[int] = None
+
+    @staticmethod
+    def make_key(
+        digest: str,
+        rpm: Optional[float],
+        extractor: VibrationFeatureExtractor,
+    ) -> str:
+        """Build the cache key of one channel.
+
+        Args:
+            digest: ``signal_digest`` of the channel samples
+            rpm: Rotational speed passed to the extractor
+            extractor: Extractor that computes the features
+
+        Returns:
+            Hex cache key
+        """
+        payload = json.dumps(
+            {
+                "version": FEATURE_CACHE_VERSION,
+                "signal": digest,
+                "rpm": None if rpm is None else float(rpm),
+                "extractor": extractor.config_key(),
+            },
+            sort_keys=True,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Path of an entry (two-level fan-out keeps directories small)."""
+        return self.cache_dir / key[:2] / f"{key}.npz"
+
+    def get(self, key: str) -> Optional[VibrationFeatures]:
+        """Load cached features.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            Cached features, or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            with np.load(path) as entry:
+                names = [str(name) for name in entry["names"]]
+                scalars = entry["scalars"]
+                fft_frequencies = entry["fft_frequencies"]
+                fft_magnitudes = entry["fft_magnitudes"]
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable feature cache entry {path}: {e}")
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        values = {
+            name: float(value)
+            for name, value in zip(names, scalars)
+            if name in SCALAR_FEATURE_NAMES
+        }
+        return VibrationFeatures(
+            **values,
+            fft_frequencies=fft_frequencies,
+            fft_magnitudes=fft_magnitudes,
+        )
+
+    def put(self, key: str, features: VibrationFeatures) -> None:
+        """Store features and evict old entries if the cache is full.
+
+        Args:
+            key: Cache key from ``make_key``
+            features: Features to store
+        """
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        scalars = features.to_dict()
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    names=np.array(list(scalars)),
+                    scalars=np.array(list(scalars.values()), dtype=np.float64),
+                    fft_frequencies=np.asarray(features.fft_frequencies),
+                    fft_magnitudes=np.asarray(features.fft_magnitudes),
+                )
+            os.replace(tmp_name, path)
+        except Exception:
+            self._remove(Path(tmp_name))
+            raise
+
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._scan())
+        else:
+            self._total_bytes += path.stat().st_size
+
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def _scan(self) -> List[Tuple[float, int, Path]]:
+        """List (mtime, size, path) of all entries."""
+        entries = []
+        if not self.cache_dir.exists():
+            return entries
+        for path in self.cache_dir.glob("*/*.npz"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        """Delete a file that another process may already have removed."""
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Delete least recently used entries until the cache fits.
+
+        Args:
+            max_bytes: Size limit (default: the cache's ``max_bytes``)
+
+        Returns:
+            Number of entries deleted
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._scan())
+        total = sum(size for _, size, _ in entries)
+        target = min(limit, int(limit * _EVICTION_TARGET))
+
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+
+        self._total_bytes = total
+        if removed:
+            logger.debug(f"Evicted {removed} feature cache entries from {self.cache_dir}")
+        return removed
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        self.evict(max_bytes=0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, total size and hit/miss counters of this instance."""
+        entries = self._scan()
+        return {
+            "num_entries": len(entries),
+            "total_size_bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
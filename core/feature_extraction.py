@@ -6,8 +6,9 @@ bearing fault detection and machinery condition monitoring.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from collections import OrderedDict
+from dataclasses import astuple, dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -42,6 +43,15 @@ class VibrationFeatures:
     bsf_amplitude: float = 0.0   # Ball Spin Frequency
     ftf_amplitude: float = 0.0   # Fundamental Train Frequency
 
+    # Envelope spectrum amplitudes at bearing fault frequencies
+    envelope_bpfo_amplitude: float = 0.0
+    envelope_bpfi_amplitude: float = 0.0
+    envelope_bsf_amplitude: float = 0.0
+
+    # Demodulation band picked by the kurtogram (if used)
+    envelope_band_center_hz: float = 0.0
+    envelope_band_kurtosis: float = 0.0
+
     # FFT data for storage
     fft_frequencies: np.ndarray = field(default_factory=lambda: np.array([]))
     fft_magnitudes: np.ndarray = field(default_factory=lambda: np.array([]))
@@ -68,10 +78,66 @@ class VibrationFeatures:
             "bpfi_amplitude": self.bpfi_amplitude,
             "bsf_amplitude": self.bsf_amplitude,
             "ftf_amplitude": self.ftf_amplitude,
+            "envelope_bpfo_amplitude": self.envelope_bpfo_amplitude,
+            "envelope_bpfi_amplitude": self.envelope_bpfi_amplitude,
+            "envelope_bsf_amplitude": self.envelope_bsf_amplitude,
+            "envelope_band_center_hz": self.envelope_band_center_hz,
+            "envelope_band_kurtosis": self.envelope_band_kurtosis,
         }
         return result
 
 
+# Scalar features, in the order of VibrationFeatures.to_dict()
+SCALAR_FEATURE_NAMES: Tuple[str, ...] = tuple(VibrationFeatures().to_dict())
+
+# Scalar features that need no FFT
+TIME_FEATURE_NAMES: Tuple[str, ...] = SCALAR_FEATURE_NAMES[
+    :SCALAR_FEATURE_NAMES.index("dominant_frequency_hz")
+]
+
+
+@dataclass
+class VibrationFeatureBatch:
+    """Features of a stack of signals as a structure of arrays.
+
+    Each scalar feature is a float64 array with one entry per signal; all
+    signals share one frequency axis.
+    """
+    values: Dict[str, np.ndarray]  # feature name -> (n_signals,)
+    fft_frequencies: np.ndarray  # (n_bins,)
+    fft_magnitudes: np.ndarray  # (n_signals, n_bins)
+
+    @classmethod
+    def empty(cls, n_signals: int) -> VibrationFeatureBatch:
+        """Create a batch with all features zero and no spectrum."""
+        return cls(
+            values={name: np.zeros(n_signals) for name in SCALAR_FEATURE_NAMES},
+            fft_frequencies=np.array([]),
+            fft_magnitudes=np.empty((n_signals, 0)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.fft_magnitudes)
+
+    def __getitem__(self, index: int) -> VibrationFeatures:
+        """Get the features of one signal as a VibrationFeatures."""
+        features = VibrationFeatures(
+            **{name: float(column[index]) for name, column in self.values.items()}
+        )
+        if self.fft_magnitudes.shape[1]:
+            features.fft_frequencies = self.fft_frequencies
+            features.fft_magnitudes = self.fft_magnitudes[index]
+        return features
+
+    def to_features(self) -> List[VibrationFeatures]:
+        """Convert to one VibrationFeatures per signal."""
+        return [self[i] for i in range(len(self))]
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Get the scalar feature arrays keyed by feature name."""
+        return dict(self.values)
+
+
 @dataclass
 class BearingGeometry:
     """Bearing geometry parameters for fault frequency calculation."""
@@ -134,16 +200,107 @@ BEARING_GEOMETRIES = {
 }
 
 
+@dataclass(frozen=True)
+class SpectralPlan:
+    """Precomputed FFT setup for one (length, window, nfft, fs) combination.
+
+    Arrays are read-only because plans are shared between extractors.
+    """
+    window: np.ndarray  # (n,)
+    frequencies: np.ndarray  # rfftfreq(nfft, 1/fs)
+    frequencies_sq: np.ndarray  # frequencies ** 2, for spectral spread
+
+
+class SpectralPlanCache:
+    """Bounded LRU cache for FFT windows, frequency axes and bin tables.
+
+    Segment length and sampling rate rarely change within a dataset, so
+    extractors look up their setup arrays here instead of rebuilding them
+    for every signal. The least recently used entry is evicted once
+    ``maxsize`` entries are stored.
+
+    Example:
+        cache = SpectralPlanCache(maxsize=16)
+        extractor = VibrationFeatureExtractor(12000, plan_cache=cache)
+    """
+
+    def __init__(self, maxsize: int = 64):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached entries
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Get a cached entry, creating it with ``factory`` on a miss.
+
+        Args:
+            key: Hashable cache key
+            factory: Builds the entry if it is not cached
+
+        Returns:
+            Cached entry
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = factory()
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries and reset hit counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Fault frequencies measured on the envelope spectrum
+ENVELOPE_FAULT_NAMES = ("bpfo", "bpfi", "bsf")
+
+# Downsampling policies for the stored spectrum
+SPECTRUM_POLICIES = ("band_max", "log", "truncate")
+
+# Shared by all extractors that are not given their own cache
+DEFAULT_PLAN_CACHE = SpectralPlanCache()
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    """Mark an array read-only and return it."""
+    array.setflags(write=False)
+    return array
+
+
 class VibrationFeatureExtractor:
     """Extract features from vibration signals for fault detection.
 
     Computes time-domain, frequency-domain, and bearing-specific features
-    from raw vibration signals.
+    from raw vibration signals. All computations run along the last axis
+    of an (n_signals, n_samples) matrix, so ``extract_matrix`` handles a
+    stack of equal-length segments with one FFT call and ``extract`` is
+    the single-row case.
 
     Example:
         extractor = VibrationFeatureExtractor(sampling_rate_hz=12000)
         features = extractor.extract(signal_data)
         print(f"RMS: {features.rms}, Kurtosis: {features.kurtosis}")
+
+        batch = extractor.extract_matrix(segments)  # (n_segments, n_samples)
+        print(batch.values["kurtosis"])
     """
 
     def __init__(
@@ -152,6 +309,11 @@ class VibrationFeatureExtractor:
         bearing_geometry: Optional[BearingGeometry] = None,
         fft_window: str = "hann",
         fft_size: Optional[int] = None,
+        plan_cache: Optional[SpectralPlanCache] = None,
+        spectrum_bins: int = 1000,
+        spectrum_policy: str = "band_max",
+        envelope_analysis: bool = False,
+        envelope_band_hz: Optional[Tuple[float, float] | str] = None,
     ):
         """Initialize feature extractor.
 
@@ -160,11 +322,83 @@ class VibrationFeatureExtractor:
             bearing_geometry: Optional bearing parameters for fault frequencies
             fft_window: Window function for FFT ('hann', 'hamming', 'rectangular')
             fft_size: FFT size (default: next power of 2)
+            plan_cache: Cache for FFT setup arrays (default: shared module cache)
+            spectrum_bins: Number of points kept in the stored spectrum
+            spectrum_policy: How the stored spectrum is downsampled:
+                'band_max' (maximum of equal-width bands over the full range),
+                'log' (log-spaced bins) or 'truncate' (lowest bins only)
+            envelope_analysis: Compute envelope spectrum amplitudes at the
+                bearing fault frequencies (needs bearing geometry and rpm);
+                off by default since it adds a Hilbert transform per signal
+            envelope_band_hz: Demodulation band: a fixed (low, high) pair,
+                'kurtogram' to pick the most impulsive band of each signal
+                with ``fast_kurtogram`` (several times the cost of the
+                other features), or None for 1/4 to 3/4 Nyquist
         """
+        if spectrum_policy not in SPECTRUM_POLICIES:
+            raise ValueError(
+                f"Unknown spectrum policy: {spectrum_policy}. "
+                f"Available: {', '.join(SPECTRUM_POLICIES)}"
+            )
+
         self.sampling_rate_hz = sampling_rate_hz
         self.bearing_geometry = bearing_geometry
         self.fft_window = fft_window
         self.fft_size = fft_size
+        self.spectrum_bins = spectrum_bins
+        self.spectrum_policy = spectrum_policy
+        self.envelope_analysis = envelope_analysis
+        self.envelope_band_hz = envelope_band_hz
+        self.plan_cache = plan_cache if plan_cache is not None else DEFAULT_PLAN_CACHE
+
+    def config_key(self) -> Dict[str, Any]:
+        """Parameters that determine the extracted features.
+
+        Two extractors with equal keys produce identical features for the
+        same signal and rpm (the plan cache is excluded, it only affects
+        speed).
+
+        Returns:
+            JSON-serializable dictionary of extractor settings
+        """
+        band = self.envelope_band_hz
+        return {
+            "sampling_rate_hz": float(self.sampling_rate_hz),
+            "bearing_geometry": astuple(self.bearing_geometry) if self.bearing_geometry else None,
+            "fft_window": self.fft_window,
+            "fft_size": self.fft_size,
+            "spectrum_bins": self.spectrum_bins,
+            "spectrum_policy": self.spectrum_policy,
+            "envelope_analysis": self.envelope_analysis,
+            "envelope_band_hz": band if isinstance(band, str) or band is None else list(band),
+        }
+
+    def _get_nfft(self, n: int) -> int:
+        """FFT size for a signal of length n."""
+        if self.fft_size:
+            return self.fft_size
+        return 2 ** int(np.ceil(np.log2(n)))
+
+    def _get_plan(self, n: int, nfft: int) -> SpectralPlan:
+        """Get the cached window and frequency axis for length n."""
+        key = ("plan", n, self.fft_window, nfft, self.sampling_rate_hz)
+        return self.plan_cache.get(key, lambda: self._build_plan(n, nfft))
+
+    def _build_plan(self, n: int, nfft: int) -> SpectralPlan:
+        """Build the window and frequency axis for length n."""
+        if self.fft_window == "hann":
+            window = np.hanning(n)
+        elif self.fft_window == "hamming":
+            window = np.hamming(n)
+        else:
+            window = np.ones(n)
+
+        frequencies = np.fft.rfftfreq(nfft, 1.0 / self.sampling_rate_hz)
+        return SpectralPlan(
+            window=_readonly(window),
+            frequencies=_readonly(frequencies),
+            frequencies_sq=_readonly(frequencies * frequencies),
+        )
 
     def extract(
         self,
@@ -187,194 +421,346 @@ class VibrationFeatureExtractor:
         if len(x) == 0:
             return VibrationFeatures()
 
-        # Remove DC offset
-        x = x - np.mean(x)
+        return self.extract_matrix(x[np.newaxis, :], rpm=rpm, compute_fft=compute_fft)[0]
 
-        features = VibrationFeatures()
+    def extract_matrix(
+        self,
+        signals: np.ndarray,
+        rpm: Optional[float] = None,
+        compute_fft: bool = True,
+    ) -> VibrationFeatureBatch:
+        """Extract features from a stack of equal-length signals.
+
+        Args:
+            signals: Array of shape (n_signals, n_samples)
+            rpm: Optional rotational speed for bearing frequencies
+            compute_fft: Whether to compute frequency domain features
+
+        Returns:
+            VibrationFeatureBatch with one entry per row of ``signals``
+        """
+        x = np.asarray(signals, dtype=np.float64)
+        if x.ndim != 2:
+            raise ValueError(f"Expected a 2D (n_signals, n_samples) array, got shape {x.shape}")
+
+        n_signals, n = x.shape
+        batch = VibrationFeatureBatch.empty(n_signals)
+        if n == 0 or n_signals == 0:
+            return batch
+
+        # Remove DC offset
+        x = x - np.mean(x, axis=1, keepdims=True)
 
         # Time domain features
-        features = self._compute_time_features(x, features)
+        self._compute_time_features(x, batch)
 
         # Frequency domain features
-        if compute_fft and len(x) > 10:
-            features = self._compute_freq_features(x, features)
+        if compute_fft and n > 10:
+            nfft, fft_magnitude = self._compute_freq_features(x, batch)
 
-            # Bearing fault frequencies
+            # Bearing fault frequencies, read from the full-resolution spectrum
             if self.bearing_geometry and rpm:
-                features = self._compute_bearing_features(
-                    x, features, rpm, self.bearing_geometry
+                self._compute_bearing_features(
+                    fft_magnitude, nfft, batch, rpm, self.bearing_geometry
                 )
 
-        return features
+                if self.envelope_analysis:
+                    envelope = self._envelope_spectrum(x, batch)
+                    self._compute_bearing_features(
+                        envelope, n, batch, rpm, self.bearing_geometry,
+                        names=ENVELOPE_FAULT_NAMES, prefix="envelope_",
+                    )
 
-    def _compute_time_features(
+        return batch
+
+    def _envelope_spectrum(
         self,
         x: np.ndarray,
-        features: VibrationFeatures,
-    ) -> VibrationFeatures:
-        """Compute time-domain features.
+        batch: Optional[VibrationFeatureBatch] = None,
+    ) -> np.ndarray:
+        """Envelope spectra of the rows of x in the configured band.
 
         Args:
-            x: Signal array (DC removed)
-            features: Features object to update
+            x: Signal matrix, shape (n_signals, n_samples)
+            batch: Optional feature batch that receives the kurtogram band
 
         Returns:
-            Updated features
+            Envelope spectra, shape (n_signals, n_samples // 2 + 1)
         """
-        n = len(x)
-        if n == 0:
-            return features
+        band = self.envelope_band_hz
+        if band == "kurtogram":
+            kurtogram = fast_kurtogram(x, self.sampling_rate_hz)
+            low, high = kurtogram.band_hz
+            if batch is not None:
+                batch.values["envelope_band_center_hz"] = kurtogram.center_hz
+                batch.values["envelope_band_kurtosis"] = kurtogram.max_kurtosis
+        elif band is None:
+            low, high = None, None
+        else:
+            low, high = band
+
+        _, envelope = compute_envelope_spectrum(
+            x, self.sampling_rate_hz, low, high, plan_cache=self.plan_cache
+        )
+        return envelope
+
+    def _compute_time_features(
+        self,
+        x: np.ndarray,
+        batch: VibrationFeatureBatch,
+    ) -> None:
+        """Compute time-domain features.
+
+        Args:
+            x: Signal matrix (DC removed), shape (n_signals, n_samples)
+            batch: Feature batch to update
+        """
+        values = batch.values
 
         # Basic statistics
-        features.mean = float(np.mean(x))
-        features.std = float(np.std(x))
-        features.rms = float(np.sqrt(np.mean(x ** 2)))
-        features.peak = float(np.max(np.abs(x)))
-        features.peak_to_peak = float(np.max(x) - np.min(x))
+        mean = np.mean(x, axis=1)
+        centered = x - mean[:, np.newaxis]
+        centered_sq = centered * centered
+        var = np.mean(centered_sq, axis=1)
+        std = np.sqrt(var)
+        abs_x = np.abs(x)
+        mean_abs = np.mean(abs_x, axis=1)
+        rms = np.sqrt(np.mean(x * x, axis=1))
+        peak = np.max(abs_x, axis=1)
+
+        values["mean"] = mean
+        values["std"] = std
+        values["rms"] = rms
+        values["peak"] = peak
+        values["peak_to_peak"] = np.max(x, axis=1) - np.min(x, axis=1)
 
         # Shape factors
-        if features.rms > 0:
-            features.crest_factor = features.peak / features.rms
-            features.shape_factor = features.rms / (np.mean(np.abs(x)) + 1e-10)
-        else:
-            features.crest_factor = 0.0
-            features.shape_factor = 0.0
+        values["crest_factor"] = _safe_divide(peak, rms)
+        values["shape_factor"] = np.where(rms > 0, rms / (mean_abs + 1e-10), 0.0)
 
         # Higher order statistics
-        if features.std > 0:
-            x_norm = (x - np.mean(x)) / features.std
-            features.kurtosis = float(np.mean(x_norm ** 4))
-            features.skewness = float(np.mean(x_norm ** 3))
-        else:
-            features.kurtosis = 0.0
-            features.skewness = 0.0
+        m3 = np.mean(centered_sq * centered, axis=1)
+        m4 = np.mean(centered_sq * centered_sq, axis=1)
+        values["kurtosis"] = _safe_divide(m4, var * var, where=std > 0)
+        values["skewness"] = _safe_divide(m3, var * std, where=std > 0)
 
         # Impulse factor
-        mean_abs = np.mean(np.abs(x))
-        if mean_abs > 0:
-            features.impulse_factor = features.peak / mean_abs
-        else:
-            features.impulse_factor = 0.0
+        values["impulse_factor"] = _safe_divide(peak, mean_abs)
 
         # Clearance factor
-        sqrt_mean = np.mean(np.sqrt(np.abs(x))) ** 2
-        if sqrt_mean > 0:
-            features.clearance_factor = features.peak / sqrt_mean
-        else:
-            features.clearance_factor = 0.0
-
-        return features
+        sqrt_mean = np.mean(np.sqrt(abs_x), axis=1) ** 2
+        values["clearance_factor"] = _safe_divide(peak, sqrt_mean)
 
     def _compute_freq_features(
         self,
         x: np.ndarray,
-        features: VibrationFeatures,
-    ) -> VibrationFeatures:
+        batch: VibrationFeatureBatch,
+    ) -> Tuple[int, np.ndarray]:
         """Compute frequency-domain features.
 
         Args:
-            x: Signal array
-            features: Features object to update
+            x: Signal matrix, shape (n_signals, n_samples)
+            batch: Feature batch to update
 
         Returns:
-            Updated features
+            Tuple of (nfft, full magnitude spectrum of shape (n_signals, n_bins))
         """
-        n = len(x)
+        n = x.shape[1]
 
-        # Determine FFT size
-        if self.fft_size:
-            nfft = self.fft_size
-        else:
-            nfft = 2 ** int(np.ceil(np.log2(n)))
+        # Window and frequency axis come from the plan cache
+        nfft = self._get_nfft(n)
+        plan = self._get_plan(n, nfft)
 
-        # Apply window
-        if self.fft_window == "hann":
-            window = np.hanning(n)
-        elif self.fft_window == "hamming":
-            window = np.hamming(n)
-        else:
-            window = np.ones(n)
+        x_windowed = x * plan.window
 
-        x_windowed = x * window
-
-        # Compute FFT
-        fft_result = np.fft.rfft(x_windowed, nfft)
+        # One FFT call for all rows
+        fft_result = np.fft.rfft(x_windowed, nfft, axis=1)
         fft_magnitude = np.abs(fft_result) / n
-        fft_freq = np.fft.rfftfreq(nfft, 1.0 / self.sampling_rate_hz)
+
+        self._compute_spectral_features(fft_magnitude, nfft, plan, batch)
+        return nfft, fft_magnitude
+
+    def _compute_spectral_features(
+        self,
+        fft_magnitude: np.ndarray,
+        nfft: int,
+        plan: SpectralPlan,
+        batch: VibrationFeatureBatch,
+    ) -> None:
+        """Compute spectral features from magnitude spectra.
+
+        Args:
+            fft_magnitude: Magnitude spectra, shape (n_signals, n_bins)
+            nfft: FFT size the spectra were computed with
+            plan: Plan holding the matching frequency axis
+            batch: Feature batch to update
+        """
+        values = batch.values
+        fft_freq = plan.frequencies
 
         # Store FFT data (downsampled for storage efficiency)
-        max_freq_idx = min(len(fft_freq), 1000)  # Limit to 1000 points
-        features.fft_frequencies = fft_freq[:max_freq_idx].astype(np.float32)
-        features.fft_magnitudes = fft_magnitude[:max_freq_idx].astype(np.float32)
+        self._store_spectrum(fft_magnitude, nfft, batch)
 
         # Dominant frequency
-        if len(fft_magnitude) > 1:
+        if fft_magnitude.shape[1] > 1:
             # Skip DC component
-            peak_idx = np.argmax(fft_magnitude[1:]) + 1
-            features.dominant_frequency_hz = float(fft_freq[peak_idx])
-
-        # Spectral centroid (center of mass)
-        total_energy = np.sum(fft_magnitude)
-        if total_energy > 0:
-            features.spectral_centroid_hz = float(
-                np.sum(fft_freq * fft_magnitude) / total_energy
-            )
-
-            # Spectral spread (standard deviation around centroid)
-            features.spectral_spread_hz = float(np.sqrt(
-                np.sum(((fft_freq - features.spectral_centroid_hz) ** 2) * fft_magnitude) / total_energy
-            ))
+            peak_idx = np.argmax(fft_magnitude[:, 1:], axis=1) + 1
+            values["dominant_frequency_hz"] = fft_freq[peak_idx]
+
+        # Spectral centroid (center of mass) and spread around it
+        total_energy = np.sum(fft_magnitude, axis=1)
+        centroid = _safe_divide(fft_magnitude @ fft_freq, total_energy)
+        second_moment = _safe_divide(fft_magnitude @ plan.frequencies_sq, total_energy)
+        values["spectral_centroid_hz"] = centroid
+        values["spectral_spread_hz"] = np.where(
+            total_energy > 0,
+            np.sqrt(np.maximum(second_moment - centroid * centroid, 0.0)),
+            0.0,
+        )
 
         # Total spectral energy
-        features.spectral_energy = float(np.sum(fft_magnitude ** 2))
+        values["spectral_energy"] = np.einsum("ij,ij->i", fft_magnitude, fft_magnitude)
 
-        return features
+    def _store_spectrum(
+        self,
+        fft_magnitude: np.ndarray,
+        nfft: int,
+        batch: VibrationFeatureBatch,
+    ) -> None:
+        """Downsample the spectrum into the batch according to the policy.
+
+        Args:
+            fft_magnitude: Full magnitude spectrum, shape (n_signals, n_bins)
+            nfft: FFT size the spectrum was computed with
+            batch: Feature batch to update
+        """
+        n_bins = fft_magnitude.shape[1]
+        key = (
+            "spectrum", self.spectrum_policy, self.spectrum_bins,
+            n_bins, nfft, self.sampling_rate_hz,
+        )
+        frequencies, selector = self.plan_cache.get(
+            key, lambda: self._build_spectrum_selector(n_bins, nfft)
+        )
+
+        if self.spectrum_policy == "band_max" and selector is not None:
+            magnitudes = np.maximum.reduceat(fft_magnitude, selector, axis=1)
+        elif selector is not None:
+            magnitudes = fft_magnitude[:, selector]
+        else:
+            magnitudes = fft_magnitude
+
+        batch.fft_frequencies = frequencies
+        batch.fft_magnitudes = magnitudes.astype(np.float32)
+
+    def _build_spectrum_selector(
+        self,
+        n_bins: int,
+        nfft: int,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Build the stored frequency axis and the bins that feed it.
+
+        Args:
+            n_bins: Number of bins in the full spectrum
+            nfft: FFT size
+
+        Returns:
+            Tuple of (stored frequencies as float32, selector). The selector
+            is a bin index array ('log', 'truncate'), band start indices
+            ('band_max') or None when the full spectrum is kept.
+        """
+        fft_freq = np.fft.rfftfreq(nfft, 1.0 / self.sampling_rate_hz)
+        num_points = max(1, self.spectrum_bins)
+
+        if n_bins <= num_points:
+            return _readonly(fft_freq.astype(np.float32)), None
+
+        if self.spectrum_policy == "truncate":
+            selector = np.arange(num_points)
+            frequencies = fft_freq[selector]
+        elif self.spectrum_policy == "log":
+            # DC plus log-spaced bins up to Nyquist (duplicates at the low end dropped)
+            log_bins = np.geomspace(1, n_bins - 1, num_points - 1).round().astype(np.int64)
+            selector = np.unique(np.concatenate(([0], log_bins)))
+            frequencies = fft_freq[selector]
+        else:
+            # Equal-width bands, each reported at its center frequency
+            edges = np.linspace(0, n_bins, num_points + 1).astype(np.int64)
+            selector = edges[:-1]
+            frequencies = (fft_freq[edges[:-1]] + fft_freq[edges[1:] - 1]) / 2
+
+        return _readonly(frequencies.astype(np.float32)), _readonly(selector)
 
     def _compute_bearing_features(
         self,
-        x: np.ndarray,
-        features: VibrationFeatures,
+        fft_magnitude: np.ndarray,
+        nfft: int,
+        batch: VibrationFeatureBatch,
         rpm: float,
         geometry: BearingGeometry,
-    ) -> VibrationFeatures:
+        names: Sequence[str] = ("bpfo", "bpfi", "bsf", "ftf"),
+        prefix: str = "",
+    ) -> None:
         """Compute bearing fault frequency amplitudes.
 
         Args:
-            x: Signal array
-            features: Features object to update
+            fft_magnitude: Full magnitude spectrum, shape (n_signals, n_bins)
+            nfft: FFT size the spectrum was computed with
+            batch: Feature batch to update
             rpm: Rotational speed in RPM
             geometry: Bearing geometry parameters
+            names: Fault frequencies to measure
+            prefix: Prefix of the feature names written to the batch
+        """
+        n_bins = fft_magnitude.shape[1]
+        if n_bins == 0:
+            return
+
+        key = ("bearing_bins", astuple(geometry), float(rpm), nfft, self.sampling_rate_hz)
+        bin_ranges = self.plan_cache.get(
+            key, lambda: self._build_bearing_bins(nfft, rpm, geometry)
+        )
+
+        # Max magnitude near each fault frequency, for every row
+        for name in names:
+            start, end = bin_ranges[name]
+            end = min(end, n_bins)
+            if start < end:
+                amplitude = np.max(fft_magnitude[:, start:end], axis=1)
+            else:
+                amplitude = np.zeros(len(fft_magnitude))
+            batch.values[f"{prefix}{name}_amplitude"] = amplitude
+
+    def _build_bearing_bins(
+        self,
+        nfft: int,
+        rpm: float,
+        geometry: BearingGeometry,
+        tolerance_bins: int = 2,
+    ) -> Dict[str, Tuple[int, int]]:
+        """Map each bearing fault frequency to a [start, end) bin range.
+
+        Args:
+            nfft: FFT size of the full spectrum
+            rpm: Rotational speed in RPM
+            geometry: Bearing geometry parameters
+            tolerance_bins: Bins searched on either side of the target
 
         Returns:
-            Updated features with bearing frequency amplitudes
+            Dictionary mapping 'bpfo', 'bpfi', 'bsf', 'ftf' to bin ranges
         """
         # Calculate theoretical fault frequencies
         fault_freqs = geometry.calculate_fault_frequencies(rpm)
+        freq_resolution = self.sampling_rate_hz / nfft
+        n_bins = nfft // 2 + 1
 
-        # Get FFT magnitude at each fault frequency
-        fft_freq = features.fft_frequencies
-        fft_mag = features.fft_magnitudes
-
-        if len(fft_freq) == 0:
-            return features
-
-        freq_resolution = fft_freq[1] - fft_freq[0] if len(fft_freq) > 1 else 1.0
-
-        def get_amplitude_at_freq(target_freq: float, tolerance_bins: int = 2) -> float:
-            """Get max amplitude near target frequency."""
-            idx = int(target_freq / freq_resolution) if freq_resolution > 0 else 0
+        bin_ranges = {}
+        for name in ("bpfo", "bpfi", "bsf", "ftf"):
+            idx = int(round(fault_freqs[name] / freq_resolution))
             start = max(0, idx - tolerance_bins)
-            end = min(len(fft_mag), idx + tolerance_bins + 1)
-            if start < end:
-                return float(np.max(fft_mag[start:end]))
-            return 0.0
-
-        features.bpfo_amplitude = get_amplitude_at_freq(fault_freqs["bpfo"])
-        features.bpfi_amplitude = get_amplitude_at_freq(fault_freqs["bpfi"])
-        features.bsf_amplitude = get_amplitude_at_freq(fault_freqs["bsf"])
-        features.ftf_amplitude = get_amplitude_at_freq(fault_freqs["ftf"])
-
-        return features
+            end = min(n_bins, idx + tolerance_bins + 1)
+            bin_ranges[name] = (start, end)
+        return bin_ranges
 
     def extract_batch(
         self,
@@ -383,6 +769,10 @@ class VibrationFeatureExtractor:
     ) -> List[VibrationFeatures]:
         """Extract features from multiple signals.
 
+        Equal-length signals are stacked and run through
+        ``extract_matrix``; use that directly to get the features as
+        arrays instead of a list of dataclasses.
+
         Args:
             signals: List of signal arrays
             rpm: Optional rotational speed
@@ -390,31 +780,458 @@ class VibrationFeatureExtractor:
         Returns:
             List of VibrationFeatures
         """
+        lengths = {len(s) for s in signals}
+        if len(lengths) == 1 and 0 not in lengths:
+            return self.extract_matrix(np.asarray(signals), rpm=rpm).to_features()
         return [self.extract(s, rpm=rpm) for s in signals]
 
 
+class StreamingFeatureExtractor:
+    """Incremental feature extraction for signals too long to hold in memory.
+
+    Feed chunks with ``update`` and read the features with ``result`` at
+    any point; memory stays O(chunk + segment_length).
+
+    - mean/std/rms/skewness/kurtosis come from running central moments
+      (Welford updates, merged per chunk) and match the batch path.
+    - peak and peak-to-peak come from running min/max and also match.
+    - shape, impulse and clearance factors are not computed and are
+      reported as NaN: they need sum(|x - mean|) and sum(sqrt|x - mean|)
+      around the final mean, which cannot be updated from running sums
+      without keeping every sample. Use ``VibrationFeatureExtractor``
+      when these are needed.
+    - Spectral, bearing and envelope features use a Welch average of windowed
+      ``segment_length`` segments with ``overlap``. They estimate the batch
+      values rather than reproduce them: peaks and centroids are resolved
+      to ``fs / segment_length``, and ``spectral_energy`` is rescaled to the
+      batch normalization so it agrees in expectation for stationary
+      signals. With ``envelope_band_hz="kurtogram"`` each segment gets its
+      own band, so ``envelope_band_center_hz`` and
+      ``envelope_band_kurtosis`` are reported as NaN.
+    - Signals shorter than one segment use a single FFT over all samples,
+      exactly like ``VibrationFeatureExtractor.extract``.
+
+    Example:
+        stream = StreamingFeatureExtractor(
+            VibrationFeatureExtractor(25600, BEARING_GEOMETRIES["6205"]),
+            rpm=2100,
+        )
+        for chunk in read_chunks(path):
+            stream.update(chunk)
+        features = stream.result()
+    """
+
+    def __init__(
+        self,
+        extractor: VibrationFeatureExtractor,
+        rpm: Optional[float] = None,
+        segment_length: int = 8192,
+        overlap: float = 0.5,
+        compute_fft: bool = True,
+    ):
+        """Initialize streaming extractor.
+
+        Args:
+            extractor: Extractor providing sampling rate, window, bearing
+                geometry, spectrum policy and plan cache
+            rpm: Optional rotational speed for bearing frequencies
+            segment_length: Welch segment length (also its FFT size)
+            overlap: Fraction of overlap between Welch segments (0 <= overlap < 1)
+            compute_fft: Whether to compute frequency domain features
+        """
+        if not 0 <= overlap < 1:
+            raise ValueError(f"overlap must be in [0, 1), got {overlap}")
+
+        self.extractor = extractor
+        self.rpm = rpm
+        self.segment_length = segment_length
+        self.hop = max(1, int(round(segment_length * (1 - overlap))))
+        self.compute_fft = compute_fft
+        self.reset()
+
+    @property
+    def _use_envelope(self) -> bool:
+        """Whether envelope features are computed."""
+        extractor = self.extractor
+        return bool(extractor.envelope_analysis and extractor.bearing_geometry and self.rpm)
+
+    def reset(self) -> None:
+        """Forget all samples seen so far."""
+        # Running central moments
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._m3 = 0.0
+        self._m4 = 0.0
+
+        # Running extrema
+        self._min = np.inf
+        self._max = -np.inf
+
+        # Welch accumulation; _tail holds samples not yet consumed by a segment
+        self._tail = np.empty(0)
+        self._power_sum: Optional[np.ndarray] = None
+        self._envelope_power_sum: Optional[np.ndarray] = None
+        self._num_segments = 0
+
+    def update(self, chunk: Sequence[float]) -> None:
+        """Add the next chunk of samples.
+
+        Args:
+            chunk: 1D array of consecutive samples
+        """
+        x = np.asarray(chunk, dtype=np.float64).ravel()
+        if len(x) == 0:
+            return
+
+        self._update_moments(x)
+        self._min = min(self._min, float(np.min(x)))
+        self._max = max(self._max, float(np.max(x)))
+
+        if self.compute_fft:
+            self._update_spectrum(x)
+
+    def _update_moments(self, x: np.ndarray) -> None:
+        """Merge the central moments of a chunk into the running moments."""
+        n_b = len(x)
+        mean_b = float(np.mean(x))
+        centered = x - mean_b
+        centered_sq = centered * centered
+        m2_b = float(np.sum(centered_sq))
+        m3_b = float(np.sum(centered_sq * centered))
+        m4_b = float(np.sum(centered_sq * centered_sq))
+
+        n_a = self.count
+        n = n_a + n_b
+        delta = mean_b - self._mean
+        delta_n = delta / n
+
+        m4 = (
+            self._m4 + m4_b
+            + delta * delta_n ** 3 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+            + 6 * delta_n ** 2 * (n_a * n_a * m2_b + n_b * n_b * self._m2)
+            + 4 * delta_n * (n_a * m3_b - n_b * self._m3)
+        )
+        m3 = (
+            self._m3 + m3_b
+            + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+            + 3 * delta_n * (n_a * m2_b - n_b * self._m2)
+        )
+        m2 = self._m2 + m2_b + delta * delta_n * n_a * n_b
+
+        self.count = n
+        self._mean += delta_n * n_b
+        self._m2, self._m3, self._m4 = m2, m3, m4
+
+    def _update_spectrum(self, x: np.ndarray) -> None:
+        """Add all complete Welch segments to the averaged power spectrum."""
+        buffer = np.concatenate((self._tail, x)) if len(self._tail) else x
+        length = self.segment_length
+        if len(buffer) < length:
+            self._tail = buffer
+            return
+
+        num_segments = (len(buffer) - length) // self.hop + 1
+        segments = np.lib.stride_tricks.sliding_window_view(buffer, length)[::self.hop]
+        segments = segments[:num_segments]
+
+        plan = self.extractor._get_plan(length, length)
+        windowed = (segments - segments.mean(axis=1, keepdims=True)) * plan.window
+        magnitude = np.abs(np.fft.rfft(windowed, length, axis=1)) / length
+        power = np.sum(magnitude * magnitude, axis=0)
+
+        if self._power_sum is None:
+            self._power_sum = power
+        else:
+            self._power_sum += power
+
+        if self._use_envelope:
+            envelope = self.extractor._envelope_spectrum(segments)
+            envelope_power = np.sum(envelope * envelope, axis=0)
+            if self._envelope_power_sum is None:
+                self._envelope_power_sum = envelope_power
+            else:
+                self._envelope_power_sum += envelope_power
+
+        self._num_segments += num_segments
+
+        # Keep the samples the next segment still needs
+        self._tail = buffer[num_segments * self.hop:].copy()
+
+    def result(self) -> VibrationFeatures:
+        """Get the features of all samples seen so far.
+
+        Returns:
+            VibrationFeatures for the stream (shape, impulse and clearance
+            factors are NaN)
+        """
+        n = self.count
+        if n == 0:
+            return VibrationFeatures()
+
+        batch = VibrationFeatureBatch.empty(1)
+        values = batch.values
+
+        var = self._m2 / n
+        std = np.sqrt(var)
+        peak = max(self._max - self._mean, self._mean - self._min)
+        rms = std  # DC offset is removed before extraction
+
+        # Time domain features (mean is zero after DC removal)
+        values["std"][0] = std
+        values["rms"][0] = rms
+        values["peak"][0] = peak
+        values["peak_to_peak"][0] = self._max - self._min
+        values["crest_factor"][0] = peak / rms if rms > 0 else 0.0
+        values["kurtosis"][0] = (self._m4 / n) / (var * var) if std > 0 else 0.0
+        values["skewness"][0] = (self._m3 / n) / (var * std) if std > 0 else 0.0
+
+        # Not available from running sums (see class docstring)
+        values["shape_factor"][0] = np.nan
+        values["impulse_factor"][0] = np.nan
+        values["clearance_factor"][0] = np.nan
+
+        if self.compute_fft and n > 10:
+            extractor = self.extractor
+            envelope = None
+            if self._num_segments:
+                # Welch average over all complete segments
+                nfft = self.segment_length
+                plan = extractor._get_plan(nfft, nfft)
+                fft_magnitude = np.sqrt(self._power_sum / self._num_segments)[np.newaxis, :]
+                extractor._compute_spectral_features(fft_magnitude, nfft, plan, batch)
+                # The batch path scales one nfft-point FFT of all n samples by
+                # 1/n, so its energy is nfft/n times a per-segment Welch
+                # energy (in expectation, by Parseval)
+                values["spectral_energy"][0] *= extractor._get_nfft(n) / n
+                envelope_length = nfft
+                if self._use_envelope:
+                    envelope = np.sqrt(
+                        self._envelope_power_sum / self._num_segments
+                    )[np.newaxis, :]
+                    if extractor.envelope_band_hz == "kurtogram":
+                        # No single band fits all segments (see class docstring)
+                        values["envelope_band_center_hz"][0] = np.nan
+                        values["envelope_band_kurtosis"][0] = np.nan
+            else:
+                # Everything is still buffered: same FFTs as the batch path
+                x = (self._tail - self._mean)[np.newaxis, :]
+                nfft, fft_magnitude = extractor._compute_freq_features(x, batch)
+                envelope_length = x.shape[1]
+                if self._use_envelope:
+                    envelope = extractor._envelope_spectrum(x, batch)
+
+            if extractor.bearing_geometry and self.rpm:
+                extractor._compute_bearing_features(
+                    fft_magnitude, nfft, batch, self.rpm, extractor.bearing_geometry
+                )
+            if envelope is not None:
+                extractor._compute_bearing_features(
+                    envelope, envelope_length, batch, self.rpm, extractor.bearing_geometry,
+                    names=ENVELOPE_FAULT_NAMES, prefix="envelope_",
+                )
+
+        return batch[0]
+
+
+@dataclass
+class FeatureTrack:
+    """Features of consecutive windows of one channel.
+
+    Row i of ``values`` holds the features of the window starting at
+    ``window_start_s[i]`` seconds.
+    """
+    feature_names: List[str]
+    values: np.ndarray  # (n_windows, n_features)
+    window_start_s: np.ndarray  # (n_windows,)
+    window_size: int  # Samples per window
+    hop: int  # Samples between window starts
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def column(self, name: str) -> np.ndarray:
+        """Get one feature over time.
+
+        Args:
+            name: Feature name from ``feature_names``
+
+        Returns:
+            1D array with one value per window
+        """
+        return self.values[:, self.feature_names.index(name)]
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Convert to a column dictionary including ``window_start_s``."""
+        result = {"window_start_s": self.window_start_s}
+        for i, name in enumerate(self.feature_names):
+            result[name] = self.values[:, i]
+        return result
+
+
+class RollingFeatureExtractor:
+    """Compute feature tracks over sliding windows of a signal.
+
+    Windows are strided views into the signal, and they are sent to
+    ``VibrationFeatureExtractor.extract_matrix`` in blocks of
+    ``windows_per_batch``. Each block therefore costs one FFT call, and
+    memory stays bounded. The work is linear in signal length for a
+    fixed window and hop.
+
+    Example:
+        rolling = RollingFeatureExtractor(
+            VibrationFeatureExtractor(25600, BEARING_GEOMETRIES["6205"]),
+            window_seconds=0.1,
+            features=["rms", "kurtosis", "bpfo_amplitude"],
+        )
+        track = rolling.extract(signal, rpm=2100)
+        rms_over_time = track.column("rms")
+    """
+
+    def __init__(
+        self,
+        extractor: VibrationFeatureExtractor,
+        window_seconds: float = 0.1,
+        hop_seconds: Optional[float] = None,
+        features: Optional[Sequence[str]] = None,
+        windows_per_batch: int = 512,
+    ):
+        """Initialize rolling extractor.
+
+        Args:
+            extractor: Extractor applied to every window
+            window_seconds: Window length in seconds
+            hop_seconds: Time between window starts (default: window_seconds)
+            features: Feature names to keep (default: all scalar features)
+            windows_per_batch: Windows per extract_matrix call
+        """
+        self.extractor = extractor
+        self.window_seconds = window_seconds
+        self.hop_seconds = hop_seconds if hop_seconds is not None else window_seconds
+        self.feature_names = list(features) if features is not None else list(SCALAR_FEATURE_NAMES)
+        self.windows_per_batch = windows_per_batch
+
+        unknown = set(self.feature_names) - set(SCALAR_FEATURE_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown features: {', '.join(sorted(unknown))}")
+
+    def extract(
+        self,
+        signal: Sequence[float],
+        rpm: Optional[float] = None,
+    ) -> FeatureTrack:
+        """Compute the feature track of a signal.
+
+        Args:
+            signal: 1D array of samples
+            rpm: Optional rotational speed for bearing frequencies
+
+        Returns:
+            FeatureTrack with one row per complete window
+        """
+        x = np.asarray(signal, dtype=np.float64)
+        return self.extract_matrix(x[np.newaxis, :], rpm=rpm)[0]
+
+    def extract_matrix(
+        self,
+        signals: np.ndarray,
+        rpm: Optional[float] = None,
+    ) -> List[FeatureTrack]:
+        """Compute feature tracks of several equal-length signals at once.
+
+        Windows of all rows share each extract_matrix call.
+
+        Args:
+            signals: Array of shape (n_signals, n_samples)
+            rpm: Optional rotational speed for bearing frequencies
+
+        Returns:
+            One FeatureTrack per row of ``signals``
+        """
+        x = np.asarray(signals, dtype=np.float64)
+        if x.ndim != 2:
+            raise ValueError(f"Expected a 2D (n_signals, n_samples) array, got shape {x.shape}")
+
+        n_signals, n = x.shape
+        fs = self.extractor.sampling_rate_hz
+        window_size = max(1, int(round(self.window_seconds * fs)))
+        hop = max(1, int(round(self.hop_seconds * fs)))
+
+        n_windows = (n - window_size) // hop + 1 if n >= window_size else 0
+        values = np.zeros((n_signals, n_windows, len(self.feature_names)))
+
+        if n_windows and n_signals:
+            windows = np.lib.stride_tricks.sliding_window_view(x, window_size, axis=1)
+            windows = windows[:, ::hop]
+            compute_fft = any(name not in TIME_FEATURE_NAMES for name in self.feature_names)
+            block = max(1, self.windows_per_batch // n_signals)
+
+            for start in range(0, n_windows, block):
+                stop = min(start + block, n_windows)
+                stacked = windows[:, start:stop].reshape(-1, window_size)
+                batch = self.extractor.extract_matrix(stacked, rpm=rpm, compute_fft=compute_fft)
+                for i, name in enumerate(self.feature_names):
+                    values[:, start:stop, i] = batch.values[name].reshape(n_signals, -1)
+
+        window_start_s = np.arange(n_windows) * (hop / fs)
+        return [
+            FeatureTrack(
+                feature_names=list(self.feature_names),
+                values=values[row],
+                window_start_s=window_start_s,
+                window_size=window_size,
+                hop=hop,
+            )
+            for row in range(n_signals)
+        ]
+
+
+def _safe_divide(
+    numerator: np.ndarray,
+    denominator: np.ndarray,
+    where: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Elementwise division that yields 0 where the denominator is not positive."""
+    if where is None:
+        where = denominator > 0
+    out = np.zeros(np.broadcast(numerator, denominator).shape)
+    return np.divide(numerator, denominator, out=out, where=where)
+
+
 def compute_envelope_spectrum(
-    signal: Sequence[float],
+    signal: Sequence[float] | np.ndarray,
     sampling_rate_hz: float,
-    bandpass_low_hz: Optional[float] = None,
-    bandpass_high_hz: Optional[float] = None,
+    bandpass_low_hz: Optional[float | np.ndarray] = None,
+    bandpass_high_hz: Optional[float | np.ndarray] = None,
+    plan_cache: Optional[SpectralPlanCache] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Compute envelope spectrum for bearing fault detection.
 
     The envelope spectrum is effective for detecting bearing faults
     by demodulating the high-frequency carrier signal.
 
+    The band-passed analytic signal is built directly from the real FFT:
+    positive-frequency bins inside the band are doubled and everything
+    else is zero, so one rfft and one inverse FFT give the envelope.
+    Signals are processed along the last axis, so a 2D
+    (n_signals, n_samples) batch is handled in the same calls. Band edges
+    may be arrays with one value per signal, e.g. the bands chosen by
+    ``fast_kurtogram``.
+
     Args:
-        signal: Input vibration signal
+        signal: Input vibration signal(s), shape (n_samples,) or (..., n_samples)
         sampling_rate_hz: Sampling rate
-        bandpass_low_hz: Lower bandpass cutoff (default: 1/4 Nyquist)
-        bandpass_high_hz: Upper bandpass cutoff (default: 3/4 Nyquist)
+        bandpass_low_hz: Lower bandpass cutoff(s) (default: 1/4 Nyquist)
+        bandpass_high_hz: Upper bandpass cutoff(s) (default: 3/4 Nyquist)
+        plan_cache: Cache for band limits and frequency axes
+            (default: shared module cache)
 
     Returns:
-        Tuple of (frequencies, envelope_spectrum)
+        Tuple of (frequencies, envelope_spectrum) where the spectrum has the
+        shape of ``signal`` with the last axis replaced by frequency bins
     """
     x = np.asarray(signal, dtype=np.float64)
-    n = len(x)
+    n = x.shape[-1]
 
     nyquist = sampling_rate_hz / 2
 
@@ -424,29 +1241,242 @@ def compute_envelope_spectrum(
     if bandpass_high_hz is None:
         bandpass_high_hz = nyquist * 3 / 4
 
-    # Simple bandpass using FFT
-    fft_result = np.fft.fft(x)
-    freqs = np.fft.fftfreq(n, 1.0 / sampling_rate_hz)
+    fft_result = np.fft.rfft(x, axis=-1)
+    analytic_fft = np.zeros(x.shape[:-1] + (n,), dtype=np.complex128)
+
+    # Analytic signal of the band-passed input (positive band bins, doubled)
+    if np.ndim(bandpass_low_hz) or np.ndim(bandpass_high_hz):
+        env_freq = np.fft.rfftfreq(n, 1.0 / sampling_rate_hz)
+        low = np.asarray(bandpass_low_hz, dtype=np.float64)[..., np.newaxis]
+        high = np.asarray(bandpass_high_hz, dtype=np.float64)[..., np.newaxis]
+        in_band = (env_freq >= low) & (env_freq <= high)
+        in_band[..., 0] = False
+        if n % 2 == 0:
+            in_band[..., -1] = False
+        analytic_fft[..., :len(env_freq)] = 2 * fft_result * in_band
+    else:
+        cache = plan_cache if plan_cache is not None else DEFAULT_PLAN_CACHE
+        key = ("envelope_band", n, sampling_rate_hz, bandpass_low_hz, bandpass_high_hz)
+        band_start, band_stop, env_freq = cache.get(
+            key,
+            lambda: _build_envelope_band(n, sampling_rate_hz, bandpass_low_hz, bandpass_high_hz),
+        )
+        analytic_fft[..., band_start:band_stop] = 2 * fft_result[..., band_start:band_stop]
+
+    envelope = np.abs(np.fft.ifft(analytic_fft, axis=-1))
 
-    # Zero out frequencies outside bandpass
-    mask = (np.abs(freqs) < bandpass_low_hz) | (np.abs(freqs) > bandpass_high_hz)
-    fft_filtered = fft_result.copy()
-    fft_filtered[mask] = 0
+    # Compute envelope spectrum
+    envelope -= np.mean(envelope, axis=-1, keepdims=True)
+    env_spectrum = np.abs(np.fft.rfft(envelope, axis=-1)) / n
 
-    # Inverse FFT to get filtered signal
-    x_filtered = np.real(np.fft.ifft(fft_filtered))
+    return env_freq, env_spectrum
 
-    # Compute envelope using Hilbert transform approximation
-    # (analytical signal magnitude)
-    analytic = np.fft.ifft(2 * fft_filtered * (freqs > 0))
-    envelope = np.abs(analytic)
 
-    # Compute envelope spectrum
-    env_fft = np.fft.rfft(envelope - np.mean(envelope))
-    env_freq = np.fft.rfftfreq(n, 1.0 / sampling_rate_hz)
-    env_spectrum = np.abs(env_fft) / n
+def _build_envelope_band(
+    n: int,
+    sampling_rate_hz: float,
+    bandpass_low_hz: float,
+    bandpass_high_hz: float,
+) -> Tuple[int, int, np.ndarray]:
+    """Get the [start, stop) rfft bins of a pass band and the envelope axis.
 
-    return env_freq, env_spectrum
+    DC and, for even n, the Nyquist bin are never part of the band.
+    """
+    freqs = np.fft.rfftfreq(n, 1.0 / sampling_rate_hz)
+    in_band = (freqs >= bandpass_low_hz) & (freqs <= bandpass_high_hz)
+    in_band[0] = False
+    if n % 2 == 0:
+        in_band[-1] = False
+
+    bins = np.flatnonzero(in_band)
+    if len(bins) == 0:
+        return 0, 0, _readonly(freqs)
+    return int(bins[0]), int(bins[-1]) + 1, _readonly(freqs)
+
+
+@dataclass
+class KurtogramResult:
+    """Fast kurtogram of one or more signals.
+
+    Rows of ``kurtosis`` follow ``levels`` (0, 1, 1.6, 2, 2.6, ...), where
+    level L splits [0, fs/2] into bands of width fs * 2^-(L+1); columns
+    are 3 * 2^nlevel equal frequency cells, each band spanning the cells
+    it covers.
+    """
+    levels: np.ndarray  # (n_rows,)
+    kurtosis: np.ndarray  # (..., n_rows, n_cols) spectral kurtosis
+    center_hz: np.ndarray  # (...,) center of the most impulsive band
+    bandwidth_hz: np.ndarray  # (...,) width of the most impulsive band
+    max_kurtosis: np.ndarray  # (...,) spectral kurtosis of that band
+
+    @property
+    def band_hz(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Lower and upper edges of the selected band(s)."""
+        half = self.bandwidth_hz / 2
+        return self.center_hz - half, self.center_hz + half
+
+
+def _fir1(order: int, cutoff: float) -> np.ndarray:
+    """Hamming-window lowpass FIR (cutoff relative to Nyquist, unit DC gain)."""
+    n = np.arange(order + 1) - order / 2
+    taps = cutoff * np.sinc(cutoff * n) * np.hamming(order + 1)
+    return taps / np.sum(taps)
+
+
+def _kurtogram_filters() -> Tuple[np.ndarray, np.ndarray, Tuple[np.ndarray, ...]]:
+    """Analytic quadrature filters of the fast kurtogram filter bank.
+
+    Returns:
+        Tuple of (lowpass h, highpass g, (h1, h2, h3) for 1/3-band splits)
+    """
+    order = 16
+    cutoff = 0.4
+    k = np.arange(order + 1)
+    h = _fir1(order, cutoff) * np.exp(2j * np.pi * k * 0.125)
+
+    n = np.arange(2, order + 2)
+    g = h[(1 - n) % order] * (-1.0) ** (1 - n)
+
+    order3 = int(3 / 2 * order)
+    k3 = np.arange(order3 + 1)
+    h1 = _fir1(order3, 2 / 3 * cutoff) * np.exp(2j * np.pi * k3 * 0.25 / 3)
+    h2 = h1 * np.exp(2j * np.pi * k3 / 6)
+    h3 = h1 * np.exp(2j * np.pi * k3 / 3)
+    return h, g, (h1, h2, h3)
+
+
+def _fir_decimate(x: np.ndarray, taps: np.ndarray, factor: int) -> np.ndarray:
+    """Causal FIR filter along the last axis, keeping every factor-th output.
+
+    Only the retained outputs are computed (samples factor-1, 2*factor-1, ...),
+    as one matrix product of strided tap windows with the reversed taps.
+    """
+    num_taps = len(taps)
+    num_out = x.shape[-1] // factor
+    pad = [(0, 0)] * (x.ndim - 1) + [(num_taps - 1, 0)]
+    padded = np.pad(x, pad)
+
+    # windows[..., m, :] holds the num_taps inputs of output factor*(m+1)-1
+    windows = np.lib.stride_tricks.sliding_window_view(padded, num_taps, axis=-1)
+    windows = windows[..., factor - 1:factor - 1 + factor * num_out:factor, :]
+    return windows @ taps[::-1]
+
+
+def _spectral_kurtosis(c: np.ndarray, skip: int) -> np.ndarray:
+    """Kurtosis of filter outputs along the last axis (excess for the signal type)."""
+    c = c[..., skip:]
+    c = c - np.mean(c, axis=-1, keepdims=True)
+    power = np.abs(c) ** 2
+    energy = np.mean(power, axis=-1)
+    fourth = np.mean(power * power, axis=-1)
+    excess = 2.0 if np.iscomplexobj(c) else 3.0
+    kurt = _safe_divide(fourth, energy * energy, where=energy > np.finfo(float).eps)
+    return np.where(energy > np.finfo(float).eps, kurt - excess, 0.0)
+
+
+def fast_kurtogram(
+    signal: Sequence[float] | np.ndarray,
+    sampling_rate_hz: float,
+    nlevel: Optional[int] = None,
+) -> KurtogramResult:
+    """Find the most impulsive frequency band with the fast kurtogram.
+
+    Implements Antoni's multirate filter-bank kurtogram: each level splits
+    every band of the previous level in two with analytic quadrature
+    filters and decimates by 2, and intermediate 1/3-band levels split
+    each band in three and decimate by 3. Spectral kurtosis is measured
+    on every filter output, so the whole tree costs O(n * nlevel).
+    Signals are processed along the last axis, so a 2D batch gets one
+    band per row.
+
+    Args:
+        signal: Input signal(s), shape (n_samples,) or (n_signals, n_samples)
+        sampling_rate_hz: Sampling rate
+        nlevel: Decomposition depth (default: log2(n) - 7, between 1 and 7)
+
+    Returns:
+        KurtogramResult with the kurtogram and the selected band(s)
+    """
+    x = np.asarray(signal, dtype=np.float64)
+    single = x.ndim == 1
+    x2 = np.atleast_2d(x)
+    n_signals, n = x2.shape
+
+    max_level = int(np.floor(np.log2(max(n, 2)))) - 7
+    if nlevel is None:
+        nlevel = min(max(max_level, 1), 7)
+    nlevel = max(1, nlevel)
+
+    h, g, thirds = _kurtogram_filters()
+    skip = len(h) - 1
+    n_cols = 3 * 2 ** nlevel
+
+    # Binary levels 0..nlevel, with a 1/3-band level after each of 0..nlevel-2
+    levels = [0.0]
+    for level in range(1, nlevel):
+        levels.extend([float(level), level - 1 + np.log2(3)])
+    levels.append(float(nlevel))
+    row_of = {level: i for i, level in enumerate(levels)}
+    kurtosis = np.zeros((n_signals, len(levels), n_cols))
+
+    def record(level: float, node_kurtosis: np.ndarray) -> None:
+        """Spread per-band kurtosis values over the columns they cover."""
+        num_bands = node_kurtosis.shape[1]
+        kurtosis[:, row_of[level], :] = np.repeat(node_kurtosis, n_cols // num_bands, axis=1)
+
+    def split_thirds(nodes: np.ndarray, level: int) -> None:
+        """Measure the 1/3-band split of every node at a binary level."""
+        if nodes.shape[-1] // 3 <= skip + 1:
+            return
+        parts = [_fir_decimate(nodes, taps, 3) for taps in thirds]
+        # (n_signals, n_nodes, 3, len) in frequency order
+        node_kurtosis = _spectral_kurtosis(np.stack(parts, axis=2), skip)
+        record(level + np.log2(3), node_kurtosis.reshape(n_signals, -1))
+
+    # Level 0 is the signal itself; nodes are kept as (n_signals, n_nodes, len)
+    nodes = x2[:, np.newaxis, :]
+    record(0.0, _spectral_kurtosis(nodes, 0))
+    if nlevel > 1:
+        split_thirds(nodes, 0)
+
+    for level in range(1, nlevel + 1):
+        if nodes.shape[-1] // 2 <= skip + 1:
+            break
+        low = _fir_decimate(nodes, h, 2)
+        high = _fir_decimate(nodes, g, 2)
+        # Undo the spectral inversion of the decimated highpass branch
+        high *= (-1.0) ** np.arange(high.shape[-1])
+        nodes = np.stack((low, high), axis=2).reshape(n_signals, -1, low.shape[-1])
+
+        record(float(level), _spectral_kurtosis(nodes, skip))
+        if level < nlevel - 1:
+            split_thirds(nodes, level)
+
+    # Most impulsive band per signal (coarsest level wins ties)
+    flat = kurtosis.reshape(n_signals, -1)
+    best = np.argmax(flat, axis=1)
+    best_row, best_col = np.divmod(best, n_cols)
+    best_level = np.asarray(levels)[best_row]
+    bandwidth = sampling_rate_hz * 2.0 ** -(best_level + 1)
+
+    cell_hz = sampling_rate_hz / 2 / n_cols
+    cells_per_band = np.round(bandwidth / cell_hz).astype(np.int64)
+    band_index = best_col // cells_per_band
+    center = (band_index + 0.5) * bandwidth
+
+    result = KurtogramResult(
+        levels=np.asarray(levels),
+        kurtosis=kurtosis,
+        center_hz=center,
+        bandwidth_hz=bandwidth,
+        max_kurtosis=flat[np.arange(n_signals), best],
+    )
+    if single:
+        result.kurtosis = kurtosis[0]
+        result.center_hz = center[0]
+        result.bandwidth_hz = bandwidth[0]
+        result.max_kurtosis = result.max_kurtosis[0]
+    return result
 
 
 def compute_statistics(values: Sequence[float]) -> Dict[str, float]:
@@ -0,0 +1,62 @@
+"""Fast content hashing of sample arrays.
+
+Hashes the raw bytes of NumPy arrays without formatting values as text.
+Uses xxHash (XXH3-128) when the ``xxhash`` package is installed and
+BLAKE2b otherwise; both read the array buffer directly.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+import numpy as np
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Name of the active hash function; prefixes every digest from this module
+# so digests made with and without xxhash never compare equal
+HASH_ALGORITHM = "xxh3_128" if xxhash is not None else "blake2b_128"
+
+
+def new_hasher() -> Any:
+    """Create an incremental hasher (``update``/``hexdigest`` interface)."""
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+
+def format_digest(hasher: Any) -> str:
+    """Finish a hasher from ``new_hasher`` as ``"{HASH_ALGORITHM}:{hex}"``."""
+    return f"{HASH_ALGORITHM}:{hasher.hexdigest()}"
+
+
+def update_with_array(hasher: Any, data: Any) -> None:
+    """Feed the full contents of an array into a hasher.
+
+    The dtype and shape are hashed along with the sample bytes, so arrays
+    with equal bytes but different layouts do not collide.
+
+    Args:
+        hasher: Hasher from ``new_hasher``
+        data: Array-like samples
+    """
+    array = np.ascontiguousarray(data)
+    hasher.update(f"{array.dtype.str}{array.shape}".encode())
+    hasher.update(memoryview(array).cast("B"))
+
+
+def array_digest(data: Any) -> str:
+    """Hex digest of the full contents of an array.
+
+    Args:
+        data: Array-like samples
+
+    Returns:
+        Hex digest prefixed with the hash algorithm
+    """
+    hasher = new_hasher()
+    update_with_array(hasher, data)
+    return format_digest(hasher)
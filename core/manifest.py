@@ -0,0 +1,325 @@
+"""Processing manifest for resumable pipeline runs.
+
+Records which source files and episodes have already been written so that
+a rerun can skip unchanged files entirely and redo only new or modified
+episodes.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ManifestEntry:
+    """Manifest record for a single processed episode."""
+    source_path: str
+    raw_id: str
+    checksum: str
+    episode_id: str
+    saved: bool
+    # Content digest used for deduplication (equal to checksum in "full" mode)
+    digest: Optional[str] = None
+
+
+@dataclass
+class FileFingerprint:
+    """Size and modification time of a fully processed source file."""
+    size: int
+    mtime_ns: int
+    num_episodes: int
+
+    @classmethod
+    def from_path(cls, file_path: Path, num_episodes: int = 0) -> FileFingerprint:
+        """Fingerprint a file from its current stat."""
+        st = file_path.stat()
+        return cls(size=st.st_size, mtime_ns=st.st_mtime_ns, num_episodes=num_episodes)
+
+    def matches(self, file_path: Path) -> bool:
+        """Check whether the file on disk is unchanged."""
+        try:
+            st = file_path.stat()
+        except OSError:
+            return False
+        return st.st_size == self.size and st.st_mtime_ns == self.mtime_ns
+
+
+class ProcessingManifest:
+    """Append-only JSONL manifest of processed source files and episodes.
+
+    Each line is either an episode record, keyed by (source_path, raw_id)
+    with the RawEpisode checksum and assigned episode ID, or a file record
+    written once every episode of that file has been handled. Because the
+    log is appended and flushed as the run progresses, a crashed run
+    leaves a valid manifest describing everything completed so far.
+
+    Example:
+        manifest = ProcessingManifest(storage.get_manifest_path("cwru_bearing"))
+        if not manifest.is_file_current(path, "12k/105.mat"):
+            ...
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize manifest, loading any existing records.
+
+        Args:
+            path: Path to the manifest JSONL file
+        """
+        self.path = Path(path)
+
+        self._episodes: Dict[Tuple[str, str], ManifestEntry] = {}
+        self._files: Dict[str, FileFingerprint] = {}
+
+        # In-progress bookkeeping for files of the current run
+        self._parsed: Dict[str, FileFingerprint] = {}
+        self._resolved: Dict[str, int] = {}
+        self._failed: Set[str] = set()
+
+        self._handle: Optional[TextIO] = None
+        self._load()
+
+    def _load(self) -> None:
+        """Replay the manifest log."""
+        if not self.path.exists():
+            return
+
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Truncated last line from an interrupted run
+                    continue
+                self._apply(record)
+
+        logger.debug(
+            f"Loaded manifest {self.path}: {len(self._files)} files, "
+            f"{len(self._episodes)} episodes"
+        )
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """Apply a single log record to the in-memory state."""
+        kind = record.get("type")
+        if kind == "episode":
+            entry = ManifestEntry(
+                source_path=record["source_path"],
+                raw_id=record["raw_id"],
+                checksum=record["checksum"],
+                episode_id=record["episode_id"],
+                saved=record.get("saved", True),
+                digest=record.get("digest", record["checksum"]),
+            )
+            self._episodes[(entry.source_path, entry.raw_id)] = entry
+        elif kind == "file":
+            self._files[record["source_path"]] = FileFingerprint(
+                size=record["size"],
+                mtime_ns=record["mtime_ns"],
+                num_episodes=record.get("num_episodes", 0),
+            )
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append a record to the log and flush it to disk."""
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.path, "a")
+        self._handle.write(json.dumps(record) + "\n")
+        self._handle.flush()
+
+    @property
+    def episode_ids(self) -> Set[str]:
+        """All episode IDs assigned in previous runs."""
+        return {entry.episode_id for entry in self._episodes.values()}
+
+    def checksums(self, saved_only: bool = True) -> Dict[str, Tuple[str, str]]:
+        """Map recorded episode checksums to their (source_path, raw_id) keys.
+
+        Args:
+            saved_only: Only include episodes that were written to storage
+
+        Returns:
+            Dictionary mapping checksum to manifest key
+        """
+        return {
+            entry.checksum: key
+            for key, entry in self._episodes.items()
+            if entry.saved or not saved_only
+        }
+
+    def digests(self, saved_only: bool = True) -> Dict[str, Tuple[str, str]]:
+        """Map recorded content digests to their (source_path, raw_id) keys.
+
+        Args:
+            saved_only: Only include episodes that were written to storage
+
+        Returns:
+            Dictionary mapping content digest to manifest key
+        """
+        return {
+            entry.digest: key
+            for key, entry in self._episodes.items()
+            if entry.digest and (entry.saved or not saved_only)
+        }
+
+    def is_file_current(self, file_path: Path, source_path: str) -> bool:
+        """Check whether a source file was fully processed and is unchanged.
+
+        Args:
+            file_path: Path to the source file on disk
+            source_path: Manifest key of the file
+
+        Returns:
+            True if the file can be skipped
+        """
+        fingerprint = self._files.get(source_path)
+        return fingerprint is not None and fingerprint.matches(file_path)
+
+    def forget_missing(self, exists: Callable[[str], bool]) -> int:
+        """Drop saved records whose episodes are no longer in storage.
+
+        Their source files lose their file record, so the next run parses
+        them again and reprocesses only the missing episodes.
+
+        Args:
+            exists: Returns True if an episode ID is present in storage
+
+        Returns:
+            Number of episode records invalidated
+        """
+        missing = 0
+        for entry in self._episodes.values():
+            if entry.saved and not exists(entry.episode_id):
+                entry.saved = False
+                self._files.pop(entry.source_path, None)
+                missing += 1
+
+        if missing:
+            logger.info(f"{missing} manifest episodes are missing from storage")
+        return missing
+
+    def lookup(self, source_path: str, raw_id: str) -> Optional[ManifestEntry]:
+        """Get the previous record for an episode, if any."""
+        return self._episodes.get((source_path, raw_id))
+
+    def record_episode(
+        self,
+        source_path: str,
+        raw_id: str,
+        checksum: Optional[str],
+        episode_id: Optional[str],
+        saved: bool,
+        failed: bool = False,
+        digest: Optional[str] = None,
+    ) -> None:
+        """Record the outcome of processing one episode.
+
+        Args:
+            source_path: Manifest key of the source file
+            raw_id: Episode ID within the source dataset
+            checksum: RawEpisode checksum
+            episode_id: Assigned FactoryNet episode ID
+            saved: Whether the episode was written to storage
+            failed: Whether processing raised an error (keeps the file
+                from being marked complete so it is retried)
+            digest: Content digest, if it differs from the checksum
+        """
+        if failed:
+            self._failed.add(source_path)
+        elif checksum and episode_id:
+            entry = ManifestEntry(
+                source_path=source_path,
+                raw_id=raw_id,
+                checksum=checksum,
+                episode_id=episode_id,
+                saved=saved,
+                digest=digest or checksum,
+            )
+            self._episodes[(source_path, raw_id)] = entry
+            record = {
+                "type": "episode",
+                "source_path": source_path,
+                "raw_id": raw_id,
+                "checksum": checksum,
+                "episode_id": episode_id,
+                "saved": saved,
+            }
+            if digest and digest != checksum:
+                record["digest"] = digest
+            self._append(record)
+
+        self.resolve(source_path)
+
+    def resolve(self, source_path: str) -> None:
+        """Count one episode of a file as handled (processed or skipped)."""
+        self._resolved[source_path] = self._resolved.get(source_path, 0) + 1
+        self._maybe_complete(source_path)
+
+    def mark_file_parsed(
+        self,
+        file_path: Path,
+        source_path: str,
+        num_episodes: int,
+    ) -> None:
+        """Note that the adapter yielded every episode of a file.
+
+        The file record is written once all of its episodes are resolved.
+
+        Args:
+            file_path: Path to the source file on disk
+            source_path: Manifest key of the file
+            num_episodes: Number of episodes parsed from the file
+        """
+        try:
+            self._parsed[source_path] = FileFingerprint.from_path(file_path, num_episodes)
+        except OSError as e:
+            logger.warning(f"Cannot fingerprint {file_path}: {e}")
+            return
+        self._maybe_complete(source_path)
+
+    def _maybe_complete(self, source_path: str) -> None:
+        """Write the file record once parsing and processing are both done."""
+        fingerprint = self._parsed.get(source_path)
+        if fingerprint is None:
+            return
+        if self._resolved.get(source_path, 0) < fingerprint.num_episodes:
+            return
+
+        del self._parsed[source_path]
+        self._resolved.pop(source_path, None)
+        if source_path in self._failed:
+            self._failed.discard(source_path)
+            return
+
+        self._files[source_path] = fingerprint
+        self._append({
+            "type": "file",
+            "source_path": source_path,
+            "size": fingerprint.size,
+            "mtime_ns": fingerprint.mtime_ns,
+            "num_episodes": fingerprint.num_episodes,
+        })
+
+    def reset(self) -> None:
+        """Discard all records and truncate the manifest file."""
+        self.close()
+        self._episodes.clear()
+        self._files.clear()
+        self._parsed.clear()
+        self._resolved.clear()
+        self._failed.clear()
+        if self.path.exists():
+            os.remove(self.path)
+
+    def close(self) -> None:
+        """Close the underlying log file."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __len__(self) -> int:
+        return len(self._episodes)
@@ -8,13 +8,16 @@ import logging
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
-from core.adapters.base_adapter import FaultType, RawEpisode, SeverityLevel
+from core.adapters.base_adapter import FaultType, RawEpisode, SensorChannel, SeverityLevel
+from core.feature_cache import FeatureCache, signal_digest
 from core.feature_extraction import (
     BEARING_GEOMETRIES,
+    FeatureTrack,
+    RollingFeatureExtractor,
     VibrationFeatureExtractor,
     VibrationFeatures,
     compute_statistics,
@@ -73,6 +76,59 @@ class TimeStep:
     # E.g., {"vibration_de": 0.5, "vibration_fe": 0.3}
 
 
+class TimeStepView(Sequence[TimeStep]):
+    """Lazy, read-only view of a columnar signal matrix as TimeStep objects.
+
+    TimeStep instances are only materialized when indexed or iterated,
+    so holding a view costs nothing beyond a reference to the matrix.
+    """
+
+    def __init__(
+        self,
+        signals: np.ndarray,
+        channel_names: List[str],
+        dt: float,
+    ):
+        """Initialize view.
+
+        Args:
+            signals: Signal matrix of shape (num_channels, num_samples)
+            channel_names: Channel name for each row of ``signals``
+            dt: Sample period in seconds
+        """
+        self._signals = signals
+        self._channel_names = channel_names
+        self._dt = dt
+
+    def __len__(self) -> int:
+        return self._signals.shape[1] if self._signals.ndim == 2 else 0
+
+    def _make_step(self, i: int) -> TimeStep:
+        column = self._signals[:, i]
+        return TimeStep(
+            step_index=i,
+            timestamp_offset=i * self._dt,
+            condition_monitoring={
+                name: float(value)
+                for name, value in zip(self._channel_names, column)
+            },
+        )
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[TimeStep, List[TimeStep]]:
+        n = len(self)
+        if isinstance(index, slice):
+            return [self._make_step(i) for i in range(*index.indices(n))]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("time step index out of range")
+        return self._make_step(index)
+
+    def __iter__(self) -> Iterator[TimeStep]:
+        for i in range(len(self)):
+            yield self._make_step(i)
+
+
 @dataclass
 class StateAnnotation:
     """State annotation for the episode."""
@@ -118,8 +174,9 @@ class FactoryNetEpisode:
     duration_seconds: float
     sampling_rate_hz: float
 
-    # Time series data
-    steps: List[TimeStep]
+    # Time series data, shape (num_channels, num_samples); row i holds
+    # channel_names[i] sampled every ``dt`` seconds from timestamp_start
+    signals: np.ndarray
     channel_names: List[str]
     channel_units: Dict[str, str]
 
@@ -130,6 +187,9 @@ class FactoryNetEpisode:
     # Extracted features
     features: Dict[str, VibrationFeatures] = field(default_factory=dict)
 
+    # Rolling-window features per channel (empty unless enabled)
+    feature_tracks: Dict[str, FeatureTrack] = field(default_factory=dict)
+
     # Domain knowledge
     semantic_priors: Optional[SemanticPriors] = None
 
@@ -140,6 +200,36 @@ class FactoryNetEpisode:
     # Raw metadata preserved
     raw_metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def dt(self) -> float:
+        """Sample period in seconds."""
+        return 1.0 / self.sampling_rate_hz if self.sampling_rate_hz > 0 else 0.0
+
+    @property
+    def num_timesteps(self) -> int:
+        """Number of samples per channel."""
+        return self.signals.shape[1] if self.signals.ndim == 2 else 0
+
+    @property
+    def steps(self) -> TimeStepView:
+        """Per-sample compatibility view over ``signals``.
+
+        Prefer ``signals``/``channel_data`` for anything performance
+        sensitive; each accessed step is built on demand.
+        """
+        return TimeStepView(self.signals, self.channel_names, self.dt)
+
+    def channel_data(self, channel_name: str) -> np.ndarray:
+        """Get the samples of a single channel as a 1D array view.
+
+        Args:
+            channel_name: Name from ``channel_names``
+
+        Returns:
+            1D array of samples (NaN-padded to ``num_timesteps``)
+        """
+        return self.signals[self.channel_names.index(channel_name)]
+
     def to_metadata_dict(self) -> Dict[str, Any]:
         """Convert to metadata.json format."""
         return {
@@ -153,7 +243,7 @@ class FactoryNetEpisode:
             "timestamp_end": self.timestamp_end.isoformat(),
             "duration_seconds": self.duration_seconds,
             "sampling_rate_hz": self.sampling_rate_hz,
-            "num_timesteps": len(self.steps),
+            "num_timesteps": self.num_timesteps,
             "channel_names": self.channel_names,
             "channel_units": self.channel_units,
             "state_annotation": {
@@ -198,6 +288,11 @@ class EpisodeNormalizer:
         id_prefix: str = "FN-ADAPTED",
         extract_features: bool = True,
         bearing_type: str = "6205",
+        feature_track_window_s: Optional[float] = None,
+        feature_track_hop_s: Optional[float] = None,
+        feature_cache: Optional[FeatureCache] = None,
+        envelope_analysis: bool = False,
+        envelope_band_hz: Optional[Tuple[float, float] | str] = None,
     ):
         """Initialize normalizer.
 
@@ -205,10 +300,24 @@ class EpisodeNormalizer:
             id_prefix: Prefix for generated episode IDs
             extract_features: Whether to extract vibration features
             bearing_type: Default bearing type for fault frequency calculation
+            feature_track_window_s: Window length for rolling feature tracks
+                (None disables them)
+            feature_track_hop_s: Time between track windows (default: window length)
+            feature_cache: Optional on-disk cache consulted before extracting
+                channel features
+            envelope_analysis: Add envelope spectrum amplitudes at the
+                bearing fault frequencies to the features
+            envelope_band_hz: Envelope demodulation band (see
+                ``VibrationFeatureExtractor``), e.g. 'kurtogram'
         """
         self.id_prefix = id_prefix
         self.extract_features = extract_features
         self.bearing_type = bearing_type
+        self.feature_track_window_s = feature_track_window_s
+        self.feature_track_hop_s = feature_track_hop_s
+        self.feature_cache = feature_cache
+        self.envelope_analysis = envelope_analysis
+        self.envelope_band_hz = envelope_band_hz
         self._episode_counter = 0
         self._seen_ids = set()
 
@@ -228,15 +337,15 @@ class EpisodeNormalizer:
         """
         # Generate episode ID
         if episode_id is None:
-            episode_id = self._generate_episode_id(raw_episode)
+            episode_id = self.generate_episode_id(raw_episode)
 
         # Get sampling rate from first channel
         sampling_rate = 12000.0  # Default
         if raw_episode.channels:
             sampling_rate = raw_episode.channels[0].sampling_rate_hz
 
-        # Build time steps
-        steps, channel_names = self._build_time_steps(raw_episode)
+        # Build columnar signal matrix
+        signals, channel_names = self._build_signal_matrix(raw_episode)
 
         # Build channel units mapping
         channel_units = {}
@@ -248,8 +357,11 @@ class EpisodeNormalizer:
 
         # Extract features
         features = {}
+        feature_tracks = {}
         if self.extract_features:
             features = self._extract_features(raw_episode)
+            if self.feature_track_window_s:
+                feature_tracks = self._extract_feature_tracks(raw_episode)
 
         # Build semantic priors
         semantic_priors = self._build_semantic_priors(raw_episode)
@@ -277,20 +389,31 @@ class EpisodeNormalizer:
             timestamp_end=timestamp_end,
             duration_seconds=duration,
             sampling_rate_hz=sampling_rate,
-            steps=steps,
+            signals=signals,
             channel_names=channel_names,
             channel_units=channel_units,
             state_annotation=state_annotation,
             cause_synset=self._infer_cause_synset(raw_episode),
             features=features,
+            feature_tracks=feature_tracks,
             semantic_priors=semantic_priors,
             load_hp=raw_episode.load_hp,
             rpm=raw_episode.rpm,
             raw_metadata=raw_episode.raw_metadata,
         )
 
-    def _generate_episode_id(self, raw_episode: RawEpisode) -> str:
-        """Generate a unique episode ID."""
+    def generate_episode_id(self, raw_episode: RawEpisode) -> str:
+        """Generate a unique episode ID.
+
+        Called by ``normalize`` when no ID is given, and by the pipeline,
+        which assigns IDs before handing episodes to worker processes.
+
+        Args:
+            raw_episode: Episode the ID is generated for
+
+        Returns:
+            An ID of the form ``{id_prefix}-{counter:06d}`` not issued before
+        """
         self._episode_counter += 1
 
         # Create ID with counter
@@ -304,44 +427,45 @@ class EpisodeNormalizer:
         self._seen_ids.add(episode_id)
         return episode_id
 
-    def _build_time_steps(
+    def _build_signal_matrix(
         self,
         raw_episode: RawEpisode,
-    ) -> tuple[List[TimeStep], List[str]]:
-        """Build time steps from sensor channels.
+    ) -> tuple[np.ndarray, List[str]]:
+        """Stack sensor channels into a columnar signal matrix.
+
+        The first channel defines the number of samples; shorter channels
+        are padded with NaN and longer ones are truncated.
 
         Args:
             raw_episode: Input episode
 
         Returns:
-            Tuple of (time_steps, channel_names)
+            Tuple of (signals with shape (num_channels, num_samples), channel_names)
         """
         if not raw_episode.channels:
-            return [], []
+            return np.empty((0, 0), dtype=np.float64), []
 
         # Get reference channel for timing
-        ref_channel = raw_episode.channels[0]
-        num_samples = len(ref_channel.data)
-        dt = 1.0 / ref_channel.sampling_rate_hz
+        num_samples = len(raw_episode.channels[0].data)
 
         # Build channel name list
         channel_names = [ch.channel_type for ch in raw_episode.channels]
 
-        # Create time steps
-        steps = []
-        for i in range(num_samples):
-            condition_data = {}
-            for ch in raw_episode.channels:
-                if i < len(ch.data):
-                    condition_data[ch.channel_type] = ch.data[i]
+        # Keep the adapters' sample dtype (float32 halves episode memory)
+        dtype = np.result_type(*(np.asarray(ch.data).dtype for ch in raw_episode.channels))
+        if not np.issubdtype(dtype, np.floating):
+            dtype = np.dtype(np.float64)
 
-            steps.append(TimeStep(
-                step_index=i,
-                timestamp_offset=i * dt,
-                condition_monitoring=condition_data,
-            ))
+        signals = np.full(
+            (len(raw_episode.channels), num_samples),
+            np.nan,
+            dtype=dtype,
+        )
+        for row, ch in zip(signals, raw_episode.channels):
+            n = min(len(ch.data), num_samples)
+            row[:n] = ch.data[:n]
 
-        return steps, channel_names
+        return signals, channel_names
 
     def _create_state_annotation(
         self,
@@ -431,39 +555,171 @@ class EpisodeNormalizer:
 
         return None
 
+    @staticmethod
+    def _group_channels(
+        raw_episode: RawEpisode,
+    ) -> Dict[Tuple[float, int], List[SensorChannel]]:
+        """Group channels that share a sampling rate and length.
+
+        Args:
+            raw_episode: Input episode
+
+        Returns:
+            Dictionary mapping (sampling_rate_hz, num_samples) to channels
+        """
+        groups: Dict[Tuple[float, int], List[SensorChannel]] = {}
+        for channel in raw_episode.channels:
+            key = (channel.sampling_rate_hz, len(channel.data))
+            groups.setdefault(key, []).append(channel)
+        return groups
+
     def _extract_features(
         self,
         raw_episode: RawEpisode,
     ) -> Dict[str, VibrationFeatures]:
         """Extract vibration features from all channels.
 
+        Channels with the same sampling rate and length are stacked and
+        extracted in one batched call sharing a single FFT setup. With a
+        feature cache, channels whose samples, rpm and extractor settings
+        were seen before are loaded instead of recomputed.
+
         Args:
             raw_episode: Input episode
 
         Returns:
             Dictionary mapping channel names to features
         """
-        features = {}
+        extracted: Dict[int, VibrationFeatures] = {}
 
         # Get bearing geometry
         bearing_geometry = BEARING_GEOMETRIES.get(self.bearing_type)
 
-        for channel in raw_episode.channels:
+        for (sampling_rate, _), channels in self._group_channels(raw_episode).items():
             extractor = VibrationFeatureExtractor(
-                sampling_rate_hz=channel.sampling_rate_hz,
+                sampling_rate_hz=sampling_rate,
                 bearing_geometry=bearing_geometry,
+                envelope_analysis=self.envelope_analysis,
+                envelope_band_hz=self.envelope_band_hz,
             )
 
-            try:
-                channel_features = extractor.extract(
-                    signal=channel.data,
-                    rpm=raw_episode.rpm,
+            # Reuse cached features of unchanged channels
+            cache_keys: Dict[int, str] = {}
+            if self.feature_cache is not None:
+                pending = []
+                for channel in channels:
+                    key = self.feature_cache.make_key(
+                        signal_digest(channel.data), raw_episode.rpm, extractor
+                    )
+                    cached = self.feature_cache.get(key)
+                    if cached is not None:
+                        extracted[id(channel)] = cached
+                    else:
+                        cache_keys[id(channel)] = key
+                        pending.append(channel)
+                channels = pending
+                if not channels:
+                    continue
+
+            computed = self._extract_channel_group(extractor, channels, raw_episode.rpm)
+            extracted.update(computed)
+
+            for channel_key, key in cache_keys.items():
+                if channel_key in computed:
+                    try:
+                        self.feature_cache.put(key, computed[channel_key])
+                    except OSError as e:
+                        logger.warning(f"Cannot write feature cache entry: {e}")
+
+        # Keep the channel order of the episode
+        features = {}
+        for channel in raw_episode.channels:
+            if id(channel) in extracted:
+                features[channel.channel_type] = extracted[id(channel)]
+        return features
+
+    @staticmethod
+    def _extract_channel_group(
+        extractor: VibrationFeatureExtractor,
+        channels: List[SensorChannel],
+        rpm: Optional[float],
+    ) -> Dict[int, VibrationFeatures]:
+        """Extract features of equal-length channels in one batched call.
+
+        Args:
+            extractor: Extractor for the channels' sampling rate
+            channels: Channels of equal length
+            rpm: Rotational speed
+
+        Returns:
+            Dictionary mapping id() of each channel to its features
+        """
+        extracted: Dict[int, VibrationFeatures] = {}
+        try:
+            matrix = np.stack([np.asarray(ch.data, dtype=np.float64) for ch in channels])
+            batch = extractor.extract_matrix(matrix, rpm=rpm)
+            for channel, channel_features in zip(channels, batch.to_features()):
+                extracted[id(channel)] = channel_features
+            return extracted
+        except Exception as e:
+            if len(channels) == 1:
+                logger.warning(
+                    f"Feature extraction failed for {channels[0].channel_id}: {e}"
                 )
-                features[channel.channel_type] = channel_features
+                return extracted
+
+        # Retry one by one so a single bad channel does not drop the group
+        for channel in channels:
+            try:
+                extracted[id(channel)] = extractor.extract(signal=channel.data, rpm=rpm)
             except Exception as e:
                 logger.warning(f"Feature extraction failed for {channel.channel_id}: {e}")
+        return extracted
 
-        return features
+    def _extract_feature_tracks(
+        self,
+        raw_episode: RawEpisode,
+    ) -> Dict[str, FeatureTrack]:
+        """Extract rolling-window feature tracks from all channels.
+
+        Args:
+            raw_episode: Input episode
+
+        Returns:
+            Dictionary mapping channel names to feature tracks
+        """
+        extracted: Dict[int, FeatureTrack] = {}
+        bearing_geometry = BEARING_GEOMETRIES.get(self.bearing_type)
+
+        for (sampling_rate, _), channels in self._group_channels(raw_episode).items():
+            rolling = RollingFeatureExtractor(
+                VibrationFeatureExtractor(
+                    sampling_rate_hz=sampling_rate,
+                    bearing_geometry=bearing_geometry,
+                    envelope_analysis=self.envelope_analysis,
+                    envelope_band_hz=self.envelope_band_hz,
+                ),
+                window_seconds=self.feature_track_window_s,
+                hop_seconds=self.feature_track_hop_s,
+            )
+
+            try:
+                matrix = np.stack([np.asarray(ch.data, dtype=np.float64) for ch in channels])
+                tracks = rolling.extract_matrix(matrix, rpm=raw_episode.rpm)
+            except Exception as e:
+                names = ", ".join(ch.channel_id for ch in channels)
+                logger.warning(f"Feature track extraction failed for {names}: {e}")
+                continue
+
+            for channel, track in zip(channels, tracks):
+                if len(track):
+                    extracted[id(channel)] = track
+
+        tracks_by_name = {}
+        for channel in raw_episode.channels:
+            if id(channel) in extracted:
+                tracks_by_name[channel.channel_type] = extracted[id(channel)]
+        return tracks_by_name
 
     def _build_semantic_priors(
         self,
@@ -529,6 +785,14 @@ class EpisodeNormalizer:
             bearing_info=bearing_info,
         )
 
+    def reserve_episode_ids(self, episode_ids: Iterable[str]) -> None:
+        """Mark episode IDs as taken so they are never generated again.
+
+        Args:
+            episode_ids: IDs already in use (e.g. from a previous run)
+        """
+        self._seen_ids.update(episode_ids)
+
     def reset_counter(self) -> None:
         """Reset the episode counter."""
         self._episode_counter = 0
@@ -6,21 +6,30 @@ validation, Q&A generation, and storage.
 from __future__ import annotations
 
 import logging
+import os
+from collections import deque
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from multiprocessing.util import Finalize
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Type
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Type
 
 from tqdm import tqdm
 
-from core.adapters.base_adapter import BaseDatasetAdapter, RawEpisode
+from core.adapters.base_adapter import CHECKSUM_MODES, BaseDatasetAdapter, RawEpisode
 from core.adapters.registry import AdapterRegistry
+from core.feature_cache import FeatureCache
+from core.manifest import ProcessingManifest
 from core.normalizer import EpisodeNormalizer, FactoryNetEpisode
 from core.qa_generator import QAGenerator
+from core.sharded_storage import ShardedEpisodeStorage
 from core.storage import EpisodeStorage
 from core.validation import (
+    EpisodeValidationSummary,
     EpisodeValidator,
     ValidationReport,
+    ValidationReportAccumulator,
     ValidationReportGenerator,
     ValidationResult,
 )
@@ -36,6 +45,20 @@ class PipelineConfig:
 
     # Processing options
     extract_features: bool = True
+    # Sample dtype of adapter channels ("float32" or "float64"; None keeps
+    # the adapter's setting). Features are always computed in float64.
+    channel_dtype: Optional[str] = None
+    # Rolling-window feature tracks per channel (None disables them)
+    feature_track_window_s: Optional[float] = None
+    feature_track_hop_s: Optional[float] = None
+    # Envelope spectrum fault amplitudes (opt-in, slower); the demodulation
+    # band is 1/4-3/4 Nyquist, a fixed (low, high) pair or "kurtogram"
+    envelope_analysis: bool = False
+    envelope_band_hz: Optional[Tuple[float, float] | str] = None
+    # On-disk cache of channel features (default location: output_dir/feature_cache)
+    use_feature_cache: bool = True
+    feature_cache_dir: Optional[str] = None
+    feature_cache_max_mb: int = 1024
     generate_qa: bool = True
     validate_episodes: bool = True
 
@@ -52,6 +75,27 @@ class PipelineConfig:
 
     # Storage
     use_parquet: bool = True
+    storage_backend: str = "directory"  # "directory" or "sharded"
+    shard_size_mb: int = 64
+
+    # Skip source files and episodes already recorded in the manifest
+    resume: bool = True
+
+    # RawEpisode checksum mode: "full" hashes every sample, "sample" only
+    # the first/last 100 values of each channel
+    checksum_mode: str = "full"
+    # Drop episodes whose sensor data exactly duplicates an earlier one
+    deduplicate: bool = True
+
+    # Parallelism: 1 processes in-process, 0 uses one worker per CPU core.
+    # Workers take batches of max_pending_per_worker // 2 episodes and write
+    # them out before returning, so with sharded storage this is also the
+    # number of episodes per worker shard.
+    num_workers: int = 1
+    max_pending_per_worker: int = 4
+    # Source files parsed concurrently by the adapter (1 parses in-process,
+    # 0 uses one per CPU core); episodes keep file order either way
+    parse_workers: int = 1
 
     # Logging
     verbose: bool = True
@@ -71,6 +115,9 @@ class PipelineStats:
     episodes_passed: int = 0
     episodes_failed: int = 0
     episodes_saved: int = 0
+    episodes_skipped: int = 0
+    episodes_duplicate: int = 0
+    files_skipped: int = 0
     qa_pairs_generated: int = 0
 
     # Quality metrics
@@ -107,6 +154,9 @@ class PipelineStats:
             "episodes_passed": self.episodes_passed,
             "episodes_failed": self.episodes_failed,
             "episodes_saved": self.episodes_saved,
+            "episodes_skipped": self.episodes_skipped,
+            "episodes_duplicate": self.episodes_duplicate,
+            "files_skipped": self.files_skipped,
             "qa_pairs_generated": self.qa_pairs_generated,
             "pass_rate": self.pass_rate,
             "avg_sensor_completeness": self.avg_sensor_completeness,
@@ -116,6 +166,122 @@ class PipelineStats:
         }
 
 
+@dataclass
+class EpisodeOutcome:
+    """Result of running a single raw episode through the pipeline stages."""
+    raw_id: str
+    episode_id: Optional[str] = None
+    source_path: Optional[str] = None
+    checksum: Optional[str] = None
+    normalized: bool = False
+    validation: Optional[ValidationResult] = None
+    saved: bool = False
+    qa_pairs_generated: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class _DigestRegistry:
+    """Content digests of saved episodes, for deduplication.
+
+    A digest is registered once its episode has been saved. While the first
+    episode with a digest is still being processed, later copies are held
+    as its duplicates: they count as dropped if it is saved or rejected by
+    validation, and as failed (so their files are parsed again on the next
+    run) if processing it raised an error.
+    """
+    saved: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    # digest -> (key of the episode in flight, its held duplicates as
+    # (source_path, raw_id, checksum))
+    claims: Dict[str, Tuple[Tuple[str, str], List[Tuple[str, str, str]]]] = field(
+        default_factory=dict
+    )
+    # key of an episode in flight -> its digest
+    in_flight: Dict[Tuple[str, str], str] = field(default_factory=dict)
+
+    def original(self, digest: str) -> Optional[Tuple[str, str]]:
+        """Key of the saved or in-flight episode with this digest, if any."""
+        if digest in self.saved:
+            return self.saved[digest]
+        claim = self.claims.get(digest)
+        return claim[0] if claim is not None else None
+
+    def claim(self, key: Tuple[str, str], digest: str) -> None:
+        """Note that the episode ``key`` with ``digest`` is being processed."""
+        self.claims[digest] = (key, [])
+        self.in_flight[key] = digest
+
+    def hold_duplicate(self, digest: str, source_path: str, raw_id: str, checksum: str) -> bool:
+        """Hold a duplicate until its in-flight original is settled.
+
+        Returns:
+            False if the original is already saved (nothing to wait for)
+        """
+        claim = self.claims.get(digest)
+        if claim is None:
+            return False
+        claim[1].append((source_path, raw_id, checksum))
+        return True
+
+    def settle(
+        self,
+        key: Tuple[str, str],
+        saved: bool,
+    ) -> Tuple[Optional[str], List[Tuple[str, str, str]]]:
+        """Settle the claim of a processed episode.
+
+        Returns:
+            The episode's digest (None if it claimed none) and its held duplicates
+        """
+        digest = self.in_flight.pop(key, None)
+        if digest is None:
+            return None, []
+        _, duplicates = self.claims.pop(digest)
+        if saved:
+            self.saved[digest] = key
+        return digest, duplicates
+
+
+# Per-process pipeline used by pool workers (built once by the initializer)
+_worker_pipeline: Optional["DataPipeline"] = None
+
+
+def _init_worker(config: PipelineConfig) -> None:
+    """Build the pipeline components inside a pool worker."""
+    global _worker_pipeline
+    _worker_pipeline = DataPipeline(config=config)
+    # Flush buffered storage when the worker process exits
+    Finalize(_worker_pipeline, _worker_pipeline.storage.close, exitpriority=10)
+
+
+def _process_batch_in_worker(
+    batch: List[Tuple[RawEpisode, str, str]],
+) -> List[EpisodeOutcome]:
+    """Pool entry point: process a batch of episodes with the worker's pipeline.
+
+    The worker's storage is flushed before returning, so every outcome
+    reported as saved is already on disk when the parent records it.
+    """
+    outcomes = [
+        _worker_pipeline._process_episode(raw_episode, episode_id, checksum)
+        for raw_episode, episode_id, checksum in batch
+    ]
+    _worker_pipeline._flush_storage(outcomes)
+    return outcomes
+
+
+def _iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Group an iterable into lists of at most ``batch_size`` items."""
+    batch: List[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 class DataPipeline:
     """Orchestrates the full data processing pipeline.
 
@@ -126,6 +292,15 @@ class DataPipeline:
     4. QA Generator: Generate Q&A pairs
     5. Storage: Save to disk
 
+    With ``PipelineConfig.num_workers != 1``, stages 2-5 run in a process
+    pool. Episode IDs are still assigned in adapter order by the parent
+    process, so output is identical to a single-process run.
+
+    Every run appends to a per-dataset ProcessingManifest. With
+    ``PipelineConfig.resume`` (the default), source files that were fully
+    processed and have not changed are skipped without being parsed, and
+    episodes whose checksum is unchanged are not reprocessed.
+
     Example:
         pipeline = DataPipeline(config=PipelineConfig(demo_mode=True))
         stats = pipeline.process_dataset("cwru_bearing", data_dir="./data/cwru")
@@ -142,10 +317,20 @@ class DataPipeline:
             config: Pipeline configuration
         """
         self.config = config or PipelineConfig()
+        if self.config.checksum_mode not in CHECKSUM_MODES:
+            raise ValueError(
+                f"Unknown checksum mode: {self.config.checksum_mode}. "
+                f"Available: {', '.join(CHECKSUM_MODES)}"
+            )
 
         # Initialize components
         self.normalizer = EpisodeNormalizer(
             extract_features=self.config.extract_features,
+            feature_track_window_s=self.config.feature_track_window_s,
+            feature_track_hop_s=self.config.feature_track_hop_s,
+            feature_cache=self._create_feature_cache(),
+            envelope_analysis=self.config.envelope_analysis,
+            envelope_band_hz=self.config.envelope_band_hz,
         )
 
         self.validator = EpisodeValidator(
@@ -157,13 +342,37 @@ class DataPipeline:
             questions_per_category=self.config.questions_per_category,
         )
 
-        self.storage = EpisodeStorage(
-            base_dir=self.config.output_dir,
-            use_parquet=self.config.use_parquet,
-        )
+        self.storage = self._create_storage()
 
         self.report_generator = ValidationReportGenerator(self.validator)
 
+    def _create_feature_cache(self) -> Optional[FeatureCache]:
+        """Create the feature cache if enabled in the config."""
+        if not (self.config.extract_features and self.config.use_feature_cache):
+            return None
+        cache_dir = self.config.feature_cache_dir or Path(self.config.output_dir) / "feature_cache"
+        return FeatureCache(
+            cache_dir,
+            max_bytes=self.config.feature_cache_max_mb * 1024 * 1024,
+        )
+
+    def _create_storage(self) -> EpisodeStorage:
+        """Create the storage backend selected in the config."""
+        backend = self.config.storage_backend
+        if backend == "directory":
+            return EpisodeStorage(
+                base_dir=self.config.output_dir,
+                use_parquet=self.config.use_parquet,
+            )
+        if backend == "sharded":
+            return ShardedEpisodeStorage(
+                base_dir=self.config.output_dir,
+                row_group_bytes=self.config.shard_size_mb * 1024 * 1024,
+            )
+        raise ValueError(
+            f"Unknown storage backend: {backend}. Available: directory, sharded"
+        )
+
     def process_dataset(
         self,
         dataset_name: str,
@@ -234,15 +443,53 @@ class DataPipeline:
         stats: PipelineStats,
     ) -> PipelineStats:
         """Internal method to process adapter episodes."""
+        if self.config.channel_dtype:
+            adapter.set_channel_dtype(self.config.channel_dtype)
+
         # Get episode limit
         limit = self.config.demo_limit if self.config.demo_mode else None
 
-        # Collect episodes for validation report
-        processed_episodes: List[FactoryNetEpisode] = []
-        validation_results: List[ValidationResult] = []
+        # Streaming aggregates over all validated episodes (for stats) and
+        # over saved episodes (for the report); episodes are not retained
+        run_validation = ValidationReportAccumulator(
+            adapter.metadata.name,
+            keep_episode_summaries=False,
+        )
+        report_accumulator = ValidationReportAccumulator(adapter.metadata.name)
+
+        # Load the manifest of previous runs and keep their episode IDs
+        manifest = ProcessingManifest(
+            self.storage.get_manifest_path(adapter.metadata.name)
+        )
+        if not self.config.resume:
+            manifest.reset()
+        manifest.forget_missing(
+            lambda episode_id: self.storage.has_episode(adapter.metadata.name, episode_id)
+        )
+        self.normalizer.reserve_episode_ids(manifest.episode_ids)
+
+        def needs_processing(file_path: Path) -> bool:
+            source_path = adapter.relative_source_path(file_path)
+            if manifest.is_file_current(file_path, source_path):
+                stats.files_skipped += 1
+                return False
+            return True
+
+        def file_complete(file_path: Path, num_episodes: int) -> None:
+            manifest.mark_file_parsed(
+                file_path,
+                adapter.relative_source_path(file_path),
+                num_episodes,
+            )
 
         # Process episodes with progress bar
-        episodes_iter = adapter.iter_episodes(limit=limit)
+        episodes_iter = adapter.parallel_iter_episodes(
+            num_workers=self.config.parse_workers,
+            ordered=True,
+            limit=limit,
+            file_filter=needs_processing,
+            on_file_complete=file_complete,
+        )
 
         if self.config.verbose:
             total = limit or adapter.metadata.num_samples
@@ -252,63 +499,41 @@ class DataPipeline:
                 desc=f"Processing {adapter.metadata.name}",
             )
 
-        for raw_episode in episodes_iter:
-            stats.raw_episodes_processed += 1
-
-            try:
-                # Normalize
-                fn_episode = self.normalizer.normalize(raw_episode)
-                stats.episodes_normalized += 1
-
-                # Validate
-                if self.config.validate_episodes:
-                    result = self.validator.validate(fn_episode)
-                    stats.episodes_validated += 1
-                    validation_results.append(result)
-
-                    if result.valid:
-                        stats.episodes_passed += 1
-                    else:
-                        stats.episodes_failed += 1
-                        if not self.config.demo_mode:
-                            # In production, skip invalid episodes
-                            continue
-
-                # Generate Q&A
-                qa_pairs = []
-                if self.config.generate_qa:
-                    qa_pairs = self.qa_generator.generate(fn_episode)
-                    stats.qa_pairs_generated += len(qa_pairs)
+        num_workers = self.config.num_workers
+        if num_workers <= 0:
+            num_workers = os.cpu_count() or 1
 
-                # Save
-                qa_dicts = [qa.to_dict() for qa in qa_pairs]
-                self.storage.save_episode(fn_episode, qa_pairs=qa_dicts)
-                stats.episodes_saved += 1
+        digests = _DigestRegistry()
+        planned = self._plan_episodes(episodes_iter, manifest, stats, digests)
+        if num_workers == 1:
+            outcomes = self._iter_serial_outcomes(planned)
+        else:
+            outcomes = self._iter_parallel_outcomes(planned, num_workers)
 
-                processed_episodes.append(fn_episode)
-
-            except Exception as e:
-                logger.warning(f"Error processing episode {raw_episode.raw_id}: {e}")
-                stats.errors.append(f"{raw_episode.raw_id}: {e}")
+        try:
+            for outcome in outcomes:
+                self._merge_outcome(
+                    stats, outcome, run_validation, report_accumulator, manifest, digests
+                )
+        finally:
+            self.storage.flush()
+            manifest.close()
+
+        if stats.files_skipped or stats.episodes_skipped:
+            logger.info(
+                f"Resumed from manifest: skipped {stats.files_skipped} unchanged "
+                f"files and {stats.episodes_skipped} unchanged episodes"
+            )
 
         # Compute aggregate metrics
-        if validation_results:
-            stats.avg_sensor_completeness = sum(
-                r.sensor_completeness for r in validation_results
-            ) / len(validation_results)
-            stats.avg_label_confidence = sum(
-                r.label_confidence for r in validation_results
-            ) / len(validation_results)
-            stats.avg_quality_score = sum(
-                r.overall_quality_score for r in validation_results
-            ) / len(validation_results)
+        stats.avg_sensor_completeness = run_validation.avg_sensor_completeness
+        stats.avg_label_confidence = run_validation.avg_label_confidence
+        stats.avg_quality_score = run_validation.avg_quality_score
 
         # Generate and save validation report
-        if self.config.validate_episodes and processed_episodes:
-            report = self.report_generator.generate_report(
-                processed_episodes,
-                adapter.metadata.name,
-            )
+        if self.config.validate_episodes and report_accumulator.total_episodes:
+            self._merge_previous_report(report_accumulator)
+            report = report_accumulator.to_report()
             self.storage.save_validation_report(
                 report.to_dict(),
                 adapter.metadata.name,
@@ -316,6 +541,362 @@ class DataPipeline:
 
         return stats
 
+    def _plan_episodes(
+        self,
+        episodes: Iterable[RawEpisode],
+        manifest: ProcessingManifest,
+        stats: PipelineStats,
+        digests: _DigestRegistry,
+    ) -> Iterator[Tuple[RawEpisode, str, str]]:
+        """Assign episode IDs and drop episodes that are already up to date.
+
+        Episodes seen in a previous run keep their episode ID, so a modified
+        episode overwrites its old output instead of creating a new one.
+
+        With ``PipelineConfig.deduplicate``, episodes whose sensor data is an
+        exact copy of an episode saved earlier (in this run or a previous
+        one) or still being processed are dropped here, before any features
+        are computed. Digests only count as saved once ``_merge_outcome``
+        settles them.
+
+        Args:
+            episodes: Raw episodes from the adapter
+            manifest: Manifest of previous runs
+            stats: Stats to count skipped episodes in
+            digests: Registry of content digests, seeded here from the manifest
+
+        Yields:
+            Tuples of (raw_episode, episode_id, checksum) to process
+        """
+        full_checksums = self.config.checksum_mode == "full"
+        if self.config.deduplicate:
+            digests.saved.update(manifest.digests())
+
+        for raw_episode in episodes:
+            source_path = raw_episode.source_path or raw_episode.source_file
+            key = (source_path, raw_episode.raw_id)
+            checksum = raw_episode.compute_checksum(mode=self.config.checksum_mode)
+
+            previous = manifest.lookup(*key)
+            if previous and previous.saved and previous.checksum == checksum:
+                stats.episodes_skipped += 1
+                manifest.resolve(source_path)
+                continue
+
+            if self.config.deduplicate:
+                digest = checksum if full_checksums else raw_episode.content_digest()
+                original = digests.original(digest)
+                if original is not None and original != key:
+                    logger.debug(
+                        f"Dropping {source_path}:{raw_episode.raw_id}, duplicate of "
+                        f"{original[0]}:{original[1]}"
+                    )
+                    stats.episodes_duplicate += 1
+                    if not digests.hold_duplicate(
+                        digest, source_path, raw_episode.raw_id, checksum
+                    ):
+                        manifest.resolve(source_path)
+                    continue
+                digests.claim(key, digest)
+
+            if previous:
+                episode_id = previous.episode_id
+            else:
+                episode_id = self.normalizer.generate_episode_id(raw_episode)
+
+            yield raw_episode, episode_id, checksum
+
+    def _process_episode(
+        self,
+        raw_episode: RawEpisode,
+        episode_id: Optional[str] = None,
+        checksum: Optional[str] = None,
+    ) -> EpisodeOutcome:
+        """Run normalize → validate → QA → save for one raw episode.
+
+        Args:
+            raw_episode: Episode produced by an adapter
+            episode_id: Optional explicit episode ID
+            checksum: Optional RawEpisode checksum to carry into the outcome
+
+        Returns:
+            EpisodeOutcome describing which stages succeeded
+        """
+        outcome = EpisodeOutcome(
+            raw_id=raw_episode.raw_id,
+            episode_id=episode_id,
+            source_path=raw_episode.source_path or raw_episode.source_file,
+            checksum=checksum,
+        )
+
+        try:
+            # Normalize
+            fn_episode = self.normalizer.normalize(raw_episode, episode_id=episode_id)
+            outcome.episode_id = fn_episode.episode_id
+            outcome.normalized = True
+
+            # Validate
+            if self.config.validate_episodes:
+                result = self.validator.validate(fn_episode)
+                outcome.validation = result
+
+                if not result.valid and not self.config.demo_mode:
+                    # In production, skip invalid episodes
+                    return outcome
+
+            # Generate Q&A
+            qa_pairs = []
+            if self.config.generate_qa:
+                qa_pairs = self.qa_generator.generate(fn_episode)
+                outcome.qa_pairs_generated = len(qa_pairs)
+
+            # Save
+            qa_dicts = [qa.to_dict() for qa in qa_pairs]
+            self.storage.save_episode(fn_episode, qa_pairs=qa_dicts)
+            outcome.saved = True
+
+        except Exception as e:
+            logger.warning(f"Error processing episode {raw_episode.raw_id}: {e}")
+            outcome.error = f"{raw_episode.raw_id}: {e}"
+
+        return outcome
+
+    def _flush_storage(self, outcomes: List[EpisodeOutcome]) -> None:
+        """Write out buffered episodes, failing the outcomes if that fails.
+
+        Args:
+            outcomes: Outcomes whose saved episodes may still be buffered
+        """
+        try:
+            self.storage.flush()
+        except Exception as e:
+            logger.warning(f"Error writing buffered episodes: {e}")
+            for outcome in outcomes:
+                if outcome.saved:
+                    outcome.saved = False
+                    outcome.error = f"{outcome.raw_id}: {e}"
+
+    def _iter_serial_outcomes(
+        self,
+        episodes: Iterable[Tuple[RawEpisode, str, str]],
+    ) -> Iterator[EpisodeOutcome]:
+        """Process episodes in-process, yielding outcomes once they are on disk.
+
+        Sharded storage buffers episodes until a shard is full, so outcomes
+        are held back until the buffer has been written; the manifest then
+        never records an episode whose data could still be lost.
+
+        Args:
+            episodes: Planned (raw_episode, episode_id, checksum) tuples
+
+        Yields:
+            EpisodeOutcome for each episode, in the order received
+        """
+        held: List[EpisodeOutcome] = []
+        for raw_episode, episode_id, checksum in episodes:
+            held.append(self._process_episode(raw_episode, episode_id, checksum))
+            if not self.storage.num_buffered_episodes:
+                yield from held
+                held = []
+
+        self._flush_storage(held)
+        yield from held
+
+    def _iter_parallel_outcomes(
+        self,
+        episodes: Iterable[Tuple[RawEpisode, str, str]],
+        num_workers: int,
+    ) -> Iterator[EpisodeOutcome]:
+        """Process episodes in a process pool, yielding outcomes in input order.
+
+        Episode IDs are assigned by the parent, in adapter order, before
+        submission, so they do not depend on worker scheduling. Episodes are
+        sent in batches of ``max_pending_per_worker // 2``, at most two per
+        worker in flight, which keeps memory proportional to ``num_workers``.
+
+        If a worker process dies, every batch in flight fails with the pool.
+        Their episodes are then retried one at a time in a fresh pool; an
+        episode that kills its worker again gets an error outcome, which
+        leaves its source file incomplete in the manifest.
+
+        Args:
+            episodes: Planned (raw_episode, episode_id, checksum) tuples
+            num_workers: Number of worker processes
+
+        Yields:
+            EpisodeOutcome for each episode, in the order received
+        """
+        batch_size = max(1, self.config.max_pending_per_worker // 2)
+        max_pending = 2 * num_workers
+        batches = _iter_batches(episodes, batch_size)
+        # (future, batch); the future is None if the pool broke on submit
+        pending: Deque[Tuple[Optional[Future], List[Tuple[RawEpisode, str, str]]]] = deque()
+        executor = self._start_worker_pool(num_workers)
+
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    batch = next(batches, None)
+                    if batch is None:
+                        exhausted = True
+                        break
+                    try:
+                        future: Optional[Future] = executor.submit(_process_batch_in_worker, batch)
+                    except BrokenExecutor:
+                        future = None
+                    pending.append((future, batch))
+                if not pending:
+                    break
+
+                future, batch = pending[0]
+                try:
+                    if future is None:
+                        raise BrokenExecutor("worker pool is broken")
+                    outcomes = future.result()
+                except BrokenExecutor as e:
+                    logger.warning(f"Worker process died ({e}); retrying episodes in flight")
+                    # Shutting down waits until every future of the pool is resolved
+                    executor.shutdown(wait=True)
+                    executor = self._start_worker_pool(num_workers)
+                    lost = list(pending)
+                    pending.clear()
+                    for lost_future, lost_batch in lost:
+                        if lost_future is not None and lost_future.exception() is None:
+                            yield from lost_future.result()
+                            continue
+                        for item in lost_batch:
+                            outcome, executor = self._retry_in_worker(item, executor, num_workers)
+                            yield outcome
+                    continue
+
+                pending.popleft()
+                yield from outcomes
+        finally:
+            for future, _ in pending:
+                if future is not None:
+                    future.cancel()
+            executor.shutdown(wait=True)
+
+    def _start_worker_pool(self, num_workers: int) -> ProcessPoolExecutor:
+        """Start a process pool whose workers build their own pipeline."""
+        return ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(self.config,),
+        )
+
+    def _retry_in_worker(
+        self,
+        item: Tuple[RawEpisode, str, str],
+        executor: ProcessPoolExecutor,
+        num_workers: int,
+    ) -> Tuple[EpisodeOutcome, ProcessPoolExecutor]:
+        """Process a single episode on its own after the pool broke.
+
+        Args:
+            item: Planned (raw_episode, episode_id, checksum) tuple
+            executor: Pool to run it in
+            num_workers: Number of worker processes of a replacement pool
+
+        Returns:
+            The episode's outcome and the pool to use from now on, which is
+            a new one if the episode killed its worker again
+        """
+        raw_episode, episode_id, checksum = item
+        try:
+            return executor.submit(_process_batch_in_worker, [item]).result()[0], executor
+        except BrokenExecutor as e:
+            logger.warning(f"Episode {raw_episode.raw_id} killed its worker process: {e}")
+            executor.shutdown(wait=True)
+            outcome = EpisodeOutcome(
+                raw_id=raw_episode.raw_id,
+                episode_id=episode_id,
+                source_path=raw_episode.source_path or raw_episode.source_file,
+                checksum=checksum,
+                error=f"{raw_episode.raw_id}: worker process died ({e})",
+            )
+            return outcome, self._start_worker_pool(num_workers)
+
+    def _merge_previous_report(self, accumulator: ValidationReportAccumulator) -> None:
+        """Carry over entries of the saved report for episodes this run kept.
+
+        A resumed run only validates new or modified episodes, so entries of
+        the previous report are added back for episodes that are still
+        stored and were not re-validated here.
+
+        Args:
+            accumulator: Accumulator holding this run's saved episodes
+        """
+        dataset_name = accumulator.dataset_name
+        previous = self.storage.load_validation_report(dataset_name)
+        if previous is None:
+            return
+
+        current_ids = {summary.episode_id for summary in accumulator.episode_summaries}
+        for entry in previous.get("episode_results", []):
+            episode_id = entry["episode_id"]
+            if episode_id in current_ids:
+                continue
+            if not self.storage.has_episode(dataset_name, episode_id):
+                continue
+            accumulator.add_summary(EpisodeValidationSummary.from_dict(entry))
+
+    @staticmethod
+    def _merge_outcome(
+        stats: PipelineStats,
+        outcome: EpisodeOutcome,
+        run_validation: ValidationReportAccumulator,
+        report_accumulator: ValidationReportAccumulator,
+        manifest: ProcessingManifest,
+        digests: _DigestRegistry,
+    ) -> None:
+        """Fold a single episode outcome into the run statistics and manifest."""
+        stats.raw_episodes_processed += 1
+
+        if outcome.normalized:
+            stats.episodes_normalized += 1
+
+        if outcome.validation is not None:
+            stats.episodes_validated += 1
+            run_validation.add(outcome.validation)
+            if outcome.validation.valid:
+                stats.episodes_passed += 1
+            else:
+                stats.episodes_failed += 1
+
+        stats.qa_pairs_generated += outcome.qa_pairs_generated
+
+        if outcome.saved:
+            stats.episodes_saved += 1
+            if outcome.validation is not None:
+                report_accumulator.add(outcome.validation)
+
+        if outcome.error:
+            stats.errors.append(outcome.error)
+
+        if outcome.source_path:
+            digest, duplicates = digests.settle(
+                (outcome.source_path, outcome.raw_id), outcome.saved
+            )
+            manifest.record_episode(
+                outcome.source_path,
+                outcome.raw_id,
+                outcome.checksum,
+                outcome.episode_id,
+                saved=outcome.saved,
+                failed=outcome.error is not None,
+                digest=digest,
+            )
+            for source_path, raw_id, checksum in duplicates:
+                if outcome.error is None:
+                    manifest.resolve(source_path)
+                else:
+                    # Nothing was kept for this data; retry the copy next run
+                    manifest.record_episode(
+                        source_path, raw_id, checksum, None, saved=False, failed=True
+                    )
+
     def _log_summary(self, stats: PipelineStats) -> None:
         """Log processing summary."""
         logger.info("=" * 50)
@@ -326,6 +907,12 @@ class DataPipeline:
         logger.info(f"Episodes passed validation: {stats.episodes_passed}")
         logger.info(f"Episodes failed validation: {stats.episodes_failed}")
         logger.info(f"Episodes saved: {stats.episodes_saved}")
+        if stats.episodes_duplicate:
+            logger.info(f"Episodes dropped (duplicate data): {stats.episodes_duplicate}")
+
+        if stats.files_skipped or stats.episodes_skipped:
+            logger.info(f"Files skipped (unchanged): {stats.files_skipped}")
+            logger.info(f"Episodes skipped (unchanged): {stats.episodes_skipped}")
         logger.info(f"Q&A pairs generated: {stats.qa_pairs_generated}")
         logger.info(f"Pass rate: {stats.pass_rate:.1f}%")
 
@@ -341,6 +928,7 @@ def run_pipeline(
     output_dir: str = "./factorynet_data",
     demo_mode: bool = False,
     demo_limit: int = 10,
+    num_workers: int = 1,
 ) -> Dict[str, PipelineStats]:
     """Convenience function to run pipeline for multiple datasets.
 
@@ -350,6 +938,7 @@ def run_pipeline(
         output_dir: Output directory
         demo_mode: Enable demo mode
         demo_limit: Episode limit in demo mode
+        num_workers: Worker processes (1 = in-process, 0 = all cores)
 
     Returns:
         Dictionary mapping dataset names to PipelineStats
@@ -358,6 +947,7 @@ def run_pipeline(
         output_dir=output_dir,
         demo_mode=demo_mode,
         demo_limit=demo_limit,
+        num_workers=num_workers,
     )
 
     pipeline = DataPipeline(config=config)
@@ -0,0 +1,780 @@
+"""Sharded Parquet storage backend for FactoryNet episodes.
+
+Instead of one directory with several small files per episode, episodes
+are buffered and appended to row-group-sized Parquet shards, with
+metadata, features and Q&A pairs in sibling columnar tables.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from core.catalog import CatalogEntry
+from core.normalizer import FactoryNetEpisode
+from core.storage import (
+    EpisodeStorage,
+    _feature_tracks_from_table,
+    _feature_tracks_to_table,
+    _json_serializer,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pc = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Sibling tables written for every shard
+SHARD_TABLES = ("timeseries", "metadata", "features", "qa_pairs", "feature_tracks")
+
+# Tables written with one row group per episode (the others are small)
+_PER_EPISODE_TABLES = ("timeseries", "feature_tracks")
+
+# Age after which a metadata directory mtime is trusted to reflect all shards
+_MTIME_SETTLE_NS = 1_000_000_000
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    """Cast a numeric column value to float like the SQLite REAL columns."""
+    return None if value is None else float(value)
+
+
+@dataclass
+class _ShardBuffer:
+    """Episodes of one dataset waiting to be written as a shard."""
+    timeseries: Dict[str, list] = field(default_factory=lambda: {
+        "episode_id": [],
+        "channel": [],
+        "sampling_rate_hz": [],
+        "values": [],
+    })
+    metadata: List[Dict[str, Any]] = field(default_factory=list)
+    features: List[Dict[str, Any]] = field(default_factory=list)
+    qa_pairs: List[Dict[str, Any]] = field(default_factory=list)
+    feature_tracks: List[pa.Table] = field(default_factory=list)
+    episode_ids: List[str] = field(default_factory=list)
+    nbytes: int = 0
+
+
+@dataclass
+class _ShardIndex:
+    """episode_id -> shard mapping built from a dataset's metadata shards."""
+    shards: Dict[str, str] = field(default_factory=dict)
+    files: List[str] = field(default_factory=list)
+    dir_mtime_ns: Optional[int] = None
+
+
+class ShardedEpisodeStorage(EpisodeStorage):
+    """Stores episodes in row-group-sized Parquet shards.
+
+    Directory structure:
+        factorynet_data/
+        └── episodes/
+            └── sharded/
+                └── {dataset_name}/
+                    ├── timeseries/part-{writer}-{seq}.parquet
+                    ├── metadata/part-{writer}-{seq}.parquet
+                    ├── features/part-{writer}-{seq}.parquet
+                    ├── qa_pairs/part-{writer}-{seq}.parquet
+                    └── feature_tracks/part-{writer}-{seq}.parquet
+
+    The timeseries table has one row per (episode, channel) with the
+    samples in a float32 list column, so episodes with different channel
+    sets share a schema. Every shard is a complete Parquet file written
+    in one go once the buffered data reaches ``row_group_bytes``; each
+    writer uses its own file prefix, so several processes can save into
+    the same dataset concurrently. If an episode ID is saved again, the
+    copy in the most recent shard is the one returned. Call ``flush()`` (or ``close()``) to
+    write out a partially filled buffer. Shard files are written under a
+    temporary name and renamed into place, and the episode index is
+    refreshed whenever the metadata directory changes, so a reader sees
+    shards written by other processes after it was opened.
+
+    Timeseries and feature tracks are written with one row group per
+    episode, so loading an episode decodes only its own row groups,
+    located through the ``episode_id`` column statistics.
+
+    Episodes are addressed like in ``EpisodeStorage`` by a path,
+    ``episodes/sharded/{dataset_name}/{episode_id}``, which names the
+    episode inside the dataset's shards rather than a directory on disk.
+    ``list_episodes`` returns such paths and ``load_episode`` accepts
+    them; ``load_episode_by_id`` takes the ID and dataset name directly.
+
+    Example:
+        storage = ShardedEpisodeStorage(base_dir="./factorynet_data")
+        storage.save_episode(episode, qa_pairs)
+        storage.flush()
+        data = storage.load_episode_by_id("FN-ADAPTED-000001", "cwru_bearing")
+    """
+
+    def __init__(
+        self,
+        base_dir: str | Path,
+        row_group_bytes: int = 64 * 1024 * 1024,
+        compression: str = "snappy",
+    ):
+        """Initialize storage.
+
+        Args:
+            base_dir: Base directory for data storage
+            row_group_bytes: Buffered sample bytes that trigger a shard write
+            compression: Parquet compression codec
+        """
+        if pa is None:
+            raise ImportError(
+                "pyarrow is required for sharded storage. Install with: pip install pyarrow"
+            )
+
+        # The metadata table doubles as the catalog of this backend
+        super().__init__(base_dir, use_parquet=True, use_catalog=False)
+        self.row_group_bytes = row_group_bytes
+        self.compression = compression
+
+        # Time-ordered writer prefix: shards sort in write order, so when an
+        # episode is rewritten by a later run its newest copy wins
+        self._writer_id = f"{time.time_ns():016x}-{os.getpid():x}-{uuid.uuid4().hex[:6]}"
+        self._shard_seq = 0
+        self._buffers: Dict[str, _ShardBuffer] = {}
+
+        # episode_id -> shard file name, loaded lazily per dataset
+        self._index: Dict[str, _ShardIndex] = {}
+
+    def _setup_directories(self) -> None:
+        """Create base directory structure."""
+        super()._setup_directories()
+        (self.base_dir / "episodes" / "sharded").mkdir(parents=True, exist_ok=True)
+
+    def get_dataset_dir(self, dataset_name: str) -> Path:
+        """Get the shard directory of a dataset.
+
+        Args:
+            dataset_name: Name of dataset
+
+        Returns:
+            Path to the dataset's shard directory
+        """
+        return self.base_dir / "episodes" / "sharded" / dataset_name
+
+    def get_episode_dir(
+        self,
+        episode: FactoryNetEpisode,
+    ) -> Path:
+        """Get the path that addresses an episode in the shards.
+
+        Args:
+            episode: Episode to get the path for
+
+        Returns:
+            Episode path accepted by ``load_episode`` (not a directory)
+        """
+        return self.get_dataset_dir(episode.source_dataset) / episode.episode_id
+
+    def save_episode(
+        self,
+        episode: FactoryNetEpisode,
+        qa_pairs: Optional[List[Dict[str, Any]]] = None,
+    ) -> Path:
+        """Buffer an episode for the next shard of its dataset.
+
+        Args:
+            episode: Episode to save
+            qa_pairs: Optional Q&A pairs to save
+
+        Returns:
+            Episode path accepted by ``load_episode``
+        """
+        dataset_name = episode.source_dataset
+        buffer = self._buffers.setdefault(dataset_name, _ShardBuffer())
+
+        episode_nbytes = 0
+        ts = buffer.timeseries
+        for channel, values in zip(episode.channel_names, episode.signals):
+            samples = np.asarray(values, dtype=np.float32)
+            ts["episode_id"].append(episode.episode_id)
+            ts["channel"].append(channel)
+            ts["sampling_rate_hz"].append(episode.sampling_rate_hz)
+            ts["values"].append(samples)
+            episode_nbytes += samples.nbytes
+
+        tracks = None
+        if episode.feature_tracks:
+            tracks = _feature_tracks_to_table(episode.feature_tracks, episode.episode_id)
+            episode_nbytes += tracks.nbytes
+
+        metadata = episode.to_metadata_dict()
+        priors = None
+        if episode.semantic_priors:
+            priors = self._semantic_priors_dict(episode.semantic_priors)
+
+        buffer.metadata.append({
+            "episode_id": episode.episode_id,
+            "source_dataset": dataset_name,
+            "source_file": episode.source_file,
+            "state_synset": episode.state_annotation.state_synset,
+            "state_label": episode.state_annotation.state_label,
+            "severity": episode.state_annotation.severity,
+            "rpm": episode.rpm,
+            "load_hp": episode.load_hp,
+            "sampling_rate_hz": episode.sampling_rate_hz,
+            "num_timesteps": episode.num_timesteps,
+            "num_channels": len(episode.channel_names),
+            # Uncompressed; shards are shared, so there is no per-episode file size
+            "byte_size": episode_nbytes,
+            "metadata_json": json.dumps(metadata, default=_json_serializer),
+            "semantic_priors_json": (
+                json.dumps(priors, default=_json_serializer) if priors else None
+            ),
+        })
+
+        for channel, feats in episode.to_features_dict().items():
+            row = {"episode_id": episode.episode_id, "channel": channel}
+            row.update(feats)
+            buffer.features.append(row)
+
+        for qa in qa_pairs or []:
+            row = {"episode_id": episode.episode_id}
+            row.update(qa)
+            buffer.qa_pairs.append(row)
+
+        if tracks is not None:
+            buffer.feature_tracks.append(tracks)
+
+        buffer.episode_ids.append(episode.episode_id)
+        buffer.nbytes += episode_nbytes
+
+        if buffer.nbytes >= self.row_group_bytes:
+            self._write_shard(dataset_name)
+
+        return self.get_episode_dir(episode)
+
+    @property
+    def num_buffered_episodes(self) -> int:
+        """Episodes saved but not yet written to a shard."""
+        return sum(len(buffer.episode_ids) for buffer in self._buffers.values())
+
+    def flush(self) -> None:
+        """Write all buffered episodes to new shards."""
+        for dataset_name in list(self._buffers):
+            self._write_shard(dataset_name)
+
+    def _write_shard(self, dataset_name: str) -> None:
+        """Write the buffer of a dataset as one shard per table."""
+        buffer = self._buffers.pop(dataset_name, None)
+        if buffer is None or not buffer.episode_ids:
+            return
+
+        shard_name = f"part-{self._writer_id}-{self._shard_seq:05d}.parquet"
+        self._shard_seq += 1
+
+        for row in buffer.metadata:
+            row["shard"] = shard_name
+
+        tables = {
+            "timeseries": self._build_timeseries_table(buffer.timeseries),
+            "metadata": pa.Table.from_pylist(buffer.metadata),
+            "features": pa.Table.from_pylist(buffer.features) if buffer.features else None,
+            "qa_pairs": pa.Table.from_pylist(buffer.qa_pairs) if buffer.qa_pairs else None,
+            "feature_tracks": (
+                pa.concat_tables(buffer.feature_tracks, promote_options="default")
+                if buffer.feature_tracks else None
+            ),
+        }
+
+        dataset_dir = self.get_dataset_dir(dataset_name)
+        # Metadata is written last so the index never points at a missing shard
+        for table_name in ("timeseries", "features", "qa_pairs", "feature_tracks", "metadata"):
+            table = tables[table_name]
+            if table is None:
+                continue
+            table_dir = dataset_dir / table_name
+            table_dir.mkdir(parents=True, exist_ok=True)
+            # Readers glob part-*.parquet, so they never see a partial file
+            tmp_path = table_dir / f".{shard_name}.tmp"
+            if table_name in _PER_EPISODE_TABLES:
+                self._write_per_episode(table, tmp_path)
+            else:
+                pq.write_table(
+                    table,
+                    tmp_path,
+                    row_group_size=max(1, table.num_rows),
+                    compression=self.compression,
+                )
+            os.replace(tmp_path, table_dir / shard_name)
+
+        logger.debug(
+            f"Wrote shard {shard_name} with {len(buffer.episode_ids)} episodes "
+            f"({buffer.nbytes / (1024 * 1024):.1f} MB) to {dataset_dir}"
+        )
+
+    def _write_per_episode(self, table: pa.Table, path: Path) -> None:
+        """Write a table with one row group per run of equal episode IDs."""
+        episode_ids = table.column("episode_id").to_numpy(zero_copy_only=False)
+        boundaries = np.flatnonzero(episode_ids[1:] != episode_ids[:-1]) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [len(episode_ids)]))
+
+        with pq.ParquetWriter(path, table.schema, compression=self.compression) as writer:
+            for start, end in zip(starts, ends):
+                rows = table.slice(int(start), int(end - start))
+                writer.write_table(rows, row_group_size=rows.num_rows)
+
+    @staticmethod
+    def _build_timeseries_table(columns: Dict[str, list]) -> pa.Table:
+        """Build the (episode, channel) -> samples table from buffered arrays."""
+        arrays = columns["values"]
+        lengths = np.fromiter((len(a) for a in arrays), dtype=np.int64, count=len(arrays))
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        flat = np.concatenate(arrays) if arrays else np.empty(0, dtype=np.float32)
+        values = pa.LargeListArray.from_arrays(pa.array(offsets), pa.array(flat))
+
+        return pa.table({
+            "episode_id": pa.array(columns["episode_id"], type=pa.string()),
+            "channel": pa.array(columns["channel"], type=pa.string()),
+            "sampling_rate_hz": pa.array(columns["sampling_rate_hz"], type=pa.float64()),
+            "num_samples": pa.array(lengths, type=pa.int64()),
+            "values": values,
+        })
+
+    def _table_files(self, dataset_name: str, table_name: str) -> List[Path]:
+        """List shard files of a table in write order."""
+        table_dir = self.get_dataset_dir(dataset_name) / table_name
+        if not table_dir.exists():
+            return []
+        return sorted(table_dir.glob("part-*.parquet"))
+
+    def _read_table(
+        self,
+        dataset_name: str,
+        table_name: str,
+        columns: Optional[List[str]] = None,
+    ) -> Optional[pa.Table]:
+        """Read all shards of a table, or None if there are none."""
+        files = self._table_files(dataset_name, table_name)
+        if not files:
+            return None
+        tables = [pq.read_table(f, columns=columns) for f in files]
+        return pa.concat_tables(tables, promote_options="default")
+
+    def _get_index(self, dataset_name: str) -> Dict[str, str]:
+        """Get the episode_id -> shard mapping of a dataset.
+
+        The mapping is cached and refreshed when the metadata directory
+        changes, e.g. because this or another process wrote a shard. Shards
+        are never modified once renamed into place, so new shards that sort
+        after all indexed ones are read incrementally; anything else
+        (removed shards, or a writer with an older prefix finishing late)
+        rebuilds the mapping so the newest copy of an episode still wins.
+        """
+        metadata_dir = self.get_dataset_dir(dataset_name) / "metadata"
+        try:
+            # Taken before listing, so a shard added meanwhile changes it again
+            dir_mtime_ns: Optional[int] = metadata_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime_ns = None
+
+        index = self._index.get(dataset_name)
+        if index is not None and index.dir_mtime_ns == dir_mtime_ns:
+            return index.shards
+
+        files = [path.name for path in self._table_files(dataset_name, "metadata")]
+        if index is None or files[:len(index.files)] != index.files:
+            index = _ShardIndex()
+        new_files = files[len(index.files):]
+
+        for name in new_files:
+            table = pq.read_table(metadata_dir / name, columns=["episode_id", "shard"])
+            index.shards.update(zip(
+                table.column("episode_id").to_pylist(),
+                table.column("shard").to_pylist(),
+            ))
+        index.files = files
+        # A shard renamed within the same timestamp tick as the listing would
+        # leave the mtime unchanged, so only trust mtimes that have settled
+        settled = (
+            dir_mtime_ns is not None
+            and time.time_ns() - dir_mtime_ns > _MTIME_SETTLE_NS
+        )
+        index.dir_mtime_ns = dir_mtime_ns if settled else -1
+        self._index[dataset_name] = index
+        return index.shards
+
+    def has_episode(self, dataset_name: str, episode_id: str) -> bool:
+        """Check whether an episode has been saved (written or buffered)."""
+        buffer = self._buffers.get(dataset_name)
+        if buffer is not None and episode_id in buffer.episode_ids:
+            return True
+        return episode_id in self._get_index(dataset_name)
+
+    def load_episode(
+        self,
+        episode_path: str | Path,
+        channels: Optional[Sequence[str]] = None,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Load an episode by its path.
+
+        Args:
+            episode_path: Episode path from ``list_episodes`` or
+                ``save_episode`` (``.../sharded/{dataset_name}/{episode_id}``)
+            channels: Optional channel names to load (default: all)
+            start: First sample to load (default: 0)
+            stop: End sample, exclusive (default: end of episode)
+
+        Returns:
+            Dictionary with episode data in the same layout as
+            EpisodeStorage.load_episode
+
+        Raises:
+            KeyError: If the episode is not in the store
+        """
+        episode_path = Path(episode_path)
+        return self.load_episode_by_id(
+            episode_path.name,
+            episode_path.parent.name,
+            channels=channels,
+            start=start,
+            stop=stop,
+        )
+
+    def load_episode_by_id(
+        self,
+        episode_id: str,
+        dataset_name: str,
+        channels: Optional[Sequence[str]] = None,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Load a single episode by ID.
+
+        Args:
+            episode_id: Episode ID to load
+            dataset_name: Dataset the episode belongs to
+            channels: Optional channel names to load (default: all)
+            start: First sample to load (default: 0)
+            stop: End sample, exclusive (default: end of episode)
+
+        Returns:
+            Dictionary with episode data in the same layout as
+            EpisodeStorage.load_episode
+
+        Raises:
+            KeyError: If the episode is not in the store
+        """
+        buffer = self._buffers.get(dataset_name)
+        if buffer is not None and episode_id in buffer.episode_ids:
+            self._write_shard(dataset_name)
+
+        shard_name = self._get_index(dataset_name).get(episode_id)
+        if shard_name is None:
+            raise KeyError(f"Episode {episode_id} not found in {dataset_name}")
+
+        dataset_dir = self.get_dataset_dir(dataset_name)
+        id_filter = [("episode_id", "=", episode_id)]
+        result: Dict[str, Any] = {}
+
+        metadata = pq.read_table(
+            dataset_dir / "metadata" / shard_name, filters=id_filter
+        ).to_pylist()
+        if metadata:
+            result["metadata"] = json.loads(metadata[0]["metadata_json"])
+            if metadata[0].get("semantic_priors_json"):
+                result["semantic_priors"] = json.loads(metadata[0]["semantic_priors_json"])
+
+        ts = self._read_episode_rows(dataset_dir / "timeseries" / shard_name, episode_id)
+        if channels is not None:
+            ts = ts.filter(pc.is_in(ts.column("channel"), pa.array(list(channels))))
+        if ts.num_rows:
+            result["timeseries"] = self._timeseries_to_dict(ts, start, stop)
+
+        features_path = dataset_dir / "features" / shard_name
+        if features_path.exists():
+            rows = pq.read_table(features_path, filters=id_filter).to_pylist()
+            if rows:
+                result["features"] = {
+                    row.pop("channel"): {k: v for k, v in row.items() if k != "episode_id"}
+                    for row in rows
+                }
+
+        qa_path = dataset_dir / "qa_pairs" / shard_name
+        if qa_path.exists():
+            rows = pq.read_table(qa_path, filters=id_filter).to_pylist()
+            if rows:
+                result["qa_pairs"] = [
+                    {k: v for k, v in row.items() if k != "episode_id"} for row in rows
+                ]
+
+        tracks_path = dataset_dir / "feature_tracks" / shard_name
+        if tracks_path.exists():
+            table = self._read_episode_rows(tracks_path, episode_id)
+            if table.num_rows:
+                result["feature_tracks"] = _feature_tracks_from_table(table)
+
+        return result
+
+    @staticmethod
+    def _read_episode_rows(path: Path, episode_id: str) -> pa.Table:
+        """Read the rows of one episode, decoding only its row groups.
+
+        Row groups are selected by the min/max statistics of the
+        ``episode_id`` column; groups without statistics are always read.
+        """
+        parquet_file = pq.ParquetFile(path)
+        file_meta = parquet_file.metadata
+        id_column = parquet_file.schema_arrow.get_field_index("episode_id")
+
+        row_groups = []
+        for i in range(file_meta.num_row_groups):
+            stats = file_meta.row_group(i).column(id_column).statistics
+            if stats is None or not stats.has_min_max or stats.min <= episode_id <= stats.max:
+                row_groups.append(i)
+
+        table = parquet_file.read_row_groups(row_groups)
+        return table.filter(pc.equal(table.column("episode_id"), episode_id))
+
+    @staticmethod
+    def _timeseries_to_dict(
+        table: pa.Table,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Convert the channel rows of one episode to NumPy columns."""
+        channels = table.column("channel").to_pylist()
+        rates = table.column("sampling_rate_hz").to_pylist()
+        values = table.column("values").combine_chunks()
+        offsets = values.offsets.to_numpy()
+        flat = values.values.to_numpy(zero_copy_only=False)
+
+        num_samples = int(offsets[1] - offsets[0])
+        start, stop, _ = slice(start, stop).indices(num_samples)
+        stop = max(start, stop)
+        dt = 1.0 / rates[0] if rates[0] else 0.0
+
+        step_index = np.arange(start, stop, dtype=np.int64)
+        data: Dict[str, np.ndarray] = {
+            "step_index": step_index,
+            "timestamp_offset": step_index * dt,
+        }
+        for row, channel in enumerate(channels):
+            row_start = offsets[row]
+            data[channel] = flat[row_start + start:row_start + stop]
+        return data
+
+    def iter_timeseries(
+        self,
+        dataset_name: str,
+        channels: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream all episodes of a dataset, one shard at a time.
+
+        Each shard is read with a single sequential scan, so an epoch over
+        the dataset touches every file exactly once. Superseded copies of
+        rewritten episodes are skipped.
+
+        Args:
+            dataset_name: Name of dataset
+            channels: Optional subset of channels to return
+
+        Yields:
+            Dictionaries with ``episode_id``, ``sampling_rate_hz`` and
+            ``channels`` (channel name -> float32 ndarray)
+        """
+        index = self._get_index(dataset_name)
+        for path in self._table_files(dataset_name, "timeseries"):
+            table = pq.read_table(path)
+            episode_ids = table.column("episode_id").to_pylist()
+            names = table.column("channel").to_pylist()
+            rates = table.column("sampling_rate_hz").to_pylist()
+            values = table.column("values").combine_chunks()
+            offsets = values.offsets.to_numpy()
+            flat = values.values.to_numpy(zero_copy_only=False)
+
+            current: Optional[Dict[str, Any]] = None
+            for row, (episode_id, name, rate) in enumerate(zip(episode_ids, names, rates)):
+                if index.get(episode_id) != path.name:
+                    continue
+                if current is None or current["episode_id"] != episode_id:
+                    if current is not None:
+                        yield current
+                    current = {
+                        "episode_id": episode_id,
+                        "sampling_rate_hz": rate,
+                        "channels": {},
+                    }
+                if channels is None or name in channels:
+                    current["channels"][name] = flat[offsets[row]:offsets[row + 1]]
+            if current is not None:
+                yield current
+
+    def list_episodes(
+        self,
+        dataset_name: Optional[str] = None,
+    ) -> List[Path]:
+        """List all saved episodes.
+
+        Args:
+            dataset_name: Optional filter by dataset
+
+        Returns:
+            Sorted episode paths (``.../sharded/{dataset_name}/{episode_id}``)
+            accepted by ``load_episode``
+        """
+        if dataset_name:
+            dataset_names = [dataset_name]
+        else:
+            sharded_dir = self.base_dir / "episodes" / "sharded"
+            dataset_names = sorted(d.name for d in sharded_dir.iterdir() if d.is_dir())
+
+        episodes: List[Path] = []
+        for name in dataset_names:
+            dataset_dir = self.get_dataset_dir(name)
+            episodes.extend(dataset_dir / episode_id for episode_id in self._get_index(name))
+        return sorted(episodes)
+
+    def get_dataset_stats(
+        self,
+        dataset_name: str,
+    ) -> Dict[str, Any]:
+        """Get statistics for a dataset.
+
+        Args:
+            dataset_name: Name of dataset
+
+        Returns:
+            Dictionary with dataset statistics
+        """
+        total_size = 0
+        for table_name in SHARD_TABLES:
+            for path in self._table_files(dataset_name, table_name):
+                total_size += path.stat().st_size
+
+        # Latest label per episode (rewritten episodes appear more than once)
+        labels: Dict[str, str] = {}
+        table = self._read_table(
+            dataset_name, "metadata", columns=["episode_id", "state_label"]
+        )
+        if table is not None:
+            labels = dict(zip(
+                table.column("episode_id").to_pylist(),
+                table.column("state_label").to_pylist(),
+            ))
+
+        fault_counts: Dict[str, int] = {}
+        for state in labels.values():
+            state = state or "unknown"
+            fault_counts[state] = fault_counts.get(state, 0) + 1
+        num_episodes = len(labels)
+
+        return {
+            "dataset_name": dataset_name,
+            "num_episodes": num_episodes,
+            "total_size_mb": total_size / (1024 * 1024),
+            "fault_distribution": fault_counts,
+        }
+
+    def query_episodes(
+        self,
+        dataset_name: Optional[str] = None,
+        state_synset: Optional[str] = None,
+        rpm: Optional[float] = None,
+        load_hp: Optional[float] = None,
+        min_severity: Optional[float] = None,
+        max_severity: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find saved episodes by label and operating conditions.
+
+        Answered from the scalar columns of the metadata shards. Rows have
+        the keys and types of ``EpisodeStorage.query_episodes``; ``byte_size``
+        is the uncompressed size of the episode's samples and feature tracks,
+        and ``path`` is the episode path accepted by ``load_episode``.
+
+        Args:
+            dataset_name: Optional filter by dataset
+            state_synset: State synset or synset prefix
+            rpm: Exact rotational speed
+            load_hp: Exact motor load
+            min_severity: Minimum severity (inclusive)
+            max_severity: Maximum severity (inclusive)
+            limit: Maximum number of episodes to return
+
+        Returns:
+            Catalog rows (dataset, episode_id, state, severity, rpm, load,
+            num_samples, num_channels, byte_size, path) of matching episodes
+        """
+        if dataset_name:
+            dataset_names = [dataset_name]
+        else:
+            sharded_dir = self.base_dir / "episodes" / "sharded"
+            dataset_names = sorted(d.name for d in sharded_dir.iterdir() if d.is_dir())
+
+        columns = [
+            "episode_id", "state_synset", "state_label", "severity",
+            "rpm", "load_hp", "num_timesteps", "num_channels", "byte_size",
+        ]
+        results: List[Dict[str, Any]] = []
+        for name in dataset_names:
+            table = self._read_table(name, "metadata", columns=columns)
+            if table is None:
+                continue
+
+            # Keep the latest copy of rewritten episodes
+            latest: Dict[str, Dict[str, Any]] = {}
+            for row in table.to_pylist():
+                latest[row["episode_id"]] = row
+
+            for episode_id in sorted(latest):
+                row = latest[episode_id]
+                synset = row["state_synset"] or ""
+                if state_synset is not None and not (
+                    synset == state_synset or synset.startswith(state_synset + ".")
+                ):
+                    continue
+                if rpm is not None and row["rpm"] != rpm:
+                    continue
+                if load_hp is not None and row["load_hp"] != load_hp:
+                    continue
+                if min_severity is not None and not (
+                    row["severity"] is not None and row["severity"] >= min_severity
+                ):
+                    continue
+                if max_severity is not None and not (
+                    row["severity"] is not None and row["severity"] <= max_severity
+                ):
+                    continue
+
+                entry = CatalogEntry(
+                    dataset=name,
+                    episode_id=episode_id,
+                    state_synset=row["state_synset"],
+                    state_label=row["state_label"],
+                    severity=_optional_float(row["severity"]),
+                    rpm=_optional_float(row["rpm"]),
+                    load_hp=_optional_float(row["load_hp"]),
+                    num_samples=int(row["num_timesteps"] or 0),
+                    num_channels=int(row["num_channels"]),
+                    byte_size=int(row["byte_size"]),
+                    path=(
+                        self.get_dataset_dir(name) / episode_id
+                    ).relative_to(self.base_dir).as_posix(),
+                )
+                results.append(entry.to_dict())
+                if limit is not None and len(results) >= limit:
+                    return results
+
+        return results
@@ -10,14 +10,20 @@ import logging
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np
 
+from core.catalog import CatalogEntry, EpisodeCatalog
+from core.feature_extraction import FeatureTrack
 from core.normalizer import FactoryNetEpisode, SemanticPriors
 
 logger = logging.getLogger(__name__)
 
+# Parquet schema metadata keys describing the implicit time axis
+TIMESERIES_DT_KEY = "factorynet.dt"
+TIMESERIES_NUM_SAMPLES_KEY = "factorynet.num_samples"
+
 
 def _serialize_value(obj: Any) -> Any:
     """Serialize value for JSON."""
@@ -41,45 +47,126 @@ def _json_serializer(obj: Any) -> Any:
     return _serialize_value(obj)
 
 
+def _feature_tracks_to_table(
+    tracks: Dict[str, FeatureTrack],
+    episode_id: Optional[str] = None,
+) -> Any:
+    """Build a long-format table with one row per (channel, window).
+
+    Args:
+        tracks: Feature tracks keyed by channel name
+        episode_id: Optional episode ID column to prepend
+
+    Returns:
+        pyarrow Table with channel, window_start_s and one float32
+        column per feature
+    """
+    import pyarrow as pa
+
+    tables = []
+    for channel, track in tracks.items():
+        columns: Dict[str, Any] = {}
+        if episode_id is not None:
+            columns["episode_id"] = pa.array([episode_id] * len(track), type=pa.string())
+        columns["channel"] = pa.array([channel] * len(track), type=pa.string())
+        columns["window_start_s"] = pa.array(track.window_start_s, type=pa.float64())
+        for i, name in enumerate(track.feature_names):
+            columns[name] = pa.array(np.ascontiguousarray(track.values[:, i], dtype=np.float32))
+        tables.append(pa.table(columns))
+    return pa.concat_tables(tables, promote_options="default")
+
+
+def _feature_tracks_from_table(table: Any) -> Dict[str, Dict[str, np.ndarray]]:
+    """Split a long-format feature track table into per-channel columns."""
+    import pyarrow.compute as pc
+
+    feature_columns = [
+        name for name in table.column_names if name not in ("episode_id", "channel")
+    ]
+    tracks = {}
+    for channel in pc.unique(table.column("channel")).to_pylist():
+        rows = table.filter(pc.equal(table.column("channel"), channel))
+        tracks[channel] = {name: rows.column(name).to_numpy() for name in feature_columns}
+    return tracks
+
+
 class EpisodeStorage:
     """Handles saving and loading FactoryNet episodes.
 
     Directory structure:
         factorynet_data/
-        └── episodes/
-            └── adapted/
-                └── {dataset_name}/
-                    └── {episode_id}/
-                        ├── metadata.json
-                        ├── timeseries.parquet
-                        ├── qa_pairs.json
-                        └── semantic_priors.json
+        ├── catalog.sqlite
+        ├── episodes/
+        │   └── adapted/
+        │       └── {dataset_name}/
+        │           └── {episode_id}/
+        │               ├── metadata.json
+        │               ├── timeseries.parquet
+        │               ├── qa_pairs.json
+        │               ├── semantic_priors.json
+        │               └── feature_tracks.parquet  (if enabled)
+        └── manifests/
+            └── {dataset_name}.jsonl
+
+    Every saved episode also gets a row in the catalog, which answers
+    ``list_episodes``, ``get_dataset_stats`` and ``query_episodes``
+    without touching the episode directories.
 
     Example:
         storage = EpisodeStorage(base_dir="./factorynet_data")
         storage.save_episode(episode, qa_pairs)
+        outer_race = storage.query_episodes(
+            "cwru_bearing", state_synset="S.flt.mec.wea.bea.out", rpm=1797
+        )
     """
 
     def __init__(
         self,
         base_dir: str | Path,
         use_parquet: bool = True,
+        row_group_size: int = 65536,
+        use_catalog: bool = True,
     ):
         """Initialize storage.
 
         Args:
             base_dir: Base directory for data storage
             use_parquet: Use Parquet format for timeseries (else JSON)
+            row_group_size: Samples per Parquet row group; the unit that
+                ranged loads decode
+            use_catalog: Maintain the SQLite episode catalog
         """
         self.base_dir = Path(base_dir)
         self.use_parquet = use_parquet
+        self.row_group_size = row_group_size
         self._setup_directories()
 
+        self.catalog: Optional[EpisodeCatalog] = None
+        if use_catalog:
+            catalog_path = self.base_dir / "catalog.sqlite"
+            is_new = not catalog_path.exists()
+            self.catalog = EpisodeCatalog(catalog_path)
+            if is_new:
+                # Index episodes saved before the catalog existed
+                self.rebuild_catalog()
+
     def _setup_directories(self) -> None:
         """Create base directory structure."""
         (self.base_dir / "episodes" / "adapted").mkdir(parents=True, exist_ok=True)
         (self.base_dir / "validation_reports").mkdir(parents=True, exist_ok=True)
         (self.base_dir / "taxonomy").mkdir(parents=True, exist_ok=True)
+        (self.base_dir / "manifests").mkdir(parents=True, exist_ok=True)
+
+    def get_manifest_path(self, dataset_name: str) -> Path:
+        """Get the path of the processing manifest for a dataset.
+
+        Args:
+            dataset_name: Name of dataset
+
+        Returns:
+            Path to the manifest JSONL file
+        """
+        return self.base_dir / "manifests" / f"{dataset_name}.jsonl"
 
     def get_episode_dir(
         self,
@@ -116,7 +203,7 @@ class EpisodeStorage:
         episode_dir.mkdir(parents=True, exist_ok=True)
 
         # Save metadata
-        self._save_metadata(episode, episode_dir)
+        metadata = self._save_metadata(episode, episode_dir)
 
         # Save timeseries
         self._save_timeseries(episode, episode_dir)
@@ -133,6 +220,13 @@ class EpisodeStorage:
         if episode.features:
             self._save_features(episode, episode_dir)
 
+        # Save rolling-window feature tracks
+        if episode.feature_tracks:
+            self._save_feature_tracks(episode.feature_tracks, episode_dir)
+
+        if self.catalog is not None:
+            self.catalog.upsert(self._catalog_entry(metadata, episode_dir))
+
         logger.debug(f"Saved episode {episode.episode_id} to {episode_dir}")
         return episode_dir
 
@@ -140,82 +234,108 @@ class EpisodeStorage:
         self,
         episode: FactoryNetEpisode,
         episode_dir: Path,
-    ) -> None:
+    ) -> Dict[str, Any]:
         """Save episode metadata to JSON."""
         metadata = episode.to_metadata_dict()
 
         with open(episode_dir / "metadata.json", "w") as f:
             json.dump(metadata, f, indent=2, default=_json_serializer)
 
+        return metadata
+
+    def _catalog_entry(
+        self,
+        metadata: Dict[str, Any],
+        episode_dir: Path,
+    ) -> CatalogEntry:
+        """Build the catalog row of a saved episode directory."""
+        byte_size = sum(f.stat().st_size for f in episode_dir.iterdir() if f.is_file())
+        return CatalogEntry.from_metadata(
+            metadata,
+            byte_size=byte_size,
+            path=episode_dir.relative_to(self.base_dir).as_posix(),
+        )
+
     def _save_timeseries(
         self,
         episode: FactoryNetEpisode,
         episode_dir: Path,
     ) -> None:
         """Save timeseries data to Parquet or JSON."""
-        if not episode.steps:
+        if not episode.num_timesteps:
             return
 
-        # Build data structure
-        data = {
-            "step_index": [],
-            "timestamp_offset": [],
-        }
-
-        # Add columns for each channel
-        for channel in episode.channel_names:
-            data[channel] = []
-
-        # Populate data
-        for step in episode.steps:
-            data["step_index"].append(step.step_index)
-            data["timestamp_offset"].append(step.timestamp_offset)
-            for channel in episode.channel_names:
-                value = step.condition_monitoring.get(channel, np.nan)
-                data[channel].append(value)
+        # Channel columns are views into the signal matrix
+        columns: Dict[str, np.ndarray] = dict(
+            zip(episode.channel_names, episode.signals)
+        )
 
         if self.use_parquet:
-            self._save_timeseries_parquet(data, episode_dir)
+            self._save_timeseries_parquet(columns, episode.dt, episode_dir)
         else:
-            self._save_timeseries_json(data, episode_dir)
+            self._save_timeseries_json(columns, episode.dt, episode_dir)
 
     def _save_timeseries_parquet(
         self,
-        data: Dict[str, List],
+        columns: Dict[str, np.ndarray],
+        dt: float,
         episode_dir: Path,
     ) -> None:
-        """Save timeseries as Parquet file."""
+        """Save timeseries as Parquet file.
+
+        Channel arrays are handed to Arrow as float32 buffers without any
+        per-sample Python work. ``step_index`` and ``timestamp_offset`` are
+        not stored; they are implied by the row number and the sample
+        period kept in the schema metadata, and rebuilt on load.
+        """
         try:
             import pyarrow as pa
             import pyarrow.parquet as pq
 
-            # Convert to PyArrow table
-            arrays = {}
-            for key, values in data.items():
-                if key in ("step_index",):
-                    arrays[key] = pa.array(values, type=pa.int32())
-                else:
-                    arrays[key] = pa.array(values, type=pa.float32())
-
-            table = pa.table(arrays)
+            # Zero-copy for contiguous float32 input, one vectorized cast otherwise
+            names = list(columns)
+            arrays = [
+                pa.array(np.ascontiguousarray(values, dtype=np.float32))
+                for values in columns.values()
+            ]
+            num_samples = len(arrays[0]) if arrays else 0
+
+            schema = pa.schema(
+                [pa.field(name, pa.float32()) for name in names],
+                metadata={
+                    TIMESERIES_DT_KEY: repr(dt),
+                    TIMESERIES_NUM_SAMPLES_KEY: str(num_samples),
+                },
+            )
+            table = pa.Table.from_arrays(arrays, schema=schema)
 
-            # Write to Parquet
+            # Write to Parquet (dictionary encoding never pays off for floats)
             pq.write_table(
                 table,
                 episode_dir / "timeseries.parquet",
                 compression="snappy",
+                use_dictionary=False,
+                row_group_size=self.row_group_size,
             )
 
         except ImportError:
             logger.warning("pyarrow not available, falling back to JSON")
-            self._save_timeseries_json(data, episode_dir)
+            self._save_timeseries_json(columns, dt, episode_dir)
 
     def _save_timeseries_json(
         self,
-        data: Dict[str, List],
+        columns: Dict[str, np.ndarray],
+        dt: float,
         episode_dir: Path,
     ) -> None:
         """Save timeseries as JSON file (fallback)."""
+        num_samples = len(next(iter(columns.values()))) if columns else 0
+        data: Dict[str, np.ndarray] = {
+            "step_index": np.arange(num_samples),
+            "timestamp_offset": np.arange(num_samples) * dt,
+        }
+        data.update(columns)
+
         with open(episode_dir / "timeseries.json", "w") as f:
             json.dump(data, f, default=_json_serializer)
 
@@ -234,7 +354,15 @@ class EpisodeStorage:
         episode_dir: Path,
     ) -> None:
         """Save semantic priors to JSON."""
-        priors_dict = {
+        priors_dict = self._semantic_priors_dict(priors)
+
+        with open(episode_dir / "semantic_priors.json", "w") as f:
+            json.dump(priors_dict, f, indent=2, default=_json_serializer)
+
+    @staticmethod
+    def _semantic_priors_dict(priors: SemanticPriors) -> Dict[str, Any]:
+        """Convert semantic priors to a JSON-compatible dictionary."""
+        return {
             "machine_type": priors.machine_type,
             "machine_description": priors.machine_description,
             "typical_failure_modes": priors.typical_failure_modes,
@@ -243,9 +371,6 @@ class EpisodeStorage:
             "bearing_info": priors.bearing_info,
         }
 
-        with open(episode_dir / "semantic_priors.json", "w") as f:
-            json.dump(priors_dict, f, indent=2, default=_json_serializer)
-
     def _save_features(
         self,
         episode: FactoryNetEpisode,
@@ -257,11 +382,114 @@ class EpisodeStorage:
         with open(episode_dir / "features.json", "w") as f:
             json.dump(features_dict, f, indent=2, default=_json_serializer)
 
-    def load_episode(self, episode_path: Path) -> Dict[str, Any]:
+    def _save_feature_tracks(
+        self,
+        tracks: Dict[str, FeatureTrack],
+        episode_dir: Path,
+    ) -> None:
+        """Save feature tracks to Parquet or JSON."""
+        if self.use_parquet:
+            try:
+                import pyarrow.parquet as pq
+
+                pq.write_table(
+                    _feature_tracks_to_table(tracks),
+                    episode_dir / "feature_tracks.parquet",
+                    compression="snappy",
+                    use_dictionary=["channel"],
+                )
+                return
+            except ImportError:
+                logger.warning("pyarrow not available, falling back to JSON")
+
+        tracks_dict = {channel: track.to_dict() for channel, track in tracks.items()}
+        with open(episode_dir / "feature_tracks.json", "w") as f:
+            json.dump(tracks_dict, f, default=_json_serializer)
+
+    def has_episode(self, dataset_name: str, episode_id: str) -> bool:
+        """Check whether an episode has been saved.
+
+        Args:
+            dataset_name: Name of dataset
+            episode_id: Episode ID
+
+        Returns:
+            True if the episode's metadata exists on disk
+        """
+        episode_dir = self.base_dir / "episodes" / "adapted" / dataset_name / episode_id
+        return (episode_dir / "metadata.json").exists()
+
+    @property
+    def num_buffered_episodes(self) -> int:
+        """Episodes saved but not yet written to disk (always 0 here)."""
+        return 0
+
+    def flush(self) -> None:
+        """Write out buffered data (episodes are written immediately here)."""
+
+    def close(self) -> None:
+        """Release resources held by the storage backend."""
+        self.flush()
+        if self.catalog is not None:
+            self.catalog.close()
+
+    def rebuild_catalog(self, dataset_name: Optional[str] = None) -> int:
+        """Rebuild catalog rows by scanning saved episode directories.
+
+        Only needed for data written without the catalog, or after episode
+        directories were changed by hand.
+
+        Args:
+            dataset_name: Optional dataset to rebuild (default: all)
+
+        Returns:
+            Number of episodes cataloged
+        """
+        if self.catalog is None:
+            return 0
+
+        adapted_dir = self.base_dir / "episodes" / "adapted"
+        if dataset_name:
+            dataset_dirs = [adapted_dir / dataset_name]
+        else:
+            dataset_dirs = sorted(d for d in adapted_dir.iterdir() if d.is_dir())
+
+        entries: List[CatalogEntry] = []
+        for dataset_dir in dataset_dirs:
+            if not dataset_dir.is_dir():
+                continue
+            for episode_dir in sorted(dataset_dir.iterdir()):
+                metadata_path = episode_dir / "metadata.json"
+                if not metadata_path.exists():
+                    continue
+                with open(metadata_path) as f:
+                    metadata = json.load(f)
+                entries.append(self._catalog_entry(metadata, episode_dir))
+
+        self.catalog.clear(dataset_name)
+        self.catalog.upsert_many(entries)
+        if entries:
+            logger.info(f"Cataloged {len(entries)} existing episodes")
+        return len(entries)
+
+    def load_episode(
+        self,
+        episode_path: Path,
+        channels: Optional[Sequence[str]] = None,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """Load an episode from disk.
 
+        Timeseries columns are returned as NumPy arrays. With Parquet, only
+        the requested channels and the row groups overlapping
+        ``[start, stop)`` are decoded.
+
         Args:
             episode_path: Path to episode directory
+            channels: Optional channel names to load (default: all)
+            start: First sample to load (default: 0)
+            stop: End sample, exclusive (default: end of episode)
 
         Returns:
             Dictionary with episode data
@@ -279,10 +507,13 @@ class EpisodeStorage:
         json_path = episode_path / "timeseries.json"
 
         if parquet_path.exists():
-            result["timeseries"] = self._load_timeseries_parquet(parquet_path)
+            result["timeseries"] = self._load_timeseries_parquet(
+                parquet_path, channels, start, stop
+            )
         elif json_path.exists():
-            with open(json_path) as f:
-                result["timeseries"] = json.load(f)
+            result["timeseries"] = self._load_timeseries_json(
+                json_path, channels, start, stop
+            )
 
         # Load Q&A pairs
         qa_path = episode_path / "qa_pairs.json"
@@ -302,20 +533,114 @@ class EpisodeStorage:
             with open(features_path) as f:
                 result["features"] = json.load(f)
 
+        # Load feature tracks
+        tracks_parquet = episode_path / "feature_tracks.parquet"
+        tracks_json = episode_path / "feature_tracks.json"
+        if tracks_parquet.exists():
+            try:
+                import pyarrow.parquet as pq
+
+                result["feature_tracks"] = _feature_tracks_from_table(
+                    pq.read_table(tracks_parquet)
+                )
+            except ImportError:
+                logger.error("pyarrow required to load Parquet files")
+        elif tracks_json.exists():
+            with open(tracks_json) as f:
+                result["feature_tracks"] = {
+                    channel: {name: np.asarray(values) for name, values in columns.items()}
+                    for channel, columns in json.load(f).items()
+                }
+
         return result
 
-    def _load_timeseries_parquet(self, path: Path) -> Dict[str, List]:
-        """Load timeseries from Parquet file."""
+    def _load_timeseries_parquet(
+        self,
+        path: Path,
+        channels: Optional[Sequence[str]] = None,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Load timeseries columns from a Parquet file as NumPy arrays."""
         try:
+            import pyarrow as pa
             import pyarrow.parquet as pq
 
-            table = pq.read_table(path)
-            return {col: table[col].to_pylist() for col in table.column_names}
+            parquet_file = pq.ParquetFile(path)
+            file_meta = parquet_file.metadata
+            names = parquet_file.schema_arrow.names
+            num_samples = file_meta.num_rows
+
+            start, stop, _ = slice(start, stop).indices(num_samples)
+            stop = max(start, stop)
+
+            columns = [
+                name for name in names
+                if name not in ("step_index", "timestamp_offset")
+                and (channels is None or name in channels)
+            ]
+
+            # Decode only the row groups overlapping [start, stop)
+            row_groups = []
+            first_row = 0
+            group_start = 0
+            for i in range(file_meta.num_row_groups):
+                group_rows = file_meta.row_group(i).num_rows
+                if group_start < stop and group_start + group_rows > start:
+                    if not row_groups:
+                        first_row = group_start
+                    row_groups.append(i)
+                group_start += group_rows
+
+            if row_groups and columns:
+                table = parquet_file.read_row_groups(row_groups, columns=columns)
+                table = table.slice(start - first_row, stop - start)
+            else:
+                table = pa.table({name: pa.array([], type=pa.float32()) for name in columns})
+
+            # The time axis is implicit; older files stored it explicitly
+            metadata = parquet_file.schema_arrow.metadata or {}
+            if TIMESERIES_DT_KEY.encode() in metadata:
+                dt = float(metadata[TIMESERIES_DT_KEY.encode()])
+            elif "timestamp_offset" in names and num_samples > 1:
+                offsets = parquet_file.read_row_group(0, columns=["timestamp_offset"])
+                offsets = offsets.column(0).to_numpy()
+                dt = float(offsets[1] - offsets[0]) if len(offsets) > 1 else 0.0
+            else:
+                dt = 0.0
+
+            step_index = np.arange(start, stop, dtype=np.int64)
+            data: Dict[str, np.ndarray] = {
+                "step_index": step_index,
+                "timestamp_offset": step_index * dt,
+            }
+            for name in columns:
+                data[name] = table.column(name).to_numpy()
+            return data
 
         except ImportError:
             logger.error("pyarrow required to load Parquet files")
             return {}
 
+    def _load_timeseries_json(
+        self,
+        path: Path,
+        channels: Optional[Sequence[str]] = None,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Load timeseries columns from the JSON fallback as NumPy arrays."""
+        with open(path) as f:
+            raw = json.load(f)
+
+        rows = slice(start, stop)
+        return {
+            name: np.asarray(values)[rows]
+            for name, values in raw.items()
+            if name in ("step_index", "timestamp_offset")
+            or channels is None or name in channels
+        }
+
     def list_episodes(
         self,
         dataset_name: Optional[str] = None,
@@ -328,6 +653,9 @@ class EpisodeStorage:
         Returns:
             List of episode directory paths
         """
+        if self.catalog is not None:
+            return [self.base_dir / path for path in self.catalog.list_paths(dataset_name)]
+
         adapted_dir = self.base_dir / "episodes" / "adapted"
 
         if dataset_name:
@@ -356,6 +684,15 @@ class EpisodeStorage:
         Returns:
             Dictionary with dataset statistics
         """
+        if self.catalog is not None:
+            stats = self.catalog.dataset_stats(dataset_name)
+            return {
+                "dataset_name": dataset_name,
+                "num_episodes": stats["num_episodes"],
+                "total_size_mb": stats["total_size_bytes"] / (1024 * 1024),
+                "fault_distribution": stats["fault_distribution"],
+            }
+
         episodes = self.list_episodes(dataset_name)
 
         total_size = 0
@@ -382,6 +719,45 @@ class EpisodeStorage:
             "fault_distribution": fault_counts,
         }
 
+    def query_episodes(
+        self,
+        dataset_name: Optional[str] = None,
+        state_synset: Optional[str] = None,
+        rpm: Optional[float] = None,
+        load_hp: Optional[float] = None,
+        min_severity: Optional[float] = None,
+        max_severity: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find saved episodes by label and operating conditions.
+
+        Args:
+            dataset_name: Optional filter by dataset
+            state_synset: State synset or synset prefix
+            rpm: Exact rotational speed
+            load_hp: Exact motor load
+            min_severity: Minimum severity (inclusive)
+            max_severity: Maximum severity (inclusive)
+            limit: Maximum number of episodes to return
+
+        Returns:
+            Catalog rows (episode_id, dataset, state, severity, rpm, load,
+            num_samples, byte_size, path) of matching episodes
+        """
+        if self.catalog is None:
+            raise RuntimeError("Episode queries require the catalog (use_catalog=True)")
+
+        entries = self.catalog.query(
+            dataset=dataset_name,
+            state_synset=state_synset,
+            rpm=rpm,
+            load_hp=load_hp,
+            min_severity=min_severity,
+            max_severity=max_severity,
+            limit=limit,
+        )
+        return [entry.to_dict() for entry in entries]
+
     def save_validation_report(
         self,
         report_data: Dict[str, Any],
@@ -396,12 +772,32 @@ class EpisodeStorage:
         Returns:
             Path to saved report
         """
-        report_path = (
-            self.base_dir / "validation_reports" /
-            f"{dataset_name}_report.json"
-        )
+        report_path = self._validation_report_path(dataset_name)
 
         with open(report_path, "w") as f:
             json.dump(report_data, f, indent=2, default=_json_serializer)
 
         return report_path
+
+    def load_validation_report(self, dataset_name: str) -> Optional[Dict[str, Any]]:
+        """Load the saved validation report of a dataset.
+
+        Args:
+            dataset_name: Name of dataset
+
+        Returns:
+            Report data dictionary, or None if no report has been saved
+        """
+        report_path = self._validation_report_path(dataset_name)
+        if not report_path.exists():
+            return None
+
+        with open(report_path) as f:
+            return json.load(f)
+
+    def _validation_report_path(self, dataset_name: str) -> Path:
+        """Path of the validation report of a dataset."""
+        return (
+            self.base_dir / "validation_reports" /
+            f"{dataset_name}_report.json"
+        )
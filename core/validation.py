@@ -12,6 +12,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
+import numpy as np
+
 from core.normalizer import FactoryNetEpisode
 
 logger = logging.getLogger(__name__)
@@ -97,6 +99,82 @@ class ValidationResult:
         }
 
 
+@dataclass
+class EpisodeValidationSummary:
+    """Compact per-episode entry of a streamed validation report.
+
+    Holds the scalar metrics of a ValidationResult and the messages of its
+    errors and warnings, so reports can be merged across runs.
+    """
+    episode_id: str
+    valid: bool
+    error_count: int
+    warning_count: int
+    sensor_completeness: float
+    label_confidence: float
+    feature_completeness: float
+    overall_quality_score: float
+    error_messages: List[str] = field(default_factory=list)
+    warning_messages: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_result(cls, result: ValidationResult) -> EpisodeValidationSummary:
+        """Summarize a full validation result."""
+        return cls(
+            episode_id=result.episode_id,
+            valid=result.valid,
+            error_count=result.error_count,
+            warning_count=result.warning_count,
+            sensor_completeness=result.sensor_completeness,
+            label_confidence=result.label_confidence,
+            feature_completeness=result.feature_completeness,
+            overall_quality_score=result.overall_quality_score,
+            error_messages=[
+                i.message for i in result.issues
+                if i.severity == ValidationSeverity.ERROR
+            ],
+            warning_messages=[
+                i.message for i in result.issues
+                if i.severity == ValidationSeverity.WARNING
+            ],
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> EpisodeValidationSummary:
+        """Rebuild a summary from an ``episode_results`` entry of a saved report.
+
+        Entries written before issue messages were recorded load with empty
+        message lists.
+        """
+        return cls(
+            episode_id=data["episode_id"],
+            valid=data["valid"],
+            error_count=data["error_count"],
+            warning_count=data["warning_count"],
+            sensor_completeness=data["sensor_completeness"],
+            label_confidence=data["label_confidence"],
+            feature_completeness=data["feature_completeness"],
+            overall_quality_score=data["overall_quality_score"],
+            error_messages=list(data.get("error_messages", [])),
+            warning_messages=list(data.get("warning_messages", [])),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "episode_id": self.episode_id,
+            "valid": self.valid,
+            "error_count": self.error_count,
+            "warning_count": self.warning_count,
+            "sensor_completeness": self.sensor_completeness,
+            "label_confidence": self.label_confidence,
+            "feature_completeness": self.feature_completeness,
+            "overall_quality_score": self.overall_quality_score,
+            "error_messages": self.error_messages,
+            "warning_messages": self.warning_messages,
+        }
+
+
 @dataclass
 class ValidationReport:
     """Aggregated validation report for multiple episodes."""
@@ -114,8 +192,10 @@ class ValidationReport:
     error_counts: Dict[str, int] = field(default_factory=dict)
     warning_counts: Dict[str, int] = field(default_factory=dict)
 
-    # Episode results
-    episode_results: List[ValidationResult] = field(default_factory=list)
+    # Episode results (full results, or summaries when streamed)
+    episode_results: List[ValidationResult | EpisodeValidationSummary] = field(
+        default_factory=list
+    )
 
     # Timestamps
     generated_at: datetime = field(default_factory=datetime.now)
@@ -302,13 +382,13 @@ class EpisodeValidator:
         issues = []
 
         # Check minimum samples
-        if len(episode.steps) < self.min_samples:
+        if episode.num_timesteps < self.min_samples:
             issues.append(ValidationIssue(
                 category=ValidationCategory.COMPLETENESS,
                 severity=ValidationSeverity.WARNING,
-                field="steps",
+                field="signals",
                 message=f"Episode has fewer than {self.min_samples} time steps",
-                value=len(episode.steps),
+                value=episode.num_timesteps,
             ))
 
         # Check for empty channels
@@ -335,23 +415,17 @@ class EpisodeValidator:
         """Validate data quality."""
         issues = []
 
-        # Check for NaN values in steps
-        nan_count = 0
-        total_values = 0
-
-        for step in episode.steps:
-            for value in step.condition_monitoring.values():
-                total_values += 1
-                if value is None or (isinstance(value, float) and not (value == value)):  # NaN check
-                    nan_count += 1
+        # Check for NaN values in the signal matrix
+        total_values = episode.signals.size
 
         if total_values > 0:
+            nan_count = int(np.count_nonzero(np.isnan(episode.signals)))
             nan_ratio = nan_count / total_values
             if nan_ratio > self.max_nan_ratio:
                 issues.append(ValidationIssue(
                     category=ValidationCategory.QUALITY,
                     severity=ValidationSeverity.WARNING,
-                    field="steps",
+                    field="signals",
                     message=f"High NaN ratio ({nan_ratio:.2%}) in sensor data",
                     value=nan_ratio,
                     suggestion="Check data source for missing values",
@@ -430,9 +504,9 @@ class EpisodeValidator:
         """Validate internal consistency."""
         issues = []
 
-        # Check duration matches steps
-        if episode.steps and episode.sampling_rate_hz > 0:
-            expected_duration = len(episode.steps) / episode.sampling_rate_hz
+        # Check duration matches samples
+        if episode.num_timesteps and episode.sampling_rate_hz > 0:
+            expected_duration = episode.num_timesteps / episode.sampling_rate_hz
             if abs(episode.duration_seconds - expected_duration) > 1.0:
                 issues.append(ValidationIssue(
                     category=ValidationCategory.CONSISTENCY,
@@ -442,38 +516,30 @@ class EpisodeValidator:
                     value=episode.duration_seconds,
                 ))
 
-        # Check channel names match step data
-        if episode.steps and episode.channel_names:
-            step_channels = set()
-            for step in episode.steps[:10]:  # Sample first 10
-                step_channels.update(step.condition_monitoring.keys())
-
-            declared_channels = set(episode.channel_names)
-            missing = declared_channels - step_channels
-            if missing and step_channels:  # Only flag if we have some data
-                issues.append(ValidationIssue(
-                    category=ValidationCategory.CONSISTENCY,
-                    severity=ValidationSeverity.INFO,
-                    field="channel_names",
-                    message=f"Declared channels not found in data: {missing}",
-                    value=list(missing),
-                ))
+        # Check channel names match signal rows
+        num_rows = episode.signals.shape[0] if episode.signals.ndim == 2 else 0
+        if episode.num_timesteps and len(episode.channel_names) != num_rows:
+            issues.append(ValidationIssue(
+                category=ValidationCategory.CONSISTENCY,
+                severity=ValidationSeverity.ERROR,
+                field="channel_names",
+                message=(
+                    f"{len(episode.channel_names)} channel names for "
+                    f"{num_rows} signal rows"
+                ),
+                value=len(episode.channel_names),
+                suggestion="Rebuild the signal matrix from the channel list",
+            ))
 
         return issues
 
     def _compute_sensor_completeness(self, episode: FactoryNetEpisode) -> float:
         """Compute sensor data completeness ratio."""
-        if not episode.steps or not episode.channel_names:
+        if not episode.num_timesteps or not episode.channel_names:
             return 0.0
 
-        expected = len(episode.steps) * len(episode.channel_names)
-        actual = 0
-
-        for step in episode.steps:
-            for channel in episode.channel_names:
-                value = step.condition_monitoring.get(channel)
-                if value is not None and (not isinstance(value, float) or value == value):
-                    actual += 1
+        expected = episode.num_timesteps * len(episode.channel_names)
+        actual = int(np.count_nonzero(~np.isnan(episode.signals)))
 
         return actual / expected if expected > 0 else 0.0
 
@@ -513,47 +579,137 @@ class ValidationReportGenerator:
         Returns:
             ValidationReport with aggregated results
         """
-        results = []
-        valid_count = 0
-        invalid_count = 0
+        results = [self.validator.validate(episode) for episode in episodes]
+        return self.build_report(results, dataset_name)
+
+    def build_report(
+        self,
+        results: List[ValidationResult],
+        dataset_name: str,
+    ) -> ValidationReport:
+        """Aggregate already computed validation results into a report.
+
+        Args:
+            results: Validation results, one per episode
+            dataset_name: Name of the dataset
+
+        Returns:
+            ValidationReport with aggregated results
+        """
+        accumulator = ValidationReportAccumulator(
+            dataset_name,
+            keep_episode_summaries=False,
+        )
+        for result in results:
+            accumulator.add(result)
+
+        report = accumulator.to_report()
+        report.episode_results = list(results)
+        return report
+
 
-        total_sensor_completeness = 0.0
-        total_label_confidence = 0.0
-        total_quality_score = 0.0
+class ValidationReportAccumulator:
+    """Incrementally aggregates validation results into a report.
 
-        error_counts: Dict[str, int] = {}
-        warning_counts: Dict[str, int] = {}
+    Keeps running totals and issue counts plus, optionally, one compact
+    EpisodeValidationSummary per episode, so memory does not grow with
+    the size of the episodes or their issue lists.
 
+    Example:
+        accumulator = ValidationReportAccumulator("cwru_bearing")
         for episode in episodes:
-            result = self.validator.validate(episode)
-            results.append(result)
+            accumulator.add(validator.validate(episode))
+        report = accumulator.to_report()
+    """
 
-            if result.valid:
-                valid_count += 1
-            else:
-                invalid_count += 1
+    def __init__(
+        self,
+        dataset_name: str,
+        keep_episode_summaries: bool = True,
+    ):
+        """Initialize accumulator.
 
-            total_sensor_completeness += result.sensor_completeness
-            total_label_confidence += result.label_confidence
-            total_quality_score += result.overall_quality_score
+        Args:
+            dataset_name: Name of the dataset
+            keep_episode_summaries: Record a summary entry per episode
+        """
+        self.dataset_name = dataset_name
+        self.keep_episode_summaries = keep_episode_summaries
 
-            # Count issues by message
-            for issue in result.issues:
-                if issue.severity == ValidationSeverity.ERROR:
-                    error_counts[issue.message] = error_counts.get(issue.message, 0) + 1
-                elif issue.severity == ValidationSeverity.WARNING:
-                    warning_counts[issue.message] = warning_counts.get(issue.message, 0) + 1
+        self.total_episodes = 0
+        self.valid_episodes = 0
+        self.invalid_episodes = 0
+
+        self._total_sensor_completeness = 0.0
+        self._total_label_confidence = 0.0
+        self._total_quality_score = 0.0
+
+        self.error_counts: Dict[str, int] = {}
+        self.warning_counts: Dict[str, int] = {}
+        self.episode_summaries: List[EpisodeValidationSummary] = []
+
+    def add(self, result: ValidationResult) -> None:
+        """Fold a single validation result into the aggregates.
+
+        Args:
+            result: Result of validating one episode
+        """
+        self.add_summary(EpisodeValidationSummary.from_result(result))
+
+    def add_summary(self, summary: EpisodeValidationSummary) -> None:
+        """Fold a per-episode summary into the aggregates.
+
+        Args:
+            summary: Summary of one episode, e.g. from a previous report
+        """
+        self.total_episodes += 1
+        if summary.valid:
+            self.valid_episodes += 1
+        else:
+            self.invalid_episodes += 1
+
+        self._total_sensor_completeness += summary.sensor_completeness
+        self._total_label_confidence += summary.label_confidence
+        self._total_quality_score += summary.overall_quality_score
+
+        # Count issues by message
+        for message in summary.error_messages:
+            self.error_counts[message] = self.error_counts.get(message, 0) + 1
+        for message in summary.warning_messages:
+            self.warning_counts[message] = self.warning_counts.get(message, 0) + 1
+
+        if self.keep_episode_summaries:
+            self.episode_summaries.append(summary)
+
+    @property
+    def avg_sensor_completeness(self) -> float:
+        """Mean sensor completeness over all added results."""
+        n = self.total_episodes
+        return self._total_sensor_completeness / n if n > 0 else 0.0
+
+    @property
+    def avg_label_confidence(self) -> float:
+        """Mean label confidence over all added results."""
+        n = self.total_episodes
+        return self._total_label_confidence / n if n > 0 else 0.0
+
+    @property
+    def avg_quality_score(self) -> float:
+        """Mean overall quality score over all added results."""
+        n = self.total_episodes
+        return self._total_quality_score / n if n > 0 else 0.0
 
-        n = len(episodes)
+    def to_report(self) -> ValidationReport:
+        """Build a ValidationReport from the current aggregates."""
         return ValidationReport(
-            dataset_name=dataset_name,
-            total_episodes=n,
-            valid_episodes=valid_count,
-            invalid_episodes=invalid_count,
-            avg_sensor_completeness=total_sensor_completeness / n if n > 0 else 0.0,
-            avg_label_confidence=total_label_confidence / n if n > 0 else 0.0,
-            avg_quality_score=total_quality_score / n if n > 0 else 0.0,
-            error_counts=error_counts,
-            warning_counts=warning_counts,
-            episode_results=results,
+            dataset_name=self.dataset_name,
+            total_episodes=self.total_episodes,
+            valid_episodes=self.valid_episodes,
+            invalid_episodes=self.invalid_episodes,
+            avg_sensor_completeness=self.avg_sensor_completeness,
+            avg_label_confidence=self.avg_label_confidence,
+            avg_quality_score=self.avg_quality_score,
+            error_counts=dict(self.error_counts),
+            warning_counts=dict(self.warning_counts),
+            episode_results=list(self.episode_summaries),
         )
@@ -14,6 +14,9 @@ Usage:
     # Process full CWRU dataset
     python scripts/process_datasets.py --dataset cwru_bearing --data-dir ./data/cwru
 
+    # Process full CWRU dataset on all CPU cores
+    python scripts/process_datasets.py --dataset cwru_bearing --data-dir ./data/cwru -j 0
+
     # Process multiple datasets
     python scripts/process_datasets.py --dataset cwru_bearing paderborn_bearing --demo
 
@@ -259,12 +262,81 @@ def main() -> int:
         help="Skip feature extraction",
     )
 
+    parser.add_argument(
+        "--feature-tracks",
+        type=float,
+        metavar="SECONDS",
+        default=None,
+        help="Also store rolling-window feature tracks with this window length",
+    )
+
+    parser.add_argument(
+        "--envelope",
+        choices=["off", "fixed", "kurtogram"],
+        default="off",
+        help="Envelope spectrum fault features: off (default), fixed 1/4-3/4 "
+             "Nyquist band, or band picked per signal by the kurtogram (slowest)",
+    )
+
+    parser.add_argument(
+        "--no-feature-cache",
+        action="store_true",
+        help="Recompute all features instead of reusing the on-disk feature cache",
+    )
+
+    parser.add_argument(
+        "--channel-dtype",
+        choices=["float32", "float64"],
+        default=None,
+        help="Sample dtype of loaded channels (float32 halves memory; default: float64)",
+    )
+
     parser.add_argument(
         "--json-timeseries",
         action="store_true",
         help="Use JSON instead of Parquet for timeseries",
     )
 
+    parser.add_argument(
+        "--storage",
+        choices=["directory", "sharded"],
+        default="directory",
+        help="Storage backend: one directory per episode, or Parquet shards",
+    )
+
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Reprocess everything instead of skipping files in the manifest",
+    )
+
+    parser.add_argument(
+        "--checksum",
+        choices=["full", "sample"],
+        default="full",
+        help="Episode checksum: hash every sample (full) or only the first/last 100",
+    )
+
+    parser.add_argument(
+        "--no-dedup",
+        action="store_true",
+        help="Keep episodes whose sensor data duplicates an earlier episode",
+    )
+
+    parser.add_argument(
+        "--num-workers", "-j",
+        type=int,
+        default=1,
+        help="Worker processes for normalization/saving (0 = all cores, default: 1)",
+    )
+
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=1,
+        help="Worker processes for parsing source files (0 = all cores, default: 1)",
+    )
+
     # Quality gates
     parser.add_argument(
         "--sensor-threshold",
@@ -358,6 +430,11 @@ def main() -> int:
     config = PipelineConfig(
         output_dir=args.output_dir,
         extract_features=not args.no_features,
+        feature_track_window_s=args.feature_tracks,
+        envelope_analysis=args.envelope != "off",
+        envelope_band_hz="kurtogram" if args.envelope == "kurtogram" else None,
+        use_feature_cache=not args.no_feature_cache,
+        channel_dtype=args.channel_dtype,
         generate_qa=not args.no_qa,
         validate_episodes=not args.no_validate,
         demo_mode=args.demo,
@@ -365,6 +442,12 @@ def main() -> int:
         sensor_completeness_threshold=args.sensor_threshold,
         label_confidence_threshold=args.confidence_threshold,
         use_parquet=not args.json_timeseries,
+        storage_backend=args.storage,
+        num_workers=args.num_workers,
+        parse_workers=args.parse_workers,
+        resume=not args.no_resume,
+        checksum_mode=args.checksum,
+        deduplicate=not args.no_dedup,
         verbose=True,
     )
 
@@ -396,7 +479,10 @@ def main() -> int:
         save_results(results, args.results_file)
 
     # Check for failures
-    failed = sum(1 for s in results.values() if s.episodes_saved == 0)
+    failed = sum(
+        1 for s in results.values()
+        if s.episodes_saved == 0 and s.episodes_skipped == 0
+    )
     if failed > 0:
         logger.warning(f"{failed} dataset(s) had no saved episodes")
         return 1
@@ -0,0 +1,33 @@
+"""Shared helpers for the test suite."""
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+
+from core.adapters.base_adapter import FaultType, RawEpisode, SensorChannel
+from core.normalizer import EpisodeNormalizer, FactoryNetEpisode
+
+DATASET = "storage_test"
+
+
+def make_episodes(count: int, start: int = 0, rpm: float = 1797) -> List[FactoryNetEpisode]:
+    """Normalized two-channel episodes EP-{start:06d}...; odd ones are outer race faults."""
+    normalizer = EpisodeNormalizer(feature_track_window_s=0.25)
+    episodes = []
+    for i in range(start, start + count):
+        rng = np.random.default_rng(i)
+        raw = RawEpisode(
+            raw_id=f"raw_{i}",
+            source_dataset=DATASET,
+            source_file=f"file_{i}.mat",
+            channels=[
+                SensorChannel(name, name, "g", rng.normal(size=3000), 12000.0)
+                for name in ("vibration_de", "vibration_fe")
+            ],
+            fault_type=FaultType.OUTER_RACE if i % 2 else FaultType.NORMAL,
+            rpm=rpm,
+            load_hp=1,
+        )
+        episodes.append(normalizer.normalize(raw, episode_id=f"EP-{i:06d}"))
+    return episodes
@@ -0,0 +1,79 @@
+"""Tests for ConvertedArrayCache."""
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from core.adapters.array_cache import ConvertedArrayCache
+from core.adapters.base_adapter import SensorChannel
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "105.mat"
+    path.write_bytes(b"raw file contents")
+    return path
+
+
+def _channels(dtype=np.float64):
+    return [
+        SensorChannel(name, name, "g", np.arange(100, dtype=dtype) * i, 12000.0)
+        for i, name in enumerate(("vibration_de", "vibration_fe"), start=1)
+    ]
+
+
+def _save(cache, source, dtype=np.float64):
+    cache.save(source, _channels(dtype), {"rpm": 1797, "keys": ["X105_DE_time"]})
+
+
+def test_round_trip(tmp_path, source):
+    cache = ConvertedArrayCache(tmp_path / "cache")
+    assert cache.load(source, np.float64) is None
+    _save(cache, source)
+
+    channels, info = cache.load(source, np.float64)
+    assert info == {"rpm": 1797, "keys": ["X105_DE_time"]}
+    for loaded, original in zip(channels, _channels()):
+        assert loaded.channel_id == original.channel_id
+        assert loaded.sampling_rate_hz == original.sampling_rate_hz
+        np.testing.assert_array_equal(loaded.data, original.data)
+
+
+def test_modified_source_invalidates_entry(tmp_path, source):
+    cache = ConvertedArrayCache(tmp_path / "cache")
+    _save(cache, source)
+
+    st = source.stat()
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache.load(source, np.float64) is None
+
+    _save(cache, source)
+    assert cache.load(source, np.float64) is not None
+    source.write_bytes(b"raw file contents, now longer")
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache.load(source, np.float64) is None
+
+
+def test_dtype_change_invalidates_entry(tmp_path, source):
+    cache = ConvertedArrayCache(tmp_path / "cache")
+    _save(cache, source, np.float32)
+    assert cache.load(source, np.float64) is None
+    assert cache.load(source, np.float32)[0][0].data.dtype == np.float32
+
+
+def test_resave_replaces_entry(tmp_path, source):
+    cache = ConvertedArrayCache(tmp_path / "cache")
+    _save(cache, source, np.float32)
+    _save(cache, source, np.float64)
+    assert cache.load(source, np.float64) is not None
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+def test_corrupt_entry_is_ignored(tmp_path, source):
+    cache = ConvertedArrayCache(tmp_path / "cache")
+    _save(cache, source)
+    [entry] = (tmp_path / "cache").iterdir()
+    (entry / "ch0.npy").write_bytes(b"not an array")
+    assert cache.load(source, np.float64) is None
@@ -0,0 +1,63 @@
+"""Tests for the SQLite episode catalog behind EpisodeStorage."""
+from __future__ import annotations
+
+import pytest
+
+from core.storage import EpisodeStorage
+from tests.conftest import DATASET, make_episodes
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = EpisodeStorage(tmp_path)
+    for episode in make_episodes(4):
+        storage.save_episode(episode)
+    yield storage
+    storage.close()
+
+
+def test_catalog_matches_directory_scan(tmp_path, storage):
+    scan = EpisodeStorage(tmp_path, use_catalog=False)
+    assert storage.list_episodes(DATASET) == scan.list_episodes(DATASET)
+
+    stats = storage.get_dataset_stats(DATASET)
+    scanned = scan.get_dataset_stats(DATASET)
+    assert stats["num_episodes"] == scanned["num_episodes"] == 4
+    assert stats["fault_distribution"] == scanned["fault_distribution"]
+    assert stats["total_size_mb"] == pytest.approx(scanned["total_size_mb"], rel=0.05)
+
+
+def test_query_filters(storage):
+    rows = storage.query_episodes(DATASET)
+    assert [row["episode_id"] for row in rows] == [f"EP-{i:06d}" for i in range(4)]
+    assert all(row["num_channels"] == 2 and row["num_samples"] == 3000 for row in rows)
+
+    faults = storage.query_episodes(DATASET, state_synset="S.flt")
+    assert [row["episode_id"] for row in faults] == ["EP-000001", "EP-000003"]
+    assert storage.query_episodes(DATASET, rpm=1750) == []
+    assert len(storage.query_episodes(DATASET, limit=3)) == 3
+
+    severities = sorted(row["severity"] for row in rows)
+    low = storage.query_episodes(DATASET, max_severity=severities[0])
+    assert {row["severity"] for row in low} == {severities[0]}
+
+
+def test_resave_replaces_row(storage):
+    [episode] = make_episodes(1, start=2, rpm=1750)
+    storage.save_episode(episode)
+    rows = storage.query_episodes(DATASET, rpm=1750)
+    assert [row["episode_id"] for row in rows] == ["EP-000002"]
+    assert len(storage.query_episodes(DATASET)) == 4
+
+
+def test_rebuild_catalog_from_episode_directories(tmp_path, storage):
+    expected = storage.query_episodes(DATASET)
+    storage.close()
+    (tmp_path / "catalog.sqlite").unlink()
+
+    # A missing catalog is rebuilt when the storage is opened
+    rebuilt = EpisodeStorage(tmp_path)
+    assert rebuilt.query_episodes(DATASET) == expected
+    assert rebuilt.rebuild_catalog(DATASET) == 4
+    assert rebuilt.query_episodes(DATASET) == expected
+    rebuilt.close()
@@ -0,0 +1,49 @@
+"""Tests for read_numeric_csv."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from core.adapters.csv_reader import read_numeric_csv
+
+BACKENDS = ["pyarrow", "numpy"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_header_is_skipped(tmp_path, backend):
+    path = tmp_path / "data.csv"
+    path.write_text("time,accel_x\n0.0,1.5\n0.1,-2.5\n")
+    data = read_numeric_csv(path, backend=backend)
+    np.testing.assert_array_equal(data, [[0.0, 1.5], [0.1, -2.5]])
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_header_with_empty_field_is_skipped(tmp_path, backend):
+    path = tmp_path / "data.csv"
+    path.write_text(",accel_x\n0,1\n1,2\n")
+    assert read_numeric_csv(path, backend=backend).shape == (2, 2)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_numeric_first_row_is_kept(tmp_path, backend):
+    path = tmp_path / "data.txt"
+    path.write_text("1\t2\t3\n4\t5\t6\n")
+    data = read_numeric_csv(path, delimiter="\t", dtype=np.float32, backend=backend)
+    assert data.dtype == np.float32
+    np.testing.assert_array_equal(data, [[1, 2, 3], [4, 5, 6]])
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("text, shape", [("1,2,3\n", (1, 3)), ("1\n2\n3\n", (3, 1))])
+def test_single_row_or_column_is_2d(tmp_path, backend, text, shape):
+    path = tmp_path / "data.csv"
+    path.write_text(text)
+    assert read_numeric_csv(path, backend=backend).shape == shape
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_non_numeric_field_raises(tmp_path, backend):
+    path = tmp_path / "data.csv"
+    path.write_text("1,2\n3,abc\n")
+    with pytest.raises(ValueError):
+        read_numeric_csv(path, backend=backend)
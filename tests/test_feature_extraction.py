@@ -0,0 +1,118 @@
+"""Tests for vibration feature extraction."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from core.feature_extraction import (
+    BEARING_GEOMETRIES,
+    StreamingFeatureExtractor,
+    VibrationFeatureExtractor,
+    _fir_decimate,
+    _kurtogram_filters,
+    fast_kurtogram,
+)
+
+FS = 12000.0
+
+
+def _impulsive_signal(n: int = 2 ** 14, resonance_hz: float = 3000.0) -> np.ndarray:
+    """White noise plus decaying resonance bursts every 1000 samples."""
+    signal = np.random.default_rng(1).normal(size=n)
+    k = np.arange(200)
+    burst = 3 * np.exp(-k / 20) * np.sin(2 * np.pi * resonance_hz * k / FS)
+    for start in range(0, n - len(k), 1000):
+        signal[start:start + len(k)] += burst
+    return signal
+
+
+@pytest.mark.parametrize("factor", [2, 3])
+def test_fir_decimate_matches_direct_convolution(factor):
+    h, _, thirds = _kurtogram_filters()
+    taps = h if factor == 2 else thirds[0]
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(3, 2, 1001)) + 1j * rng.normal(size=(3, 2, 1001))
+
+    full = np.apply_along_axis(lambda row: np.convolve(row, taps)[:x.shape[-1]], -1, x)
+    expected = full[..., factor - 1::factor][..., :x.shape[-1] // factor]
+    np.testing.assert_allclose(_fir_decimate(x, taps, factor), expected, atol=1e-12)
+
+
+def test_kurtogram_finds_resonance_band():
+    result = fast_kurtogram(_impulsive_signal(), FS)
+    low, high = result.band_hz
+    assert low <= 3000.0 <= high
+    assert result.bandwidth_hz < FS / 4
+    assert result.max_kurtosis > 0
+
+
+def test_kurtogram_batch_matches_single_signals():
+    signals = np.stack([_impulsive_signal(), np.random.default_rng(2).normal(size=2 ** 14)])
+    batch = fast_kurtogram(signals, FS)
+    for i, signal in enumerate(signals):
+        single = fast_kurtogram(signal, FS)
+        assert batch.center_hz[i] == single.center_hz
+        assert batch.max_kurtosis[i] == pytest.approx(single.max_kurtosis)
+
+
+def test_envelope_features_are_opt_in():
+    signal = _impulsive_signal()
+    geometry = BEARING_GEOMETRIES["6205"]
+
+    default = VibrationFeatureExtractor(FS, geometry).extract(signal, rpm=1797)
+    assert default.envelope_band_center_hz == 0.0
+    assert default.envelope_bpfo_amplitude == 0.0
+
+    kurtogram = VibrationFeatureExtractor(
+        FS, geometry, envelope_analysis=True, envelope_band_hz="kurtogram"
+    ).extract(signal, rpm=1797)
+    assert kurtogram.envelope_band_center_hz == fast_kurtogram(signal - signal.mean(), FS).center_hz
+    assert kurtogram.envelope_bpfo_amplitude > 0
+
+
+def _stream(extractor: VibrationFeatureExtractor, signal: np.ndarray, chunks: int = 37):
+    stream = StreamingFeatureExtractor(extractor, rpm=1797)
+    for chunk in np.array_split(signal, chunks):
+        stream.update(chunk)
+    return stream.result()
+
+
+@pytest.mark.parametrize("n", [121_000, 200_000])
+@pytest.mark.parametrize("kind", ["sine", "noise"])
+def test_streaming_matches_batch(kind, n):
+    if kind == "sine":
+        signal = np.sin(2 * np.pi * 157 * np.arange(n) / FS)
+    else:
+        signal = np.random.default_rng(3).normal(size=n)
+    extractor = VibrationFeatureExtractor(FS, BEARING_GEOMETRIES["6205"])
+    batch = extractor.extract(signal, rpm=1797)
+    streamed = _stream(extractor, signal)
+
+    for name in ("mean", "std", "rms", "skewness", "kurtosis", "peak", "peak_to_peak"):
+        assert getattr(streamed, name) == pytest.approx(getattr(batch, name), rel=1e-9, abs=1e-12)
+    for name in ("shape_factor", "impulse_factor", "clearance_factor"):
+        assert np.isnan(getattr(streamed, name))
+    assert streamed.spectral_energy == pytest.approx(batch.spectral_energy, rel=0.02)
+    assert streamed.spectral_centroid_hz == pytest.approx(batch.spectral_centroid_hz, rel=0.01)
+
+
+def test_streaming_short_signal_is_exact():
+    signal = _impulsive_signal(4000)
+    extractor = VibrationFeatureExtractor(
+        FS, BEARING_GEOMETRIES["6205"], envelope_analysis=True, envelope_band_hz="kurtogram"
+    )
+    batch = extractor.extract(signal, rpm=1797)
+    streamed = _stream(extractor, signal, chunks=5)
+    for name in ("spectral_energy", "dominant_frequency_hz", "envelope_band_center_hz",
+                 "envelope_band_kurtosis", "envelope_bpfo_amplitude"):
+        assert getattr(streamed, name) == pytest.approx(getattr(batch, name))
+
+
+def test_streaming_kurtogram_band_is_nan_for_welch():
+    extractor = VibrationFeatureExtractor(
+        FS, BEARING_GEOMETRIES["6205"], envelope_analysis=True, envelope_band_hz="kurtogram"
+    )
+    streamed = _stream(extractor, _impulsive_signal(2 ** 16))
+    assert np.isnan(streamed.envelope_band_center_hz)
+    assert np.isnan(streamed.envelope_band_kurtosis)
+    assert streamed.envelope_bpfo_amplitude > 0
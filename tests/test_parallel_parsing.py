@@ -0,0 +1,168 @@
+"""Tests for BaseDatasetAdapter.parallel_iter_episodes."""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List
+
+import numpy as np
+import pytest
+
+from core.adapters.base_adapter import (
+    BaseDatasetAdapter,
+    DatasetMetadata,
+    RawEpisode,
+    SensorChannel,
+)
+
+NUM_FILES = 8
+EPISODES_PER_FILE = 2
+
+
+class TextAdapter(BaseDatasetAdapter):
+    """Adapter over files holding one integer each."""
+
+    METADATA = DatasetMetadata(
+        name="text_test",
+        full_name="Text test dataset",
+        description="Synthetic files for parser tests",
+        source_url="",
+        citation="",
+        license="",
+        num_samples=NUM_FILES * EPISODES_PER_FILE,
+        file_format=".txt",
+    )
+
+    @property
+    def metadata(self) -> DatasetMetadata:
+        return self.METADATA
+
+    def discover_files(self) -> List[Path]:
+        return sorted(self.data_dir.glob("*.txt"))
+
+    def parse_file(self, file_path: Path) -> Iterable[RawEpisode]:
+        value = int(file_path.read_text())
+        for i in range(EPISODES_PER_FILE):
+            yield RawEpisode(
+                raw_id=f"{file_path.stem}_{i}",
+                source_dataset=self.METADATA.name,
+                source_file=file_path.name,
+                channels=[SensorChannel(
+                    channel_id="ch",
+                    channel_type="vibration",
+                    unit="g",
+                    data=np.full(16, value, dtype=np.float64),
+                    sampling_rate_hz=1000.0,
+                )],
+            )
+
+
+class CrashingAdapter(TextAdapter):
+    """Kills its worker process on one file."""
+
+    def parse_file(self, file_path: Path) -> Iterable[RawEpisode]:
+        if file_path.name == "f3.txt":
+            os._exit(1)
+        yield from super().parse_file(file_path)
+
+
+class SlowCrashingAdapter(TextAdapter):
+    """Kills its worker on one file, after the files around it finished."""
+
+    def parse_file(self, file_path: Path) -> Iterable[RawEpisode]:
+        if file_path.name == "f2.txt":
+            time.sleep(0.2)
+            os._exit(1)
+        yield from super().parse_file(file_path)
+
+
+class UnpicklableAdapter(TextAdapter):
+    """Produces episodes that cannot be sent back from a worker on one file."""
+
+    def parse_file(self, file_path: Path) -> Iterable[RawEpisode]:
+        for episode in super().parse_file(file_path):
+            if file_path.name == "f3.txt":
+                episode.raw_metadata["lock"] = threading.Lock()
+            yield episode
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    for i in range(NUM_FILES):
+        (tmp_path / f"f{i}.txt").write_text(str(i))
+    return tmp_path
+
+
+def _expected_ids(skip: Iterable[str] = ()) -> List[str]:
+    return [
+        f"f{i}_{j}"
+        for i in range(NUM_FILES) if f"f{i}" not in skip
+        for j in range(EPISODES_PER_FILE)
+    ]
+
+
+@pytest.mark.parametrize("use_threads", [False, True])
+def test_ordered_matches_sequential(data_dir, use_threads):
+    adapter = TextAdapter(data_dir)
+    sequential = [(e.raw_id, e.source_path) for e in adapter.iter_episodes()]
+    parallel = [
+        (e.raw_id, e.source_path)
+        for e in adapter.parallel_iter_episodes(num_workers=3, use_threads=use_threads)
+    ]
+    assert parallel == sequential
+
+
+def test_unordered_yields_every_episode(data_dir):
+    adapter = TextAdapter(data_dir)
+    episodes = adapter.parallel_iter_episodes(num_workers=3, ordered=False)
+    assert sorted(e.raw_id for e in episodes) == sorted(_expected_ids())
+
+
+def test_limit_and_file_callbacks(data_dir):
+    adapter = TextAdapter(data_dir)
+    completed = []
+    episodes = list(adapter.parallel_iter_episodes(
+        num_workers=2,
+        limit=5,
+        on_file_complete=lambda path, n: completed.append((path.name, n)),
+    ))
+    assert [e.raw_id for e in episodes] == _expected_ids()[:5]
+    assert completed == [("f0.txt", 2), ("f1.txt", 2)]
+
+
+@pytest.mark.parametrize("adapter_cls", [CrashingAdapter, UnpicklableAdapter])
+@pytest.mark.parametrize("ordered", [True, False])
+def test_worker_failure_skips_only_that_file(data_dir, caplog, adapter_cls, ordered):
+    adapter = adapter_cls(data_dir)
+    completed = []
+    episodes = list(adapter.parallel_iter_episodes(
+        num_workers=3,
+        ordered=ordered,
+        on_file_complete=lambda path, n: completed.append(path.name),
+    ))
+
+    raw_ids = [e.raw_id for e in episodes]
+    expected = _expected_ids(skip=["f3"])
+    assert (raw_ids if ordered else sorted(raw_ids)) == (expected if ordered else sorted(expected))
+    assert sorted(completed) == [f"f{i}.txt" for i in range(NUM_FILES) if i != 3]
+    failures = [r.getMessage() for r in caplog.records if "Error parsing" in r.getMessage()]
+    assert len(failures) == 1 and "f3.txt" in failures[0]
+
+
+def test_worker_death_while_results_are_queued(data_dir, caplog):
+    # f1 finishes before f2's worker dies, and is collected only after the
+    # pool broke; refilling must then replace the pool instead of failing
+    adapter = SlowCrashingAdapter(data_dir)
+    raw_ids = []
+    for episode in adapter.parallel_iter_episodes(
+        num_workers=3, ordered=False, prefetch_files=3
+    ):
+        raw_ids.append(episode.raw_id)
+        if len(raw_ids) == 1:
+            time.sleep(0.5)
+
+    assert sorted(raw_ids) == sorted(_expected_ids(skip=["f2"]))
+    failures = [r.getMessage() for r in caplog.records if "Error parsing" in r.getMessage()]
+    assert len(failures) == 1 and "f2.txt" in failures[0]
@@ -0,0 +1,231 @@
+"""End-to-end tests for DataPipeline: resume, parallel processing, reports."""
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+from pathlib import Path
+from typing import Iterable, List
+
+import numpy as np
+import pytest
+
+from core.adapters.base_adapter import (
+    BaseDatasetAdapter,
+    DatasetMetadata,
+    FaultType,
+    RawEpisode,
+    SensorChannel,
+)
+from core.manifest import ProcessingManifest
+from core.normalizer import EpisodeNormalizer
+from core.pipeline import DataPipeline, PipelineConfig
+
+NUM_FILES = 4
+EPISODES_PER_FILE = 2
+DATASET = "seed_test"
+
+
+class SeedAdapter(BaseDatasetAdapter):
+    """Adapter over files holding a random seed each."""
+
+    METADATA = DatasetMetadata(
+        name=DATASET,
+        full_name="Seed test dataset",
+        description="Synthetic vibration episodes for pipeline tests",
+        source_url="",
+        citation="",
+        license="",
+        num_samples=NUM_FILES * EPISODES_PER_FILE,
+        file_format=".txt",
+    )
+
+    @property
+    def metadata(self) -> DatasetMetadata:
+        return self.METADATA
+
+    def discover_files(self) -> List[Path]:
+        return sorted(self.data_dir.glob("*.txt"))
+
+    def parse_file(self, file_path: Path) -> Iterable[RawEpisode]:
+        seed = int(file_path.read_text())
+        for i in range(EPISODES_PER_FILE):
+            rng = np.random.default_rng([seed, i])
+            yield RawEpisode(
+                raw_id=f"{file_path.stem}_{i}",
+                source_dataset=DATASET,
+                source_file=file_path.name,
+                channels=[SensorChannel(
+                    "vibration_de", "vibration_de", "g", rng.normal(size=4096), 12000.0
+                )],
+                fault_type=FaultType.NORMAL,
+                rpm=1797,
+                load_hp=0,
+            )
+
+
+def _write_files(data_dir: Path, seeds=range(NUM_FILES)) -> None:
+    data_dir.mkdir(exist_ok=True)
+    for i, seed in enumerate(seeds):
+        (data_dir / f"f{i}.txt").write_text(str(seed))
+
+
+def _run(tmp_path: Path, output: str = "out", **config):
+    pipeline = DataPipeline(PipelineConfig(
+        output_dir=str(tmp_path / output),
+        verbose=False,
+        use_feature_cache=False,
+        **config,
+    ))
+    stats = pipeline.process_adapter(SeedAdapter(tmp_path / "data"))
+    return pipeline, stats
+
+
+def _stored(pipeline: DataPipeline):
+    stored = {}
+    for path in pipeline.storage.list_episodes(DATASET):
+        data = pipeline.storage.load_episode(path)
+        stored[path.name] = (data["metadata"]["source_file"], data["features"])
+    return stored
+
+
+def _saved(pipeline: DataPipeline, source_path: str, raw_id: str) -> bool:
+    manifest = ProcessingManifest(pipeline.storage.get_manifest_path(DATASET))
+    entry = manifest.lookup(source_path, raw_id)
+    return entry is not None and entry.saved and pipeline.storage.has_episode(
+        DATASET, entry.episode_id
+    )
+
+
+def _report(tmp_path: Path):
+    return json.loads((tmp_path / "out" / "validation_reports" / f"{DATASET}_report.json").read_text())
+
+
+@pytest.mark.parametrize("backend", ["directory", "sharded"])
+def test_resume_skips_unchanged_files_and_keeps_episode_ids(tmp_path, backend):
+    _write_files(tmp_path / "data")
+    pipeline, stats = _run(tmp_path, storage_backend=backend)
+    assert stats.episodes_saved == NUM_FILES * EPISODES_PER_FILE
+    first_ids = sorted(pipeline.storage.list_episodes(DATASET))
+
+    _, stats = _run(tmp_path, storage_backend=backend)
+    assert stats.files_skipped == NUM_FILES
+    assert stats.raw_episodes_processed == 0
+
+    # Modified file: its episodes are reprocessed under their old IDs
+    (tmp_path / "data" / "f1.txt").write_text("101")
+    pipeline, stats = _run(tmp_path, storage_backend=backend)
+    assert stats.files_skipped == NUM_FILES - 1
+    assert stats.episodes_saved == EPISODES_PER_FILE
+    assert sorted(pipeline.storage.list_episodes(DATASET)) == first_ids
+
+    # The dataset report still covers every stored episode
+    report = _report(tmp_path)
+    assert report["total_episodes"] == NUM_FILES * EPISODES_PER_FILE
+    assert len({r["episode_id"] for r in report["episode_results"]}) == report["total_episodes"]
+
+    # Every saved manifest entry points at an episode in storage
+    manifest = ProcessingManifest(pipeline.storage.get_manifest_path(DATASET))
+    assert len(manifest.episode_ids) == NUM_FILES * EPISODES_PER_FILE
+    for episode_id in manifest.episode_ids:
+        assert pipeline.storage.has_episode(DATASET, episode_id)
+
+
+@pytest.mark.parametrize("backend", ["directory", "sharded"])
+def test_parallel_matches_serial(tmp_path, backend):
+    _write_files(tmp_path / "data")
+    serial, _ = _run(tmp_path, "serial", storage_backend=backend)
+    parallel, stats = _run(
+        tmp_path, "parallel", storage_backend=backend, num_workers=2, max_pending_per_worker=2
+    )
+    assert stats.episodes_saved == NUM_FILES * EPISODES_PER_FILE
+    assert _stored(parallel) == _stored(serial)
+
+
+def _crash_on(raw_id: str, monkeypatch) -> None:
+    """Make worker processes die when they normalize one episode."""
+    if multiprocessing.get_start_method() != "fork":
+        pytest.skip("needs forked workers to inherit the patched normalizer")
+    normalize = EpisodeNormalizer.normalize
+
+    def crashing_normalize(self, raw_episode, episode_id=None):
+        if raw_episode.raw_id == raw_id and multiprocessing.parent_process() is not None:
+            os._exit(1)
+        return normalize(self, raw_episode, episode_id)
+
+    monkeypatch.setattr(EpisodeNormalizer, "normalize", crashing_normalize)
+
+
+def test_worker_crash_fails_only_its_episode(tmp_path, monkeypatch):
+    _write_files(tmp_path / "data")
+    _crash_on("f2_1", monkeypatch)
+
+    pipeline, stats = _run(tmp_path, num_workers=2, max_pending_per_worker=4)
+    assert stats.raw_episodes_processed == NUM_FILES * EPISODES_PER_FILE
+    assert stats.episodes_saved == NUM_FILES * EPISODES_PER_FILE - 1
+    assert len(stats.errors) == 1 and "f2_1" in stats.errors[0]
+
+    # The file of the failed episode stays incomplete and is retried
+    monkeypatch.undo()
+    _, stats = _run(tmp_path, num_workers=2)
+    assert stats.files_skipped == NUM_FILES - 1
+    assert stats.episodes_saved == 1
+    assert stats.episodes_skipped == 1
+
+
+@pytest.mark.parametrize("checksum_mode", ["full", "sample"])
+def test_duplicates_dropped_within_and_across_runs(tmp_path, checksum_mode):
+    _write_files(tmp_path / "data", seeds=[0, 1, 0, 2])
+    _, stats = _run(tmp_path, checksum_mode=checksum_mode)
+    assert stats.episodes_duplicate == EPISODES_PER_FILE
+    assert stats.episodes_saved == (NUM_FILES - 1) * EPISODES_PER_FILE
+
+    # A new copy of saved data is recognized from the manifest on resume
+    (tmp_path / "data" / "f4.txt").write_text("1")
+    _, stats = _run(tmp_path, checksum_mode=checksum_mode)
+    assert stats.files_skipped == NUM_FILES
+    assert stats.episodes_duplicate == EPISODES_PER_FILE
+    assert stats.episodes_saved == 0
+
+
+def _fail_on(raw_id: str, monkeypatch) -> None:
+    """Make normalization raise for one episode."""
+    normalize = EpisodeNormalizer.normalize
+
+    def failing_normalize(self, raw_episode, episode_id=None):
+        if raw_episode.raw_id == raw_id:
+            raise RuntimeError("corrupt episode")
+        return normalize(self, raw_episode, episode_id)
+
+    monkeypatch.setattr(EpisodeNormalizer, "normalize", failing_normalize)
+
+
+def test_duplicate_of_failed_episode_is_kept(tmp_path, monkeypatch):
+    _write_files(tmp_path / "data", seeds=[0, 1, 0, 2])
+    _fail_on("f0_1", monkeypatch)
+
+    # In-process, the failure is settled before the copy is planned
+    pipeline, stats = _run(tmp_path, checksum_mode="sample")
+    assert stats.episodes_saved == (NUM_FILES - 1) * EPISODES_PER_FILE
+    assert stats.episodes_duplicate == 1
+    assert _saved(pipeline, "f2.txt", "f2_1")
+
+
+def test_duplicate_held_for_failed_worker_episode_is_retried(tmp_path, monkeypatch):
+    if multiprocessing.get_start_method() != "fork":
+        pytest.skip("needs forked workers to inherit the patched normalizer")
+    _write_files(tmp_path / "data", seeds=[0, 1, 0, 2])
+    _fail_on("f0_1", monkeypatch)
+
+    # The copy is planned while the original is still in a worker
+    _, stats = _run(tmp_path, checksum_mode="sample", num_workers=2)
+    assert stats.episodes_saved == (NUM_FILES - 1) * EPISODES_PER_FILE - 1
+    assert stats.episodes_duplicate == EPISODES_PER_FILE
+
+    # Both files holding the lost data are parsed again
+    monkeypatch.undo()
+    pipeline, stats = _run(tmp_path, checksum_mode="sample", num_workers=2)
+    assert stats.files_skipped == NUM_FILES - 2
+    assert stats.episodes_saved == 1
+    assert stats.episodes_duplicate == EPISODES_PER_FILE
+    assert _saved(pipeline, "f0.txt", "f0_1")
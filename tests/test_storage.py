@@ -0,0 +1,85 @@
+"""Round-trip tests for the episode storage backends."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from core.sharded_storage import ShardedEpisodeStorage
+from core.storage import EpisodeStorage
+from tests.conftest import DATASET, make_episodes
+
+
+@pytest.fixture(params=["directory", "sharded"])
+def storage(request, tmp_path):
+    if request.param == "directory":
+        return EpisodeStorage(tmp_path)
+    return ShardedEpisodeStorage(tmp_path, row_group_bytes=50_000)
+
+
+def test_round_trip(storage):
+    episodes = make_episodes(3)
+    for episode in episodes:
+        storage.save_episode(episode, [{"question": "q", "answer": episode.episode_id}])
+    storage.flush()
+
+    paths = storage.list_episodes(DATASET)
+    assert [p.name for p in paths] == [e.episode_id for e in episodes]
+    for path, episode in zip(paths, episodes):
+        data = storage.load_episode(path)
+        assert data["metadata"]["episode_id"] == episode.episode_id
+        for row, channel in enumerate(episode.channel_names):
+            np.testing.assert_allclose(
+                data["timeseries"][channel], episode.signals[row].astype(np.float32)
+            )
+        assert data["qa_pairs"][0]["answer"] == episode.episode_id
+        assert set(data["features"]) == set(episode.channel_names)
+        assert set(data["feature_tracks"]) == set(episode.feature_tracks)
+
+    partial = storage.load_episode(paths[1], channels=["vibration_fe"], start=10, stop=20)
+    assert set(partial["timeseries"]) == {"step_index", "timestamp_offset", "vibration_fe"}
+    np.testing.assert_allclose(
+        partial["timeseries"]["vibration_fe"], episodes[1].signals[1, 10:20].astype(np.float32)
+    )
+
+
+def test_query_rows_match_catalog(tmp_path):
+    directory = EpisodeStorage(tmp_path / "directory")
+    sharded = ShardedEpisodeStorage(tmp_path / "sharded")
+    for episode in make_episodes(4):
+        directory.save_episode(episode)
+        sharded.save_episode(episode)
+    sharded.flush()
+
+    expected = directory.query_episodes(DATASET, state_synset="S.flt", rpm=1797.0)
+    rows = sharded.query_episodes(DATASET, state_synset="S.flt", rpm=1797.0)
+    assert [row["episode_id"] for row in rows] == ["EP-000001", "EP-000003"]
+    assert len(rows) == len(expected)
+    for row, catalog_row in zip(rows, expected):
+        assert list(row) == list(catalog_row)
+        for key in ("dataset", "episode_id", "state_synset", "state_label", "severity",
+                    "rpm", "load_hp", "num_samples", "num_channels"):
+            assert row[key] == catalog_row[key]
+            assert type(row[key]) is type(catalog_row[key])
+        assert row["byte_size"] > 0
+        assert sharded.load_episode(tmp_path / "sharded" / row["path"])
+
+
+def test_sharded_reader_sees_shards_of_other_writers(tmp_path):
+    reader = ShardedEpisodeStorage(tmp_path)
+    assert reader.list_episodes(DATASET) == []
+
+    writer = ShardedEpisodeStorage(tmp_path)
+    for episode in make_episodes(2):
+        writer.save_episode(episode)
+    writer.flush()
+    assert [p.name for p in reader.list_episodes(DATASET)] == ["EP-000000", "EP-000001"]
+
+    # A rewrite by a later writer replaces the earlier copy
+    later = ShardedEpisodeStorage(tmp_path)
+    for episode in make_episodes(2, start=1, rpm=1750):
+        later.save_episode(episode)
+    later.flush()
+    assert reader.has_episode(DATASET, "EP-000002")
+    data = reader.load_episode_by_id("EP-000001", DATASET)
+    assert data["metadata"]["rpm"] == 1750
+    assert len(reader.query_episodes(DATASET)) == 3
@@ -0,0 +1,84 @@
+"""Tests for validation reports."""
+from __future__ import annotations
+
+import json
+
+import numpy as np
+
+from core.adapters.base_adapter import FaultType, RawEpisode, SensorChannel
+from core.normalizer import EpisodeNormalizer
+from core.validation import (
+    EpisodeValidationSummary,
+    EpisodeValidator,
+    ValidationCategory,
+    ValidationIssue,
+    ValidationReportAccumulator,
+    ValidationResult,
+    ValidationSeverity,
+)
+
+
+def _result(episode_id: str, valid: bool = True) -> ValidationResult:
+    issues = [ValidationIssue(
+        ValidationCategory.QUALITY, ValidationSeverity.WARNING, "signals", "High NaN ratio"
+    )]
+    if not valid:
+        issues.append(ValidationIssue(
+            ValidationCategory.SCHEMA, ValidationSeverity.ERROR, "episode_id", "Missing ID"
+        ))
+    return ValidationResult(
+        episode_id=episode_id,
+        valid=valid,
+        issues=issues,
+        sensor_completeness=1.0,
+        label_confidence=0.5,
+        overall_quality_score=0.8,
+    )
+
+
+def test_report_rebuilt_from_saved_summaries_matches_original():
+    accumulator = ValidationReportAccumulator("demo")
+    accumulator.add(_result("demo-000001"))
+    accumulator.add(_result("demo-000002", valid=False))
+    saved = json.loads(json.dumps(accumulator.to_report().to_dict()))
+
+    rebuilt = ValidationReportAccumulator("demo")
+    for entry in saved["episode_results"]:
+        rebuilt.add_summary(EpisodeValidationSummary.from_dict(entry))
+    report = rebuilt.to_report().to_dict()
+
+    for key in ("total_episodes", "valid_episodes", "invalid_episodes",
+                "avg_quality_score", "error_counts", "warning_counts", "episode_results"):
+        assert report[key] == saved[key]
+    assert report["warning_counts"] == {"High NaN ratio": 2}
+    assert report["error_counts"] == {"Missing ID": 1}
+
+
+def test_summary_from_legacy_entry_has_no_messages():
+    entry = EpisodeValidationSummary.from_result(_result("demo-000001")).to_dict()
+    del entry["error_messages"], entry["warning_messages"]
+    summary = EpisodeValidationSummary.from_dict(entry)
+    assert summary.warning_count == 1
+    assert summary.warning_messages == []
+
+
+def test_channel_names_must_match_signal_rows():
+    raw = RawEpisode(
+        raw_id="raw",
+        source_dataset="demo",
+        source_file="demo.mat",
+        channels=[
+            SensorChannel(name, name, "g", np.ones(1000), 1000.0)
+            for name in ("vibration_de", "vibration_fe")
+        ],
+        fault_type=FaultType.NORMAL,
+    )
+    episode = EpisodeNormalizer(extract_features=False).normalize(raw)
+    validator = EpisodeValidator()
+    assert not [i for i in validator.validate(episode).issues if i.field == "channel_names"]
+
+    episode.signals = episode.signals[:1]
+    result = validator.validate(episode)
+    [issue] = [i for i in result.issues if i.field == "channel_names"]
+    assert issue.severity == ValidationSeverity.ERROR
+    assert not result.valid